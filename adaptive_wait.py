@@ -0,0 +1,128 @@
+"""
+adaptive_wait.py - Gözlenen gecikmelerden öğrenilen bekleme süreleri
+
+Her bekleme bir anahtarla (ör. 'home_team', 'stats_table') kaydedilir. Yeterli
+örnek toplandığında zaman aşımı sabit değer yerine o anahtarın son
+gecikmelerinin 95. yüzdeliği x WAIT_FACTOR olarak hesaplanır ve
+[MIN_WAIT, MAX_WAIT] aralığına sınırlanır. Kısa öğrenilmiş süreler yalnızca
+isteğe bağlı öğelerde (optional=True, ör. istatistik sekmeleri) kullanılır;
+bulunmayan sekme hızla atlanır. Zorunlu öğelerde (başlık, maç listesi, sekme
+sayısı) zaman aşımı tarayıcının yeniden başlatılmasına ya da istatistiklerin
+hiç toplanmamasına yol açtığından eski sabit süre alt sınırdır, öğrenilen süre yalnızca onu uzatabilir. Üst üste zaman aşımı olan
+anahtarların süresi her seferinde iki katına çıkar (sayfa yavaşladığında
+takılıp kalmamak için). Gecikmeler wait_latency.json dosyasında saklanır.
+"""
+
+import os
+import json
+import math
+import time
+import atexit
+import threading
+from collections import deque
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+import staging
+
+WAIT_FACTOR = 2.0
+MIN_WAIT = 0.3
+MAX_WAIT = 15.0
+MIN_SAMPLES = 10     # Bu kadar örnek toplanana kadar varsayılan süre kullanılır
+SAMPLE_SIZE = 200    # Anahtar başına saklanan son gecikme sayısı
+POLL_FREQUENCY = 0.1
+SAVE_EVERY = 25      # Bu kadar gözlemde bir dosyaya yazılır
+
+LATENCY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wait_latency.json')
+
+class LatencyModel:
+    """Anahtar başına gecikme örneklerini tutar ve zaman aşımı hesaplar"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._misses = {}
+        self._unsaved = 0
+        if path:
+            self.load()
+
+    def load(self):
+        try:
+            text = staging.read_text(self.path)
+        except (OSError, ValueError):
+            return
+        if text:
+            for key, samples in json.loads(text).items():
+                self._samples[key] = deque(samples, maxlen=SAMPLE_SIZE)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {key: [round(value, 4) for value in samples] for key, samples in self._samples.items()}
+            self._unsaved = 0
+        staging.write_text(self.path, json.dumps(data))
+
+    def observe(self, key, seconds):
+        """Başarılı beklemenin süresini kaydeder"""
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=SAMPLE_SIZE)).append(seconds)
+            self._misses.pop(key, None)
+            self._unsaved += 1
+            should_save = self._unsaved >= SAVE_EVERY
+        if should_save:
+            self.save()
+
+    def miss(self, key):
+        """Zaman aşımını kaydeder (süre örneklere eklenmez)"""
+        with self._lock:
+            self._misses[key] = self._misses.get(key, 0) + 1
+
+    def percentile(self, key, q=0.95):
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return None
+        return samples[max(math.ceil(q * len(samples)) - 1, 0)]
+
+    def timeout(self, key, default, floor=None):
+        """Anahtar için kullanılacak zaman aşımını (saniye) döndürür
+
+        floor verilirse öğrenilen süre bu değerin altına inmez.
+        """
+        with self._lock:
+            count = len(self._samples.get(key, ()))
+            misses = self._misses.get(key, 0)
+        if count < MIN_SAMPLES:
+            base = default
+        else:
+            base = min(max(self.percentile(key) * WAIT_FACTOR, MIN_WAIT, floor or 0), MAX_WAIT)
+        return min(base * (2 ** misses), MAX_WAIT) if misses else base
+
+_model = None
+
+def get_model():
+    """Süreç genelinde paylaşılan gecikme modelini döndürür"""
+    global _model
+    if _model is None:
+        _model = LatencyModel(LATENCY_FILE)
+        atexit.register(_model.save)
+    return _model
+
+def wait_until(driver, key, default, condition, optional=False):
+    """WebDriverWait(driver, default).until(condition) yerine öğrenilen süreyle bekler
+
+    optional=False (zorunlu öğe) ise süre varsayılan değerin altına inmez.
+    """
+    model = get_model()
+    timeout = model.timeout(key, default, floor=None if optional else default)
+    started = time.perf_counter()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+    except TimeoutException:
+        model.miss(key)
+        raise
+    model.observe(key, time.perf_counter() - started)
+    return result
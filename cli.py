@@ -0,0 +1,308 @@
+"""
+cli.py - Komut satırı arayüzü
+
+Ağır modüller (selenium, fake_useragent, pandas, numpy) yalnızca onlara ihtiyaç duyan
+komutlar içinde içe aktarılır; okuma ve dışa aktarma komutları tarayıcı
+bağımlılıklarını hiç yüklemeden başlar.
+
+Örnekler:
+    python cli.py scrape --season 2023-2024 --league premier-lig
+    python cli.py scrape --tabs 3
+    python cli.py backfill --from-season 2023-2024 --to-season 2014-2015 --sharded
+    python cli.py results --season 2023-2024
+    python cli.py standings --season 2023-2024 --as-of 31.12.2023
+    python cli.py export --season 2023-2024 --columns "Takım,Tarih,MS Gol" -o out.csv
+    python cli.py export --features
+    python cli.py query --team Arsenal --venue home --limit 5
+    python cli.py bench
+    python cli.py serve --port 8770
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+
+# stats_reader.BACKENDS ile aynı; okuyucuyu yalnızca ayrıştırıcı için içe aktarmamak adına tekrarlanır
+BACKEND_CHOICES = ['auto', 'matches', 'teams', 'shards']
+
+def _apply_common(args):
+    """Lig, sezon ve izleme seçeneklerini uygular"""
+    import config
+    if getattr(args, 'league', None):
+        config.set_league(args.league)
+    if getattr(args, 'season', None):
+        config.set_season(args.season)
+    if getattr(args, 'tabs', None):
+        config.TAB_COUNT = args.tabs
+    if getattr(args, 'trace', None):
+        from tracing import enable_tracing
+        enable_tracing(args.trace)
+
+def _reader_filters(args):
+    """Okuma komutlarının ortak filtre seçeneklerini iter_matches argümanlarına çevirir"""
+    return {
+        'teams': args.team or None,
+        'columns': args.columns.split(',') if args.columns else None,
+        'date_from': args.date_from,
+        'date_to': args.date_to,
+        'season': args.season,
+        'opponent': args.opponent or None,
+        'venue': args.venue,
+        'backend': args.backend,
+    }
+
+def _previous_season(season):
+    """'2023-2024' -> '2022-2023'"""
+    start, end = season.split('-')
+    return f"{int(start) - 1}-{int(end) - 1}"
+
+def cmd_scrape(args):
+    """Tek bir sezonu toplar"""
+    import scraper
+    from logger import get_logger
+
+    claimer = None
+    if args.sharded:
+        import config
+        from work_claim import WorkClaimer
+        claimer = WorkClaimer(config.get_scope(), node_id=args.node_id)
+    logger = get_logger(session=True, node_id=claimer.node_id if claimer else None)
+    if args.reset_progress:
+        scraper.reset_progress(logger)
+    # Sezon komut satırından verildiyse config.py değiştirilmez
+    scraper.main(claimer, args.start_index, auto_advance=args.season is None)
+    return 0
+
+def cmd_backfill(args):
+    """Sezonları yeniden eskiye doğru sırayla toplar"""
+    import config
+    import scraper
+    from logger import get_logger
+    from match_store import merge_shards
+    from work_claim import WorkClaimer, get_node_id
+
+    node_id = (args.node_id or get_node_id()) if args.sharded else None
+    logger = get_logger(session=True, node_id=node_id)
+    season = args.from_season
+    last_start = int(args.to_season.split('-')[0])
+    while int(season.split('-')[0]) >= last_start:
+        config.set_season(season)
+        logger.info(f"Geçmiş veri toplama: {config.LEAGUE} {season}")
+        claimer = WorkClaimer(config.get_scope(), node_id=node_id) if args.sharded else None
+        scraper.main(claimer, auto_advance=False)
+        season = _previous_season(season)
+    if args.sharded:
+        merge_shards(logger)
+    return 0
+
+def cmd_results(args):
+    """Maç sonuçlarını listeler (ev sahibi satırlarından)"""
+    from stats_reader import iter_matches
+
+    rows = iter_matches(teams=args.team or None, season=args.season, venue='home',
+                        columns=['Tarih', 'Takım', 'MS Gol', 'MS Yenilen Gol', 'Rakip'],
+                        backend=args.backend)
+    for row in rows:
+        print(f"{row['Tarih']}  {row['Takım']} {row['MS Gol']}-{row['MS Yenilen Gol']} {row['Rakip']}")
+    return 0
+
+def cmd_standings(args):
+    """Kayıtlı puan durumunu (isteğe bağlı olarak belirli bir tarihteki halini) yazdırır"""
+    import config
+    from logger import get_logger
+    from standings import load_table, rebuild_table, format_table
+
+    league, season = config.LEAGUE, config.get_season()
+    table = rebuild_table(league, season, get_logger()) if args.rebuild else load_table(league, season)
+    if table is None:
+        return 1
+    if not table.applied:
+        print(f"{league} {season} için puan durumu yok (--rebuild ile maç deposundan oluşturulabilir)")
+        return 1
+    print(format_table(table.standings(args.as_of)))
+    return 0
+
+def cmd_export(args):
+    """Filtrelenmiş satırları CSV veya JSON satırları olarak dışa aktarır"""
+    if args.team_views:
+        from logger import get_logger
+        from match_store import materialize_team_views
+        return 0 if materialize_team_views(get_logger()) else 1
+    if args.features:
+        from logger import get_logger
+        from features import update_features
+        return 0 if update_features(get_logger(), rebuild=args.rebuild) else 1
+
+    from stats_reader import iter_matches
+
+    out = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    try:
+        writer = None
+        for row in iter_matches(**_reader_filters(args)):
+            if args.format == 'jsonl':
+                out.write(json.dumps(row, ensure_ascii=False) + '\n')
+                continue
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+def cmd_query(args):
+    """Filtrelenmiş satırları ekrana yazdırır"""
+    from stats_reader import iter_matches
+
+    for count, row in enumerate(iter_matches(**_reader_filters(args))):
+        if args.limit is not None and count >= args.limit:
+            break
+        print(json.dumps(row, ensure_ascii=False))
+    return 0
+
+def cmd_serve(args):
+    """Maç deposu için yerel okuma servisini çalıştırır"""
+    import config
+    from logger import get_logger
+    from read_api import start_read_api
+
+    server = start_read_api(args.port or config.READ_API_PORT, get_logger(), host=args.host)
+    if server is None:
+        return 1
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+def cmd_check(args):
+    """Tüm veri kümesini denetler ve yeniden toplanacak maçları listeler"""
+    from logger import get_logger
+    from consistency import run_checks
+
+    issues = run_checks(get_logger(), source=args.source, output=args.output)
+    if issues is None:
+        return 1
+    for code, count in issues['Sorun'].value_counts().items():
+        print(f"{code:<18} {count}")
+    return 1 if len(issues) else 0
+
+def cmd_bench(args):
+    """Okuyucu verimini ölçer"""
+    import tracemalloc
+    from stats_reader import iter_matches
+
+    for run in range(args.repeat):
+        if args.memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        count = sum(1 for _ in iter_matches(**_reader_filters(args)))
+        elapsed = time.perf_counter() - started
+        peak = ''
+        if args.memory:
+            peak = f", en yüksek bellek: {tracemalloc.get_traced_memory()[1] / 1024:.0f} KB"
+            tracemalloc.stop()
+        rate = count / elapsed if elapsed else 0
+        print(f"Çalıştırma {run + 1}: {count} satır, {elapsed:.3f} sn, {rate:.0f} satır/sn{peak}")
+    return 0
+
+def _add_filter_options(parser):
+    """Okuma komutlarına filtre seçeneklerini ekler"""
+    parser.add_argument('--team', action='append', help="Takım adı (birden fazla verilebilir)")
+    parser.add_argument('--opponent', action='append', help="Rakip adı (birden fazla verilebilir)")
+    parser.add_argument('--columns', help="Virgülle ayrılmış sütun listesi")
+    parser.add_argument('--date-from', help="Başlangıç tarihi (gg.aa.yyyy)")
+    parser.add_argument('--date-to', help="Bitiş tarihi (gg.aa.yyyy)")
+    parser.add_argument('--season', help="Sezon (ör. 2023-2024)")
+    parser.add_argument('--venue', choices=['home', 'away'], help="Saha filtresi")
+    parser.add_argument('--backend', default='auto', choices=BACKEND_CHOICES, help="Depolama türü")
+
+def build_parser():
+    """Argüman ayrıştırıcısını oluşturur"""
+    parser = argparse.ArgumentParser(prog='cli.py', description="Sahadan.com veri toplama aracı")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scrape = subparsers.add_parser('scrape', help="Bir sezonu topla")
+    scrape.add_argument('--season', help="Sezon (ör. 2023-2024); verilmezse config.py kullanılır")
+    scrape.add_argument('--league', help="Lig (config.LEAGUES)")
+    scrape.add_argument('--start-index', type=int, help="Kaydedilen ilerleme yerine bu maçtan başla")
+    scrape.add_argument('--reset-progress', action='store_true', help="Kaydedilen ilerlemeyi sil")
+    scrape.add_argument('--sharded', action='store_true', help="Çoklu düğüm modunda çalış")
+    scrape.add_argument('--node-id', help="Çoklu düğüm modunda düğüm kimliği")
+    scrape.add_argument('--trace', help="Chrome trace-event JSON dosyası ('{pid}' kullanılabilir)")
+    scrape.add_argument('--tabs', type=int, help="Aynı anda açık maç sekmesi sayısı (varsayılan: 1)")
+    scrape.set_defaults(func=cmd_scrape)
+
+    backfill = subparsers.add_parser('backfill', help="Geçmiş sezonları sırayla topla")
+    backfill.add_argument('--from-season', required=True, help="İlk (en yeni) sezon, ör. 2023-2024")
+    backfill.add_argument('--to-season', required=True, help="Son (en eski) sezon, ör. 2014-2015")
+    backfill.add_argument('--league', help="Lig (config.LEAGUES)")
+    backfill.add_argument('--sharded', action='store_true', help="Çoklu düğüm modunda çalış")
+    backfill.add_argument('--node-id', help="Çoklu düğüm modunda düğüm kimliği")
+    backfill.add_argument('--trace', help="Chrome trace-event JSON dosyası ('{pid}' kullanılabilir)")
+    backfill.add_argument('--tabs', type=int, help="Aynı anda açık maç sekmesi sayısı (varsayılan: 1)")
+    backfill.set_defaults(func=cmd_backfill)
+
+    results = subparsers.add_parser('results', help="Maç sonuçlarını listele")
+    results.add_argument('--season', help="Sezon (ör. 2023-2024)")
+    results.add_argument('--team', action='append', help="Takım adı")
+    results.add_argument('--backend', default='auto', choices=BACKEND_CHOICES, help="Depolama türü")
+    results.set_defaults(func=cmd_results)
+
+    standings = subparsers.add_parser('standings', help="Puan durumunu göster")
+    standings.add_argument('--season', help="Sezon (ör. 2023-2024)")
+    standings.add_argument('--league', help="Lig (config.LEAGUES)")
+    standings.add_argument('--as-of', help="Bu tarihteki puan durumu (gg.aa.yyyy)")
+    standings.add_argument('--rebuild', action='store_true', help="Puan durumunu maç deposundan yeniden oluştur")
+    standings.set_defaults(func=cmd_standings)
+
+    export = subparsers.add_parser('export', help="Verileri dışa aktar")
+    _add_filter_options(export)
+    export.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help="Çıktı biçimi")
+    export.add_argument('-o', '--output', help="Çıktı dosyası (varsayılan: stdout)")
+    export.add_argument('--team-views', action='store_true',
+                        help="Maç deposundan stats/<Takım>.csv görünümlerini toplu olarak oluştur")
+    export.add_argument('--features', action='store_true',
+                        help="features/ altındaki NumPy özellik matrislerini güncelle")
+    export.add_argument('--rebuild', action='store_true', help="Özellik matrislerini baştan oluştur")
+    export.set_defaults(func=cmd_export)
+
+    query = subparsers.add_parser('query', help="Verileri sorgula")
+    _add_filter_options(query)
+    query.add_argument('--limit', type=int, help="En fazla satır sayısı")
+    query.set_defaults(func=cmd_query)
+
+    bench = subparsers.add_parser('bench', help="Okuma performansını ölç")
+    _add_filter_options(bench)
+    bench.add_argument('--repeat', type=int, default=3, help="Tekrar sayısı")
+    bench.add_argument('--memory', action='store_true', help="En yüksek bellek kullanımını ölç")
+    bench.set_defaults(func=cmd_bench)
+
+    check = subparsers.add_parser('check', help="Veri tutarlılığını denetle")
+    check.add_argument('--source', choices=['all', 'teams', 'matches'], default='all',
+                       help="Denetlenecek kaynak: takım dosyaları, maç deposu veya ikisi")
+    check.add_argument('-o', '--output', help="Yeniden toplanacak maç listesi (varsayılan: rescrape.csv)")
+    check.set_defaults(func=cmd_check)
+
+    serve = subparsers.add_parser('serve', help="Yerel HTTP/JSON okuma servisini çalıştır")
+    serve.add_argument('--port', type=int, help="Port (varsayılan: config.READ_API_PORT)")
+    serve.add_argument('--host', default='127.0.0.1', help="Dinlenecek adres")
+    serve.set_defaults(func=cmd_serve)
+
+    return parser
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    args = build_parser().parse_args(argv)
+    _apply_common(args)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,10 @@
 config.py - Konfigürasyon dosyası
 """
 
+import os
+import re
+import sys
+
 # Sezon bilgileri
 SEASON_START = "2023"
 SEASON_END = "2024"
@@ -11,6 +15,115 @@ SEASON_END = "2024"
 BASE_URL = "https://www.sahadan.com/puan-durumu/ingiltere-premier-lig/{}-{}/fikstur/2kwbbcootiqqgmrzs6o5inle5"
 #            'https://www.sahadan.com/puan-durumu/ingiltere-premier-lig/fikstur/2kwbbcootiqqgmrzs6o5inle5'
 
+# Desteklenen ligler (komut satırından --league ile seçilir)
+LEAGUE = "premier-lig"
+LEAGUES = {
+    "premier-lig": "https://www.sahadan.com/puan-durumu/ingiltere-premier-lig/{}-{}/fikstur/2kwbbcootiqqgmrzs6o5inle5",
+    "super-lig": "https://www.sahadan.com/puan-durumu/türkiye-süper-lig/{}-{}/fikstur/482ofyysbdbeoxauk19yg7tdt",
+}
+
+# Çoklu düğüm (sharded) çalışma ayarları
+# Ortak dizin: kira (lease) dosyaları ve düğüm çıktıları burada tutulur (NFS vb. olabilir)
+SHARED_DIR = os.environ.get('SCRAPER_SHARED_DIR', os.path.dirname(os.path.abspath(__file__)))
+SHARDED_MODE = os.environ.get('SCRAPER_SHARDED', '0') == '1'
+LEASE_TTL = 600  # Saniye; süresi dolan kira başka düğüm tarafından devralınabilir
+
+# İstatistik kaynağı: 'dom' (sekme sekme) veya 'network' (widget veri yanıtı, tek seferde;
+# OPTA_STAT_MAP gerçek yanıtlarla doğrulanana kadar deneyseldir)
+STATS_SOURCE = os.environ.get('SCRAPER_STATS_SOURCE', 'dom')
+# Ayarlanırsa widget yanıtları tekrar oynatmak için bu klasöre kaydedilir
+PAYLOAD_RECORD_DIR = os.environ.get('SCRAPER_PAYLOAD_DIR')
+
+# Tek tarayıcıda aynı anda açık tutulan maç sekmesi sayısı (1: sekmeler tek tek açılır)
+TAB_COUNT = int(os.environ.get('SCRAPER_TABS', '1'))
+
+# Canlı durum uç noktası (http://127.0.0.1:<port>/status), 0 ise kapalı
+STATUS_PORT = int(os.environ.get('SCRAPER_STATUS_PORT', '8765'))
+
+# Yerel okuma servisi (python cli.py serve) portu
+READ_API_PORT = int(os.environ.get('SCRAPER_READ_API_PORT', '8770'))
+
+# Ayarlanırsa oturum zaman çizelgesi Chrome trace-event JSON olarak yazılır ('{pid}' kullanılabilir)
+TRACE_PATH = os.environ.get('SCRAPER_TRACE')
+
+# SD kart modu: tarayıcı profili, sürücü/uygulama logları, ilerleme ve yazma tamponları
+# tmpfs üzerinde tutulur; kalıcı veriler FLUSH_INTERVAL saniyede bir toplu olarak karta yazılır
+SD_MODE = os.environ.get('SCRAPER_SD_MODE', '0') == '1'
+VOLATILE_DIR = os.environ.get('SCRAPER_VOLATILE_DIR', '/dev/shm/football-scraper')
+FLUSH_INTERVAL = int(os.environ.get('SCRAPER_FLUSH_INTERVAL', '300'))
+
 # URL'yi oluşturan fonksiyon
 def get_url():
-    return BASE_URL.format(SEASON_START, SEASON_END)  
\ No newline at end of file
+    return BASE_URL.format(SEASON_START, SEASON_END) 
+
+def get_season():
+    """Aktif sezonu 'YYYY-YYYY' biçiminde döndürür"""
+    return f"{SEASON_START}-{SEASON_END}"
+
+def get_scope():
+    """Kira dosyaları için lig/sezon kapsamını döndürür"""
+    return f"{LEAGUE}/{get_season()}"
+
+def set_season(season):
+    """Aktif sezonu çalışma anında değiştirir ('2023-2024'); config.py dosyasına yazmaz"""
+    global SEASON_START, SEASON_END
+    start, end = season.split('-')
+    if int(end) != int(start) + 1:
+        raise ValueError(f"Geçersiz sezon: {season}")
+    SEASON_START, SEASON_END = start, end
+
+def set_league(league):
+    """Aktif ligi çalışma anında değiştirir"""
+    global LEAGUE, BASE_URL
+    if league not in LEAGUES:
+        raise ValueError(f"Bilinmeyen lig: {league} (seçenekler: {', '.join(LEAGUES)})")
+    LEAGUE = league
+    BASE_URL = LEAGUES[league]
+
+# config.py içindeki üst düzey sezon atamaları (set_season içindeki satırlar eşleşmez)
+_SEASON_LINE_RE = re.compile(r'^(SEASON_START|SEASON_END)\s*=\s*"(\d{4})"')
+
+def update_season_config(logger, config_path=None, season=None):
+    """config.py dosyasındaki sezonu bir önceki sezona çeker (servisin otomatik ilerlemesi)
+
+    season ('2023-2024') verilirse yalnızca dosyadaki sezon buysa değiştirilir;
+    aynı config.py dosyasını paylaşan işlemler sezonu iki kez geriletmez.
+    """
+    try:
+        config_path = config_path or os.path.abspath(__file__)
+        with open(config_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        
+        # Mevcut sezon değerlerini al
+        seasons = {}
+        for i, line in enumerate(lines):
+            match = _SEASON_LINE_RE.match(line)
+            if match:
+                seasons[match.group(1)] = (i, int(match.group(2)))
+        if len(seasons) != 2:
+            raise ValueError("SEASON_START/SEASON_END satırları bulunamadı")
+        (start_line, current_start), (end_line, current_end) = seasons['SEASON_START'], seasons['SEASON_END']
+        
+        if season and f"{current_start}-{current_end}" != season:
+            logger.info(f"Sezon zaten ilerletilmiş: {current_start}-{current_end}")
+            return True
+        
+        # 2014-2015 sezonuna ulaşıldıysa programı sonlandır
+        if current_start == 2014 and current_end == 2015:
+            logger.info("2014-2015 sezonuna ulaşıldı. Program sonlandırılıyor...")
+            sys.exit(0)
+        
+        # Sezon değerlerini güncelle
+        new_start, new_end = current_start - 1, current_end - 1
+        lines[start_line] = f'SEASON_START = "{new_start}"\n'
+        lines[end_line] = f'SEASON_END = "{new_end}"\n'
+        
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        
+        logger.info(f"Sezon bilgileri güncellendi: {new_start}-{new_end}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Sezon bilgileri güncellenirken hata: {str(e)}")
+        return False
@@ -0,0 +1,243 @@
+"""
+consistency.py - Tüm veri kümesi için vektörel tutarlılık denetimi
+
+Takım dosyalarının (stats/<Takım>.csv) ve maç deposunun tamamı tek seferde
+pandas DataFrame'e yüklenir; denetimler satır satır döngü yerine sütun
+işlemleri ve birleştirmelerle (merge) yapılır:
+
+    ayna_eksik        Maçın yalnızca bir takımın dosyasında olması
+    ayna_skor         Ev sahibi MS/İY golünün rakibin yenilen golüyle uyuşmaması
+    ayna_sonuc        İki taraftaki 'Sonuç' değerlerinin çelişmesi
+    tekrar            Aynı maçın birden fazla kez yazılması
+    ayni_gun_iki_mac  Bir takımın aynı tarihte iki maçı
+    gol_okunamadi     MS golünün boş veya sayı olmaması
+    sonuc_tutarsiz    'Sonuç' değerinin skorla uyuşmaması
+    iy_gol_fazla      İlk yarı golünün maç sonu golünden fazla olması
+    negatif_deger     Negatif istatistik
+    isabet_fazla      İsabetli şut/pas sayısının toplamdan fazla olması
+    topla_oynama      Topla oynama yüzdeleri toplamının 100'den sapması
+    istatistik_yok    Skor dışındaki tüm istatistiklerin sıfır olması
+    supheli_0_0       0-0 skorla birlikte hiç istatistik olmaması (okuma hatası)
+
+Sorunlu maçlar yeniden toplanmak üzere bir CSV listesine yazılır.
+"""
+
+import os
+import glob
+
+import numpy as np
+import pandas as pd
+
+from config import SHARED_DIR
+from csv_handler import ALL_STATS_HEADERS, create_stats_folder
+from match_store import MATCH_HEADERS, MATCH_STATS, HOME_PREFIX, AWAY_PREFIX, get_store_file
+from stats_reader import TEAM_COLUMN
+
+SCORE_STATS = ['MS Gol', 'İY Gol']
+# Skor dışındaki istatistikler ("istatistik yok" denetimi için)
+DETAIL_STATS = [stat for stat in MATCH_STATS if stat not in SCORE_STATS]
+POSSESSION_TOLERANCE = 2
+
+ISSUE_COLUMNS = ['Tarih', 'Ev Sahibi', 'Deplasman', 'Kaynak', 'Sorun']
+
+def get_rescrape_file():
+    return os.path.join(SHARED_DIR, 'rescrape.csv')
+
+def _numeric(frame, columns):
+    """Metin sütunlarını sayıya çevirir ('55%' -> 55.0, geçersiz -> NaN)"""
+    return frame[columns].apply(
+        lambda column: pd.to_numeric(column.str.replace('%', '', regex=False).str.replace(',', '.', regex=False),
+                                     errors='coerce'))
+
+def load_team_files(stats_dir=None):
+    """Tüm takım dosyalarını 'Takım' sütunuyla tek DataFrame olarak yükler"""
+    stats_dir = stats_dir or create_stats_folder()
+    frames = []
+    for csv_file in sorted(glob.glob(os.path.join(stats_dir, '*.csv'))):
+        frame = pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+        # Tekrarlanan başlıklar ('Pas Arası.1') yok sayılır
+        frame = frame.loc[:, ~frame.columns.str.contains(r'\.\d+$')]
+        frame[TEAM_COLUMN] = os.path.splitext(os.path.basename(csv_file))[0]
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+    # Eski dosyalarda bulunmayan sütunlar boş değerle tamamlanır
+    teams = pd.concat(frames, ignore_index=True)
+    columns = list(dict.fromkeys(ALL_STATS_HEADERS)) + [TEAM_COLUMN]
+    return teams.reindex(columns=columns).fillna('')
+
+def load_store(store_file=None):
+    """Maç deposunu DataFrame olarak yükler"""
+    store_file = store_file or get_store_file()
+    if not os.path.exists(store_file):
+        return pd.DataFrame()
+    store = pd.read_csv(store_file, dtype=str, keep_default_na=False)
+    return store.reindex(columns=MATCH_HEADERS).fillna('')
+
+def _issues(frame, mask, home, away, source, code):
+    """Maskedeki satırlar için sorun kayıtları üretir"""
+    selected = frame.loc[mask]
+    return pd.DataFrame({
+        'Tarih': selected['Tarih'].to_numpy(),
+        'Ev Sahibi': selected[home].to_numpy(),
+        'Deplasman': selected[away].to_numpy(),
+        'Kaynak': source,
+        'Sorun': code,
+    })
+
+def _perspective_checks(sides, source):
+    """Takım bakış açısındaki satırlar için satır bazlı denetimler
+
+    sides: 'Tarih', 'Ev Sahibi', 'Deplasman', MATCH_STATS ve yenilen gol
+    sütunlarını içeren DataFrame (isteğe bağlı 'Sonuç').
+    """
+    issues = []
+    numbers = _numeric(sides, MATCH_STATS + ['MS Yenilen Gol', 'İY Yenilen Gol'])
+
+    def add(mask, code):
+        issues.append(_issues(sides, mask, 'Ev Sahibi', 'Deplasman', source, code))
+
+    add(numbers['MS Gol'].isna() | numbers['MS Yenilen Gol'].isna(), 'gol_okunamadi')
+    add((numbers['İY Gol'] > numbers['MS Gol']) | (numbers['İY Yenilen Gol'] > numbers['MS Yenilen Gol']),
+        'iy_gol_fazla')
+    add((numbers < 0).any(axis=1), 'negatif_deger')
+    add((numbers['İsabetli Şut'] > numbers['Toplam Şut']) | (numbers['İsabetli Pas'] > numbers['Toplam Pas']),
+        'isabet_fazla')
+
+    if 'Sonuç' in sides:
+        expected = np.select(
+            [numbers['MS Gol'] > numbers['MS Yenilen Gol'], numbers['MS Gol'] < numbers['MS Yenilen Gol']],
+            ['Galip', 'Mağlup'], 'Berabere')
+        scored = numbers['MS Gol'].notna() & numbers['MS Yenilen Gol'].notna()
+        add(scored & (sides['Sonuç'] != expected), 'sonuc_tutarsiz')
+    return issues
+
+def _pair_checks(home, away, frame, source):
+    """Aynı maçın ev sahibi ve deplasman değerlerini karşılaştıran denetimler
+
+    home/away: aynı satır sırasına sahip sayısal DataFrame'ler (MATCH_STATS).
+    """
+    issues = []
+
+    def add(mask, code):
+        issues.append(_issues(frame, mask, 'Ev Sahibi', 'Deplasman', source, code))
+
+    possession = home['Topla Oynama'] + away['Topla Oynama']
+    measured = (home['Topla Oynama'] > 0) & (away['Topla Oynama'] > 0)
+    add(measured & ((possession - 100).abs() > POSSESSION_TOLERANCE), 'topla_oynama')
+
+    no_details = (home[DETAIL_STATS].fillna(0) == 0).all(axis=1) & (away[DETAIL_STATS].fillna(0) == 0).all(axis=1)
+    goalless = (home[SCORE_STATS].fillna(0) == 0).all(axis=1) & (away[SCORE_STATS].fillna(0) == 0).all(axis=1)
+    add(no_details & goalless, 'supheli_0_0')
+    add(no_details & ~goalless, 'istatistik_yok')
+    return issues
+
+def check_team_files(teams):
+    """Takım dosyalarını (aynalanmış ev sahibi/deplasman satırları) denetler"""
+    if teams.empty:
+        return []
+    teams = teams.copy()
+    is_home = teams['Ev Sahibi/Deplasman'] == 'Ev Sahibi'
+    teams['Ev Sahibi'] = np.where(is_home, teams[TEAM_COLUMN], teams['Rakip'])
+    teams['Deplasman'] = np.where(is_home, teams['Rakip'], teams[TEAM_COLUMN])
+
+    issues = []
+    duplicated = teams.duplicated([TEAM_COLUMN, 'Tarih', 'Rakip'], keep=False)
+    issues.append(_issues(teams, duplicated, 'Ev Sahibi', 'Deplasman', 'teams', 'tekrar'))
+    unique = teams.loc[~teams.duplicated([TEAM_COLUMN, 'Tarih', 'Rakip'])]
+    same_day = unique.duplicated([TEAM_COLUMN, 'Tarih'], keep=False)
+    issues.append(_issues(unique, same_day, 'Ev Sahibi', 'Deplasman', 'teams', 'ayni_gun_iki_mac'))
+    issues += _perspective_checks(unique, 'teams')
+
+    # Ev sahibi satırını rakibin deplasman satırıyla eşleştir
+    keys = ['Tarih', 'Ev Sahibi', 'Deplasman']
+    pairs = unique.loc[is_home.loc[unique.index]].merge(
+        unique.loc[~is_home.loc[unique.index]], on=keys, how='outer', suffixes=('_ev', '_dep'), indicator=True)
+    issues.append(_issues(pairs, pairs['_merge'] != 'both', 'Ev Sahibi', 'Deplasman', 'teams', 'ayna_eksik'))
+
+    both = pairs.loc[pairs['_merge'] == 'both'].reset_index(drop=True)
+    home = _numeric(both, [f"{stat}_ev" for stat in MATCH_STATS + ['MS Yenilen Gol', 'İY Yenilen Gol']])
+    away = _numeric(both, [f"{stat}_dep" for stat in MATCH_STATS + ['MS Yenilen Gol', 'İY Yenilen Gol']])
+    home.columns = away.columns = MATCH_STATS + ['MS Yenilen Gol', 'İY Yenilen Gol']
+
+    score_mismatch = pd.Series(False, index=both.index)
+    for own, other in (('MS Gol', 'MS Yenilen Gol'), ('İY Gol', 'İY Yenilen Gol')):
+        score_mismatch |= home[own].ne(away[other]) | away[own].ne(home[other])
+    issues.append(_issues(both, score_mismatch, 'Ev Sahibi', 'Deplasman', 'teams', 'ayna_skor'))
+
+    mirrored = both['Sonuç_dep'].map({'Galip': 'Mağlup', 'Mağlup': 'Galip', 'Berabere': 'Berabere'})
+    issues.append(_issues(both, both['Sonuç_ev'] != mirrored, 'Ev Sahibi', 'Deplasman', 'teams', 'ayna_sonuc'))
+
+    issues += _pair_checks(home, away, both, 'teams')
+    return issues
+
+def check_store(store):
+    """Maç deposunu (maç başına tek satır) denetler"""
+    if store.empty:
+        return []
+    issues = []
+    keys = ['Tarih', 'Ev Sahibi', 'Deplasman']
+    issues.append(_issues(store, store.duplicated(keys, keep=False), 'Ev Sahibi', 'Deplasman', 'matches', 'tekrar'))
+    store = store.loc[~store.duplicated(keys)].reset_index(drop=True)
+
+    # Aynı gün iki maç: takımın ev sahibi veya deplasman olduğu satırlar birlikte sayılır
+    appearances = pd.concat([
+        store[['Tarih', 'Ev Sahibi', 'Deplasman']].assign(team=store['Ev Sahibi']),
+        store[['Tarih', 'Ev Sahibi', 'Deplasman']].assign(team=store['Deplasman']),
+    ], ignore_index=True)
+    issues.append(_issues(appearances, appearances.duplicated(['team', 'Tarih'], keep=False),
+                          'Ev Sahibi', 'Deplasman', 'matches', 'ayni_gun_iki_mac'))
+
+    home = _numeric(store, [HOME_PREFIX + stat for stat in MATCH_STATS])
+    away = _numeric(store, [AWAY_PREFIX + stat for stat in MATCH_STATS])
+    home.columns = away.columns = MATCH_STATS
+
+    # Her iki takımın bakış açısı için satır denetimleri
+    for own, other in ((home, away), (away, home)):
+        sides = own.astype(str).assign(**{
+            'Tarih': store['Tarih'],
+            'Ev Sahibi': store['Ev Sahibi'],
+            'Deplasman': store['Deplasman'],
+            'MS Yenilen Gol': other['MS Gol'].astype(str),
+            'İY Yenilen Gol': other['İY Gol'].astype(str),
+        })
+        issues += _perspective_checks(sides, 'matches')
+
+    issues += _pair_checks(home, away, store, 'matches')
+    return issues
+
+def run_checks(logger, source='all', output=None, stats_dir=None, store_file=None):
+    """Denetimleri çalıştırır, yeniden toplanacak maç listesini yazar
+
+    Dönüş: sorunlar DataFrame'i (ISSUE_COLUMNS) veya hata durumunda None
+    """
+    try:
+        issues = []
+        if source in ('all', 'teams'):
+            issues += check_team_files(load_team_files(stats_dir))
+        if source in ('all', 'matches'):
+            issues += check_store(load_store(store_file))
+
+        issues = [frame for frame in issues if not frame.empty]
+        if issues:
+            result = pd.concat(issues, ignore_index=True).drop_duplicates().reset_index(drop=True)
+        else:
+            result = pd.DataFrame(columns=ISSUE_COLUMNS)
+
+        # Aynı maçın sorunları tek satırda birleştirilir
+        rescrape = result.groupby(['Tarih', 'Ev Sahibi', 'Deplasman'], as_index=False).agg(
+            Sorunlar=('Sorun', lambda codes: ';'.join(sorted(set(codes)))))
+        day = pd.to_datetime(rescrape['Tarih'], format='%d.%m.%Y', errors='coerce')
+        rescrape = rescrape.assign(_day=day).sort_values('_day').drop(columns='_day')
+
+        output = output or get_rescrape_file()
+        tmp_file = f"{output}.tmp"
+        rescrape.to_csv(tmp_file, index=False, encoding='utf-8')
+        os.replace(tmp_file, output)
+
+        logger.info(f"Tutarlılık denetimi: {len(result)} sorun, {len(rescrape)} maç yeniden toplanmalı ({output})")
+        return result
+
+    except Exception as e:
+        logger.error(f"Tutarlılık denetimi sırasında hata: {str(e)}")
+        return None
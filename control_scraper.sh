@@ -6,6 +6,9 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+# Scraper durum uç noktası portu (config.py: STATUS_PORT)
+STATUS_PORT="${SCRAPER_STATUS_PORT:-8765}"
+
 # Log fonksiyonları
 log() {
     echo -e "${GREEN}[$(date +'%Y-%m-%d %H:%M:%S')] $1${NC}"
@@ -78,6 +81,13 @@ show_logs() {
     journalctl -u football-scraper -n 50 --no-pager
 }
 
+show_live_status() {
+    echo -e "\n${YELLOW}Canlı scraper durumu (http://127.0.0.1:${STATUS_PORT}/status):${NC}"
+    if ! curl -fsS "http://127.0.0.1:${STATUS_PORT}/status" | python3 -m json.tool; then
+        error "Durum uç noktasına ulaşılamadı. Scraper çalışıyor mu?"
+    fi
+}
+
 disable_autostart() {
     log "Otomatik başlatma devre dışı bırakılıyor..."
     systemctl disable xvfb
@@ -93,9 +103,10 @@ show_menu() {
     echo "3) Servisleri Yeniden Başlat"
     echo "4) Durum Kontrolü"
     echo "5) Logları Göster"
-    echo "6) Otomatik Başlatmayı Devre Dışı Bırak"
-    echo "7) Çıkış"
-    echo -n "Seçiminiz (1-7): "
+    echo "6) Canlı Durum"
+    echo "7) Otomatik Başlatmayı Devre Dışı Bırak"
+    echo "8) Çıkış"
+    echo -n "Seçiminiz (1-8): "
 }
 
 # Ana döngü
@@ -120,9 +131,12 @@ while true; do
             show_logs
             ;;
         6)
-            disable_autostart
+            show_live_status
             ;;
         7)
+            disable_autostart
+            ;;
+        8)
             log "Program sonlandırılıyor..."
             exit 0
             ;;
@@ -3,9 +3,10 @@ csv_handler.py - CSV işlemleri için yardımcı modül
 """
 
 import os
-import csv
 from datetime import datetime
 
+from config import SHARED_DIR
+
 # Tüm olası istatistik başlıkları
 ALL_STATS_HEADERS = [
     'Tarih',
@@ -44,68 +45,33 @@ ALL_STATS_HEADERS = [
 
 def create_stats_folder():
     """İstatistikler için klasör oluşturur"""
-    stats_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stats')
+    stats_dir = os.path.join(SHARED_DIR, 'stats')
     if not os.path.exists(stats_dir):
         os.makedirs(stats_dir)
     return stats_dir
 
-def save_match_stats(team_name, opponent, is_home, stats_data, match_date, logger):
-    """Maç istatistiklerini CSV dosyasına kaydeder"""
-    try:
-        stats_dir = create_stats_folder()
-        csv_file = os.path.join(stats_dir, f"{team_name}.csv")
-        
-        # Verileri başlıklarla eşleştir
-        row_data = {}
-        
-        # Tüm başlıklar için varsayılan değer olarak '0' ata
-        for header in ALL_STATS_HEADERS:
-            row_data[header] = '0'
-        
-        # Temel verileri ekle
-        row_data['Tarih'] = match_date
-        row_data['Rakip'] = opponent
-        row_data['Ev Sahibi/Deplasman'] = 'Ev Sahibi' if is_home else 'Deplasman'
-        
-        # İstatistik verilerini eşleştir
-        for key, value in stats_data.items():
-            if key in ALL_STATS_HEADERS:
-                row_data[key] = value
-            else:
-                logger.warning(f"Bilinmeyen istatistik başlığı: {key}")
-        
-        # Dosya yoksa başlıkları yaz
-        file_exists = os.path.exists(csv_file)
-        
-        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=ALL_STATS_HEADERS)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(row_data)
-        
-        logger.info(f"{team_name} için istatistikler CSV'ye kaydedildi")
-        return True
-        
-    except Exception as e:
-        logger.error(f"{team_name} için CSV kaydetme hatası: {str(e)}")
-        return False
+def get_shard_dir(node_id):
+    """Çoklu düğüm modunda bu düğümün çıktı klasörünü oluşturur"""
+    shard_dir = os.path.join(create_stats_folder(), 'shards', node_id)
+    os.makedirs(shard_dir, exist_ok=True)
+    return shard_dir
 
 def get_existing_matches(team_name):
-    """Belirtilen takımın mevcut maçlarını CSV'den okur"""
+    """Belirtilen takımın mevcut maçlarını CSV'den okur
+
+    Tüm dosyayı belleğe alır; büyük veriler için stats_reader.iter_matches kullanılmalıdır.
+    """
+    from stats_reader import iter_matches, TEAM_COLUMN
+    
+    matches = []
+    for row in iter_matches(team_name):
+        row.pop(TEAM_COLUMN, None)
+        matches.append(row)
+    return matches
+
+def _parse_date(match_date):
+    """Sıralama için 'gg.aa.yyyy' tarihini çözümler"""
     try:
-        stats_dir = create_stats_folder()
-        csv_file = os.path.join(stats_dir, f"{team_name}.csv")
-        
-        if not os.path.exists(csv_file):
-            return []
-            
-        matches = []
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                matches.append(row)
-                
-        return matches
-        
-    except Exception:
-        return [] 
\ No newline at end of file
+        return datetime.strptime(match_date, "%d.%m.%Y")
+    except ValueError:
+        return datetime.min
@@ -0,0 +1,227 @@
+"""
+features.py - Model eğitimi için bellek eşlemeli (memmap) özellik matrisleri
+
+Her maç için, maç öncesindeki son FEATURE_WINDOW maçın istatistik ortalamaları
+(ev sahibi ve deplasman için ayrı ayrı) tek bir satırda toplanır ve
+features/ klasörüne yazılır:
+
+    X.npy       float32 (maç sayısı, özellik sayısı)  - özellikler
+    y.npy       int16   (maç sayısı, 3)               - [sonuç, ev golü, dep golü]
+                sonuç: 0 = ev sahibi galip, 1 = berabere, 2 = deplasman galip
+    index.csv   satır -> (Tarih, Ev Sahibi, Deplasman)
+    state.json  artımlı güncelleme için takım geçmişleri ve özellik adları
+
+Dosyalar np.load(..., mmap_mode='r') ile ayrıştırma yapmadan açılır. Yeni
+maçlar son işlenen tarihten sonraysa yalnızca yeni satırlar eklenir; daha
+eski bir maç gelirse (ör. geçmiş sezon toplama) matrisler yeniden oluşturulur.
+"""
+
+import os
+import csv
+import json
+import struct
+from collections import deque
+
+import numpy as np
+
+from config import SHARED_DIR
+from match_store import MATCH_STATS, HOME_PREFIX, AWAY_PREFIX, iter_store, match_key
+from stats_reader import date_key, to_float
+
+FEATURE_WINDOW = 5
+
+# Takım bakış açısıyla ortalaması alınan istatistikler (yenilen goller dahil)
+TEAM_STATS = MATCH_STATS + ['MS Yenilen Gol', 'İY Yenilen Gol']
+
+# .npy başlığı için ayrılan sabit alan; satır eklendikçe başlık yerinde güncellenir
+_NPY_HEADER_SIZE = 128
+
+def get_features_dir():
+    """Özellik dosyaları klasörünü oluşturur"""
+    features_dir = os.path.join(SHARED_DIR, 'features')
+    os.makedirs(features_dir, exist_ok=True)
+    return features_dir
+
+def feature_names():
+    """X matrisinin sütun adlarını döndürür"""
+    names = []
+    for side in ('ev', 'dep'):
+        names += [f"{side}_ort_{stat}" for stat in TEAM_STATS]
+        names.append(f"{side}_mac_sayisi")
+    return names
+
+def _team_vectors(match_row):
+    """Maç satırından ev sahibi ve deplasman için TEAM_STATS vektörleri üretir"""
+    vectors = []
+    for own, other in ((HOME_PREFIX, AWAY_PREFIX), (AWAY_PREFIX, HOME_PREFIX)):
+        values = [to_float(match_row[own + stat]) for stat in MATCH_STATS]
+        values.append(to_float(match_row[other + 'MS Gol']))
+        values.append(to_float(match_row[other + 'İY Gol']))
+        vectors.append(values)
+    return vectors
+
+def _goals(value):
+    """Gol değerini tam sayıya çevirir, geçersizse 0"""
+    number = to_float(value)
+    return int(number) if number == number else 0
+
+def _label(match_row):
+    """Maç sonucunu [sınıf, ev golü, dep golü] olarak döndürür"""
+    home_goals = _goals(match_row[HOME_PREFIX + 'MS Gol'])
+    away_goals = _goals(match_row[AWAY_PREFIX + 'MS Gol'])
+    result = 0 if home_goals > away_goals else (2 if home_goals < away_goals else 1)
+    return [result, home_goals, away_goals]
+
+def _write_npy_header(f, dtype, shape):
+    """Sabit uzunlukta .npy (v1.0) başlığı yazar"""
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': %s, }" % (np.dtype(dtype).str, repr(tuple(shape)))
+    padding = _NPY_HEADER_SIZE - 10 - len(header) - 1
+    if padding < 0:
+        raise ValueError("npy başlığı ayrılan alana sığmıyor")
+    f.seek(0)
+    f.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', _NPY_HEADER_SIZE - 10))
+    f.write((header + ' ' * padding + '\n').encode('latin1'))
+
+def _append_npy(path, rows, dtype):
+    """Satırları .npy dosyasının sonuna ekler ve başlıktaki boyutu günceller"""
+    rows = np.ascontiguousarray(rows, dtype=dtype)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            _write_npy_header(f, dtype, (0, rows.shape[1]))
+    with open(path, 'r+b') as f:
+        f.seek(0, os.SEEK_END)
+        f.write(rows.tobytes())
+        f.flush()
+        row_bytes = rows.shape[1] * np.dtype(dtype).itemsize
+        count = (f.tell() - _NPY_HEADER_SIZE) // row_bytes
+        _write_npy_header(f, dtype, (count, rows.shape[1]))
+
+def _build_rows(match_rows, histories, window):
+    """Maçları tarih sırasıyla işleyip özellik ve etiket satırları üretir"""
+    features, labels, index = [], [], []
+    width = len(TEAM_STATS)
+    for match_row in match_rows:
+        row = []
+        teams = (match_row['Ev Sahibi'], match_row['Deplasman'])
+        for team_name in teams:
+            history = histories.get(team_name)
+            if history:
+                with np.errstate(all='ignore'):
+                    row += list(np.nanmean(np.array(history, dtype=np.float64), axis=0))
+                row.append(len(history))
+            else:
+                row += [np.nan] * width
+                row.append(0)
+        features.append(row)
+        labels.append(_label(match_row))
+        index.append(match_key(match_row))
+
+        # Maç sonrası geçmişi güncelle (bir sonraki maçın özellikleri için)
+        for team_name, vector in zip(teams, _team_vectors(match_row)):
+            histories.setdefault(team_name, deque(maxlen=window)).append(vector)
+    return features, labels, index
+
+def _load_state(features_dir):
+    state_file = os.path.join(features_dir, 'state.json')
+    if not os.path.exists(state_file):
+        return None
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_state(features_dir, state):
+    state_file = os.path.join(features_dir, 'state.json')
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_file, state_file)
+
+def _index_rows(index_file):
+    """index.csv'deki satır sayısını (başlık hariç) döndürür"""
+    with open(index_file, 'r', encoding='utf-8', newline='') as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+def _files_consistent(features_dir, rows):
+    """Matris ve indeks dosyalarının durumdaki satır sayısıyla uyumlu olup olmadığını kontrol eder"""
+    paths = [os.path.join(features_dir, name) for name in ('X.npy', 'y.npy', 'index.csv')]
+    if not all(os.path.exists(path) for path in paths):
+        return False
+    if _index_rows(paths[2]) != rows:
+        return False
+    return all(np.load(path, mmap_mode='r').shape[0] == rows for path in paths[:2])
+
+def _reset(features_dir):
+    for name in ('X.npy', 'y.npy', 'index.csv', 'state.json'):
+        path = os.path.join(features_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+def update_features(logger, window=FEATURE_WINDOW, rebuild=False):
+    """Özellik matrislerini maç deposundan artımlı olarak günceller"""
+    try:
+        features_dir = get_features_dir()
+        state = None if rebuild else _load_state(features_dir)
+        if state and (state['window'] != window or state['names'] != feature_names()):
+            state = None
+        if state and not _files_consistent(features_dir, state['rows']):
+            # Yarıda kalmış bir güncelleme matrisleri tutarsız bırakmış olabilir
+            logger.warning("Özellik dosyaları tutarsız, yeniden oluşturuluyor")
+            state = None
+        if state is None:
+            _reset(features_dir)
+
+        known = set()
+        if state:
+            with open(os.path.join(features_dir, 'index.csv'), 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                known = {tuple(row[1:4]) for row in reader}
+
+        new_rows = [row for row in iter_store() if match_key(row) not in known]
+        new_rows.sort(key=lambda row: date_key(row['Tarih']))
+        if state and new_rows and date_key(new_rows[0]['Tarih']) < state['last_date']:
+            logger.info("Son işlenen tarihten eski maç bulundu, özellikler yeniden oluşturuluyor")
+            return update_features(logger, window, rebuild=True)
+        if not new_rows:
+            logger.info("Özellik matrisleri güncel")
+            return True
+
+        histories = {}
+        if state:
+            histories = {team: deque(vectors, maxlen=window) for team, vectors in state['histories'].items()}
+        features, labels, index = _build_rows(new_rows, histories, window)
+
+        _append_npy(os.path.join(features_dir, 'X.npy'), features, np.float32)
+        _append_npy(os.path.join(features_dir, 'y.npy'), labels, np.int16)
+
+        index_file = os.path.join(features_dir, 'index.csv')
+        start = state['rows'] if state else 0
+        file_exists = os.path.exists(index_file)
+        with open(index_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if not file_exists:
+                writer.writerow(['satir', 'Tarih', 'Ev Sahibi', 'Deplasman'])
+            for offset, key in enumerate(index):
+                writer.writerow([start + offset, *key])
+
+        _save_state(features_dir, {
+            'window': window,
+            'names': feature_names(),
+            'rows': start + len(index),
+            'last_date': date_key(new_rows[-1]['Tarih']),
+            'histories': {team: list(history) for team, history in histories.items()},
+        })
+        logger.info(f"Özellik matrislerine {len(index)} maç eklendi (toplam {start + len(index)})")
+        return True
+
+    except Exception as e:
+        logger.error(f"Özellik matrisleri güncellenirken hata: {str(e)}")
+        return False
+
+def load_features(mmap_mode='r'):
+    """X, y ve satır indeksini döndürür; matrisler diskten bellek eşlemeyle açılır"""
+    features_dir = get_features_dir()
+    X = np.load(os.path.join(features_dir, 'X.npy'), mmap_mode=mmap_mode)
+    y = np.load(os.path.join(features_dir, 'y.npy'), mmap_mode=mmap_mode)
+    with open(os.path.join(features_dir, 'index.csv'), 'r', encoding='utf-8', newline='') as f:
+        index = list(csv.DictReader(f))
+    return X, y, index
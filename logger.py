@@ -4,25 +4,32 @@ logger.py - Loglama işlemleri için yardımcı modül
 
 import logging
 import os
-import glob
 from datetime import datetime
 
-def setup_logger():
-    """Loglama sistemini yapılandırır"""
-    # Log dosyası için klasör oluştur
-    log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+from config import SD_MODE, VOLATILE_DIR
+
+def setup_logger(session=False, node_id=None):
+    """Loglama sistemini yapılandırır
+
+    session=True yalnızca toplama giriş noktasında kullanılır: düğümün kendi
+    log dosyası (çoklu düğümde scraper-<düğüm>.log) yeni oturumla sıfırlanır.
+    Diğer komutlar cli.log dosyasına ekleme yapar; çalışan servisin veya
+    aynı makinedeki diğer düğümlerin loglarına dokunulmaz.
+    """
+    # Log dosyası için klasör oluştur (SD kart modunda tmpfs üzerinde)
+    if SD_MODE:
+        log_dir = os.path.join(VOLATILE_DIR, 'logs')
+    else:
+        log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
-    # Eski log dosyalarını temizle
-    for old_log in glob.glob(os.path.join(log_dir, '*.log')):
-        try:
-            os.remove(old_log)
-        except Exception as e:
-            print(f"Eski log dosyası silinirken hata oluştu: {str(e)}")
-    
-    # Sabit log dosya adı
-    log_filename = os.path.join(log_dir, 'scraper.log')
+    if session:
+        log_filename = os.path.join(log_dir, f"scraper-{node_id}.log" if node_id else 'scraper.log')
+        log_mode = 'w'
+    else:
+        log_filename = os.path.join(log_dir, 'cli.log')
+        log_mode = 'a'
     
     # Logger'ı yapılandır
     logger = logging.getLogger('SahadanScraper')
@@ -33,7 +40,7 @@ def setup_logger():
         logger.handlers.clear()
     
     # Dosyaya yazma için handler
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8', mode='w')
+    file_handler = logging.FileHandler(log_filename, encoding='utf-8', mode=log_mode)
     file_handler.setLevel(logging.DEBUG)
     
     # Konsola yazma için handler
@@ -56,9 +63,9 @@ def setup_logger():
     
     return logger
 
-def get_logger():
-    """Mevcut logger'ı döndürür, yoksa yeni bir tane oluşturur"""
+def get_logger(session=False, node_id=None):
+    """Mevcut logger'ı döndürür, yoksa yeni bir tane oluşturur (bkz. setup_logger)"""
     logger = logging.getLogger('SahadanScraper')
     if not logger.handlers:
-        logger = setup_logger()
+        logger = setup_logger(session, node_id)
     return logger 
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+match_store.py - Maç bazlı (maç başına tek satır) istatistik deposu
+
+Her maç bir kez yazılır; ev sahibi ve deplasman değerleri aynı satırda yan
+yana tutulur ('Ev <istatistik>', 'Dep <istatistik>'); son sütun maçın ligidir
+(eski sürümlerden aktarılan satırlarda boş). Takım bazlı görünümler (Rakip,
+Ev Sahibi/Deplasman, yenilen goller, Sonuç) bu satırlardan türetilir:
+tek tek (team_view) veya toplu olarak (materialize_team_views).
+"""
+
+import os
+import csv
+import glob
+import socket
+
+import config
+import staging
+from csv_handler import ALL_STATS_HEADERS, create_stats_folder, _parse_date
+
+# Takım bakış açısına göre türetilen, depoda saklanmayan başlıklar
+PERSPECTIVE_HEADERS = ['Tarih', 'Rakip', 'Ev Sahibi/Deplasman', 'MS Yenilen Gol', 'İY Yenilen Gol', 'Sonuç']
+
+# Depoda her iki takım için saklanan istatistikler
+MATCH_STATS = [header for header in dict.fromkeys(ALL_STATS_HEADERS) if header not in PERSPECTIVE_HEADERS]
+
+HOME_PREFIX = 'Ev '
+AWAY_PREFIX = 'Dep '
+
+LEAGUE_COLUMN = 'Lig'
+
+MATCH_HEADERS = ['Tarih', 'Ev Sahibi', 'Deplasman'] + \
+    [HOME_PREFIX + stat for stat in MATCH_STATS] + \
+    [AWAY_PREFIX + stat for stat in MATCH_STATS] + \
+    [LEAGUE_COLUMN]
+
+STORE_FILE = 'matches.csv'
+
+def get_store_dir():
+    """Maç deposu klasörünü oluşturur"""
+    store_dir = os.path.join(create_stats_folder(), 'matches')
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+def get_store_file(store_dir=None):
+    """Maç deposu dosyasının yolunu döndürür"""
+    return os.path.join(store_dir or get_store_dir(), STORE_FILE)
+
+def match_key(row):
+    """Maçı tekil olarak tanımlayan anahtar"""
+    return row['Tarih'], row['Ev Sahibi'], row['Deplasman']
+
+def build_match_row(home_team, away_team, match_date, home_stats, away_stats, logger=None, league=''):
+    """Ev sahibi ve deplasman istatistiklerinden tek bir maç satırı oluşturur"""
+    row = {header: '0' for header in MATCH_HEADERS}
+    row['Tarih'] = match_date
+    row['Ev Sahibi'] = home_team
+    row['Deplasman'] = away_team
+    row[LEAGUE_COLUMN] = league
+
+    for prefix, stats in ((HOME_PREFIX, home_stats), (AWAY_PREFIX, away_stats)):
+        for key, value in stats.items():
+            if key in MATCH_STATS:
+                row[prefix + key] = value
+            elif key not in PERSPECTIVE_HEADERS and logger:
+                logger.warning(f"Bilinmeyen istatistik başlığı: {key}")
+    return row
+
+def get_result(goals_for, goals_against):
+    """Takımın bakış açısından maç sonucunu döndürür"""
+    try:
+        goals_for, goals_against = int(goals_for), int(goals_against)
+    except ValueError:
+        return ''
+    if goals_for > goals_against:
+        return 'Galip'
+    if goals_for < goals_against:
+        return 'Mağlup'
+    return 'Berabere'
+
+def team_view(match_row, team_name):
+    """Maç satırından verilen takımın bakış açısıyla ALL_STATS_HEADERS satırı türetir"""
+    is_home = match_row['Ev Sahibi'] == team_name
+    own, other = (HOME_PREFIX, AWAY_PREFIX) if is_home else (AWAY_PREFIX, HOME_PREFIX)
+
+    row = {stat: match_row[own + stat] for stat in MATCH_STATS}
+    row['Tarih'] = match_row['Tarih']
+    row['Rakip'] = match_row['Deplasman'] if is_home else match_row['Ev Sahibi']
+    row['Ev Sahibi/Deplasman'] = 'Ev Sahibi' if is_home else 'Deplasman'
+    row['MS Yenilen Gol'] = match_row[other + 'MS Gol']
+    row['İY Yenilen Gol'] = match_row[other + 'İY Gol']
+    row['Sonuç'] = get_result(row['MS Gol'], row['MS Yenilen Gol'])
+    return row
+
+def _append_rows(store_file, rows):
+    """Satırları depo dosyasına ekler, dosya yoksa başlığı yazar"""
+    file_exists = os.path.exists(store_file)
+    with open(store_file, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=MATCH_HEADERS)
+        if not file_exists:
+            writer.writeheader()
+        writer.writerows(rows)
+
+# Başlığı bu süreçte denetlenmiş depo dosyaları
+_checked_headers = set()
+
+def upgrade_store_header(store_file, logger=None):
+    """Eski başlıklı (ör. lig sütunu olmayan) depoyu güncel başlığa bir kez dönüştürür"""
+    if store_file in _checked_headers or not os.path.exists(store_file):
+        return
+    with open(store_file, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f), None)
+    if header and header != MATCH_HEADERS:
+        rows = [[row.get(name) or '' for name in MATCH_HEADERS] for row in iter_store(store_file)]
+        _write_atomic(store_file, MATCH_HEADERS, rows)
+        if logger:
+            logger.info(f"Maç deposu güncel başlığa dönüştürüldü: {store_file}")
+    _checked_headers.add(store_file)
+
+def save_match(home_team, away_team, match_date, home_stats, away_stats, logger, store_dir=None, league=None):
+    """Maçı depoya tek satır olarak kaydeder (lig verilmezse config.LEAGUE)"""
+    try:
+        store_file = get_store_file(store_dir)
+        if store_dir is None and not staging.exists(store_file):
+            # Depo ilk kez oluşturuluyor: eski takım dosyalarındaki geçmişi aktar
+            migrate_team_files(logger)
+        upgrade_store_header(store_file, logger)
+
+        row = build_match_row(home_team, away_team, match_date, home_stats, away_stats, logger,
+                              league or config.LEAGUE)
+        if store_dir is None and staging.is_enabled():
+            # SD kart modu: satır tmpfs'te birikir, karta toplu olarak eklenir
+            # (düğüm depoları birleştirmede hemen okunduğundan tamponlanmaz)
+            staging.append_rows(store_file, MATCH_HEADERS, [[row[header] for header in MATCH_HEADERS]])
+        else:
+            _append_rows(store_file, [row])
+
+        logger.info(f"{home_team} - {away_team} maçı kaydedildi")
+        return True
+
+    except Exception as e:
+        logger.error(f"{home_team} - {away_team} maçı kaydedilirken hata: {str(e)}")
+        return False
+
+def iter_store(store_file=None):
+    """Depodaki maç satırlarını sözlük olarak tek tek üretir"""
+    store_file = store_file or get_store_file()
+    if not os.path.exists(store_file):
+        return
+    with open(store_file, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+def _write_atomic(path, fieldnames, rows):
+    """Satırları geçici dosyaya yazıp tek adımda hedefin yerine koyar
+
+    Geçici dosya adı işleme özeldir; eşzamanlı yazan düğümler birbirinin
+    yarım dosyasını yerine koymaz.
+    """
+    tmp_file = f"{path}.{socket.gethostname()}-{os.getpid()}.tmp"
+    with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+    os.replace(tmp_file, path)
+
+def materialize_team_views(logger, stats_dir=None, store_file=None):
+    """Depodan tüm takımların CSV görünümlerini toplu olarak yeniden oluşturur"""
+    try:
+        stats_dir = stats_dir or create_stats_folder()
+        team_rows = {}
+        for match_row in iter_store(store_file):
+            for team_name in (match_row['Ev Sahibi'], match_row['Deplasman']):
+                view = team_view(match_row, team_name)
+                team_rows.setdefault(team_name, []).append([view[header] for header in ALL_STATS_HEADERS])
+
+        for team_name, rows in team_rows.items():
+            rows.sort(key=lambda row: _parse_date(row[0]))
+            _write_atomic(os.path.join(stats_dir, f"{team_name}.csv"), ALL_STATS_HEADERS, rows)
+
+        logger.info(f"{len(team_rows)} takım görünümü oluşturuldu")
+        return True
+
+    except Exception as e:
+        logger.error(f"Takım görünümleri oluşturulurken hata: {str(e)}")
+        return False
+
+def migrate_team_files(logger, stats_dir=None):
+    """Eski takım bazlı CSV dosyalarını maç deposuna aktarır
+
+    Ev sahibi satırı maçı tanımlar; deplasman değerleri rakibin dosyasından
+    alınır, bulunamazsa yalnızca skorlar ev sahibi satırından doldurulur.
+    """
+    from stats_reader import iter_matches
+
+    try:
+        stats_dir = stats_dir or create_stats_folder()
+        store_file = get_store_file()
+
+        away_rows = {}
+        for row in iter_matches(venue='away', backend='teams', stats_dir=stats_dir):
+            away_rows[(row['Tarih'], row['Rakip'], row['Takım'])] = row
+
+        rows = []
+        seen = set()
+        for row in iter_matches(venue='home', backend='teams', stats_dir=stats_dir):
+            home_team, away_team = row['Takım'], row['Rakip']
+            if (row['Tarih'], home_team, away_team) in seen:
+                continue
+            seen.add((row['Tarih'], home_team, away_team))
+            away = away_rows.pop((row['Tarih'], home_team, away_team), None)
+            if away is None:
+                away = {'MS Gol': row['MS Yenilen Gol'], 'İY Gol': row['İY Yenilen Gol']}
+            rows.append(build_match_row(home_team, away_team, row['Tarih'], row, away))
+
+        # Ev sahibi dosyası olmayan maçlar deplasman satırından oluşturulur
+        for (match_date, home_team, away_team), away in away_rows.items():
+            home = {'MS Gol': away['MS Yenilen Gol'], 'İY Gol': away['İY Yenilen Gol']}
+            rows.append(build_match_row(home_team, away_team, match_date, home, away))
+
+        if rows:
+            rows.sort(key=lambda row: _parse_date(row['Tarih']))
+            _append_rows(store_file, rows)
+            logger.info(f"{len(rows)} maç takım dosyalarından depoya aktarıldı")
+        return True
+
+    except Exception as e:
+        logger.error(f"Takım dosyaları aktarılırken hata: {str(e)}")
+        return False
+
+def merge_shards(logger):
+    """Düğüm depolarını (shard) ana depoda birleştirir ve takım görünümlerini oluşturur"""
+    try:
+        store_file = get_store_file()
+        shard_root = os.path.join(create_stats_folder(), 'shards')
+        if not os.path.exists(store_file):
+            migrate_team_files(logger)
+
+        # Aynı maç (Tarih, Ev Sahibi, Deplasman) yalnızca bir kez yazılır
+        rows = {}
+        for path in [store_file] + sorted(glob.glob(os.path.join(shard_root, '*', STORE_FILE))):
+            for row in iter_store(path):
+                rows.setdefault(match_key(row), row)
+
+        ordered = sorted(rows.values(), key=lambda row: _parse_date(row['Tarih']))
+        _write_atomic(store_file, MATCH_HEADERS,
+                      ([row.get(header) or '' for header in MATCH_HEADERS] for row in ordered))
+        logger.info(f"Düğüm çıktıları birleştirildi: {len(ordered)} maç")
+
+        return materialize_team_views(logger)
+
+    except Exception as e:
+        logger.error(f"Shard birleştirme hatası: {str(e)}")
+        return False
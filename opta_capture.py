@@ -0,0 +1,230 @@
+"""
+opta_capture.py - Opta istatistik widget'ının veri yanıtlarını doğrudan okur
+
+Widget, istatistikleri ayrı bir JSON/JSONP isteğiyle yükler. Sekmelere tıklayıp
+görüntülenen metni okumak yerine bu istek sayfanın Resource Timing kayıtlarından
+bulunur, aynı oturumla yeniden alınır ve JSON olarak çözümlenir; tüm
+istatistikler tek seferde elde edilir.
+
+Kayıtlı yanıtlarla denemek için yerel bir sunucu başlatılabilir:
+    python opta_capture.py serve payloads/ --port 8766
+    python opta_capture.py parse http://127.0.0.1:8766/ornek.json
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+
+# Widget'ın istatistik verisini yükleyen matchstats uç noktası; yalnızca bu istekler
+# okunur (opta.net altındaki betik, stil ve diğer veri istekleri eşleşmez).
+# SCRAPER_FEED_PATTERNS ile ek desenler verilebilir, ör. yerel test sunucusu
+OPTA_FEED_PATTERNS = [
+    'performfeeds.com/soccerdata/matchstats/',
+] + [pattern for pattern in os.environ.get('SCRAPER_FEED_PATTERNS', '').split(',') if pattern]
+
+# Opta istatistik türü -> CSV başlığı
+OPTA_STAT_MAP = {
+    'possessionPercentage': 'Topla Oynama',
+    'duelWon': 'İkili Mücadele Kazanma',
+    'aerialWon': 'Hava Topu Kazanma',
+    'interception': 'Pas Arası',
+    'totalOffside': 'Ofsayt',
+    'wonCorners': 'Korner',
+    'totalPass': 'Toplam Pas',
+    'accuratePass': 'İsabetli Pas',
+    'totalCross': 'Toplam Orta',
+    'accurateCross': 'İsabetli Orta',
+    'totalScoringAtt': 'Toplam Şut',
+    'ontargetScoringAtt': 'İsabetli Şut',
+    'shotOffTarget': 'İsabetsiz Şut',
+    'blockedScoringAtt': 'Engellenen Şut',
+    'hitWoodwork': 'Direkten Dönen Şut',
+    'expectedGoals': 'Gol Beklentisi (xG)',
+    'touchesInOppBox': 'Rakip Ceza Sahasında Topla Buluşma',
+    'totalClearance': 'Uzaklaştırma',
+    'fkFoulLost': 'Faul',
+    'totalYellowCard': 'Sarı Kart',
+    'secondYellow': 'İkinci Sarıdan Kırmızı Kart',
+    'totalRedCard': 'Kırmızı Kart',
+}
+
+# Widget'ta (DOM) yüzde olarak gösterilen istatistikler ('58%')
+PERCENT_STATS = {'Topla Oynama', 'Pas İsabeti %'}
+
+_JSONP_RE = re.compile(r'^[^(]*\((.*)\)\s*;?\s*$', re.DOTALL)
+
+_FIND_FEEDS_JS = """
+const patterns = arguments[0];
+return performance.getEntriesByType('resource')
+    .map(entry => entry.name)
+    .filter(name => patterns.some(pattern => name.includes(pattern)));
+"""
+
+_FETCH_JS = """
+const url = arguments[0];
+const done = arguments[arguments.length - 1];
+fetch(url, {credentials: 'include'})
+    .then(response => response.ok ? response.text() : null)
+    .then(done)
+    .catch(() => done(null));
+"""
+
+def _load_json(text):
+    """JSON veya JSONP (callback(...)) metnini çözümler"""
+    text = text.strip()
+    if not text.startswith('{'):
+        match = _JSONP_RE.match(text)
+        if not match:
+            raise ValueError("Yanıt JSON/JSONP biçiminde değil")
+        text = match.group(1)
+    return json.loads(text)
+
+def _format_value(value, percent=False):
+    """Opta sayısal değerini CSV'deki metin biçimine çevirir
+
+    Yüzdeler widget'taki gibi tam sayıya yuvarlanıp '%' ile yazılır; kayıtlı
+    değerler STATS_SOURCE'a bağlı olmaz.
+    """
+    number = float(value)
+    if percent:
+        # Widget gibi (Math.round) yarımlar yukarı yuvarlanır
+        return f"{int(number + 0.5)}%"
+    return str(int(number)) if number.is_integer() else f"{number:g}"
+
+def parse_payload(text):
+    """Opta matchstats yanıtını {başlık: (ev sahibi, deplasman)} sözlüğüne çevirir"""
+    data = _load_json(text)
+    try:
+        contestants = data['matchInfo']['contestant']
+        line_ups = data['liveData']['lineUp']
+    except (KeyError, TypeError):
+        raise ValueError("Yanıtta matchInfo/liveData alanları yok")
+
+    positions = {contestant['id']: contestant.get('position') for contestant in contestants}
+    sides = {}
+    for line_up in line_ups:
+        position = positions.get(line_up.get('contestantId'))
+        sides[position] = {stat['type']: stat['value'] for stat in line_up.get('stat', [])}
+    if 'home' not in sides or 'away' not in sides:
+        raise ValueError("Yanıtta ev sahibi/deplasman istatistikleri eksik")
+
+    stats = {}
+    for opta_type, header in OPTA_STAT_MAP.items():
+        home_value = sides['home'].get(opta_type, 0)
+        away_value = sides['away'].get(opta_type, 0)
+        percent = header in PERCENT_STATS
+        stats[header] = (_format_value(home_value, percent), _format_value(away_value, percent))
+
+    # Pas isabeti widget'ta ayrıca gösterilir, yanıtta yoktur
+    accuracy = []
+    for side in ('home', 'away'):
+        total = float(sides[side].get('totalPass', 0))
+        accurate = float(sides[side].get('accuratePass', 0))
+        accuracy.append(_format_value(accurate * 100 / total, percent=True) if total else '0%')
+    stats['Pas İsabeti %'] = tuple(accuracy)
+    return stats
+
+def fetch_payload(url, driver=None, user_agent=None):
+    """Veri yanıtını tarayıcı oturumuyla, olmazsa doğrudan HTTP ile alır"""
+    if driver is not None:
+        text = driver.execute_async_script(_FETCH_JS, url)
+        if text:
+            return text
+        user_agent = user_agent or driver.execute_script("return navigator.userAgent;")
+
+    from urllib.request import Request, urlopen
+    headers = {'User-Agent': user_agent} if user_agent else {}
+    with urlopen(Request(url, headers=headers), timeout=10) as response:
+        return response.read().decode('utf-8')
+
+def record_payload(text, record_dir, name):
+    """Yanıtı daha sonra yerel sunucuda tekrar oynatmak için kaydeder"""
+    os.makedirs(record_dir, exist_ok=True)
+    safe_name = re.sub(r'[^\w.-]+', '_', name)
+    with open(os.path.join(record_dir, f"{safe_name}.json"), 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def collect_stats_from_network(driver, logger, timeout=10, record_dir=None, record_name=None):
+    """Widget'ın veri yanıtını bulup tüm istatistikleri tek seferde döndürür
+
+    Yanıt bulunamaz veya çözümlenemezse boş sözlük döner; çağıran taraf
+    sekme tabanlı (DOM) okumaya geri dönebilir.
+    """
+    try:
+        deadline = time.monotonic() + timeout
+        feeds = []
+        while time.monotonic() < deadline:
+            feeds = driver.execute_script(_FIND_FEEDS_JS, OPTA_FEED_PATTERNS)
+            if feeds:
+                break
+            time.sleep(0.2)
+        if not feeds:
+            logger.warning("Widget veri isteği bulunamadı")
+            return {}
+
+        # En son yüklenen istek en güncel veriyi içerir
+        for url in reversed(feeds):
+            logger.debug(f"Widget veri isteği: {url}")
+            text = fetch_payload(url, driver)
+            try:
+                stats = parse_payload(text)
+            except ValueError as e:
+                logger.debug(f"Yanıt çözümlenemedi ({url}): {str(e)}")
+                continue
+            if record_dir:
+                record_payload(text, record_dir, record_name or str(int(time.time())))
+            logger.info(f"{len(stats)} istatistik ağ yanıtından okundu")
+            return stats
+
+        logger.warning("Widget yanıtlarından istatistik çözümlenemedi")
+        return {}
+
+    except Exception as e:
+        logger.error(f"Ağ yanıtından istatistik okunurken hata: {str(e)}")
+        return {}
+
+def payload_server(directory, port=8766):
+    """Kayıtlı yanıtları sunan yerel HTTP sunucusunu oluşturur (port=0: boş port)"""
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    handler = partial(SimpleHTTPRequestHandler, directory=directory)
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+def serve_payloads(directory, port=8766):
+    """Kayıtlı yanıtları yerel HTTP sunucusundan sunar (test amaçlı)"""
+    server = payload_server(directory, port)
+    print(f"Kayıtlı yanıtlar sunuluyor: http://127.0.0.1:{port}/ ({directory})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    """Kayıtlı yanıtları sunmak veya çözümlemek için komut satırı"""
+    parser = argparse.ArgumentParser(description="Opta widget yanıtı araçları")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve = subparsers.add_parser('serve', help="Kayıtlı yanıtları yerel olarak sun")
+    serve.add_argument('directory')
+    serve.add_argument('--port', type=int, default=8766)
+    parse = subparsers.add_parser('parse', help="Dosya veya URL'deki yanıtı çözümle")
+    parse.add_argument('source')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve_payloads(args.directory, args.port)
+        return
+    if args.source.startswith(('http://', 'https://')):
+        text = fetch_payload(args.source)
+    else:
+        with open(args.source, 'r', encoding='utf-8') as f:
+            text = f.read()
+    for header, (home_value, away_value) in parse_payload(text).items():
+        print(f"{header}: {home_value} - {away_value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+read_api.py - Maç deposu için yerel HTTP/JSON okuma servisi
+
+Depo (stats/matches/matches.csv) bir kez belleğe yüklenir: her maç tek bir
+demet olarak tutulur, takım başına maç indeksleri saklanır. Sorgu sonuçları
+bir LRU önbelleğinde tutulur. Scraper depoya yeni maç eklediğinde yalnızca
+dosyanın yeni kısmı okunur ve yalnızca o maçların takımlarını içeren önbellek
+girdileri silinir. Dosya yeniden yazılırsa (ör. shard birleştirme) tamamı
+yeniden yüklenir.
+
+Uç noktalar:
+    /teams
+    /team/<takım>?season=&date_from=&date_to=&venue=home|away&limit=
+    /h2h?team=<takım>&opponent=<rakip>
+    /season?season=2023-2024[&team=<takım>][&date_from=&date_to=]
+
+    python cli.py serve --port 8770
+    curl "http://127.0.0.1:8770/team/Arsenal?season=2023-2024&limit=5"
+"""
+
+import os
+import io
+import csv
+import json
+import time
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from match_store import MATCH_HEADERS, MATCH_STATS, get_store_file, team_view
+from stats_reader import date_key, date_range, to_float, VENUES
+
+CACHE_SIZE = 256
+REFRESH_INTERVAL = 1.0   # Depo değişiklikleri en fazla bu sıklıkta (sn) kontrol edilir
+
+_COLUMN = {header: index for index, header in enumerate(MATCH_HEADERS)}
+_DATE, _HOME, _AWAY = _COLUMN['Tarih'], _COLUMN['Ev Sahibi'], _COLUMN['Deplasman']
+
+# Tüm takımlara bağlı önbellek girdileri için anahtar
+_ALL_TEAMS = '*'
+
+class MatchIndex:
+    """Depodaki maçları bellekte tutar ve dosyaya eklenen satırları izler"""
+
+    def __init__(self, store_file=None):
+        self.store_file = store_file or get_store_file()
+        self.matches = []
+        self.by_team = {}
+        self._offset = 0
+        self._inode = None
+        self._header = None
+
+    def _add(self, values):
+        if len(values) != len(self._header):
+            return None
+        if self._header != MATCH_HEADERS:
+            by_name = dict(zip(self._header, values))
+            values = [by_name.get(header, '0') for header in MATCH_HEADERS]
+        match_id = len(self.matches)
+        self.matches.append(tuple(values))
+        for team in (values[_HOME], values[_AWAY]):
+            self.by_team.setdefault(team, []).append(match_id)
+        return values[_HOME], values[_AWAY]
+
+    def refresh(self):
+        """Yeni eklenen satırları okur
+
+        Dönüş: None (tam yeniden yükleme yapıldı) veya yeni maçlardan etkilenen takımlar
+        """
+        if not os.path.exists(self.store_file):
+            return set()
+        stat = os.stat(self.store_file)
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Dosya değiştirildi veya kısaldı: baştan yükle
+            self.matches, self.by_team = [], {}
+            self._offset, self._inode, self._header = 0, stat.st_ino, None
+            self._read_new()
+            self._sort()
+            return None
+        if stat.st_size == self._offset:
+            return set()
+        return self._read_new()
+
+    def _read_new(self):
+        teams = set()
+        with open(self.store_file, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Yarım yazılmış son satır bir sonraki yenilemede okunur
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return teams
+        self._offset += end
+        reader = csv.reader(io.StringIO(data[:end].decode('utf-8'), newline=''))
+        if self._header is None:
+            self._header = next(reader, None)
+        for values in reader:
+            if values:
+                added = self._add(values)
+                if added:
+                    teams.update(added)
+        if teams:
+            self._sort(teams)
+        return teams
+
+    def _sort(self, teams=None):
+        """Takım maç listelerini tarih sırasına koyar"""
+        for team in teams or list(self.by_team):
+            self.by_team[team].sort(key=lambda match_id: date_key(self.matches[match_id][_DATE]))
+
+    def team_matches(self, team, date_from=None, date_to=None):
+        for match_id in self.by_team.get(team, ()):
+            values = self.matches[match_id]
+            key = date_key(values[_DATE])
+            if (date_from and key < date_from) or (date_to and key > date_to):
+                continue
+            yield dict(zip(MATCH_HEADERS, values))
+
+class ReadService:
+    """Sorguları yanıtlar, sonuçları takım bazında geçersiz kılınan LRU önbellekte tutar"""
+
+    def __init__(self, store_file=None, cache_size=CACHE_SIZE):
+        self.index = MatchIndex(store_file)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._keys_by_team = {}
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < REFRESH_INTERVAL:
+            return
+        self._checked_at = now
+        teams = self.index.refresh()
+        if teams is None:
+            self._cache.clear()
+            self._keys_by_team.clear()
+        elif teams:
+            self._invalidate(teams | {_ALL_TEAMS})
+
+    def _invalidate(self, teams):
+        for team in teams:
+            for key in self._keys_by_team.pop(team, ()):
+                self._cache.pop(key, None)
+
+    def _store(self, key, teams, result):
+        self._cache[key] = (teams, result)
+        for team in teams:
+            self._keys_by_team.setdefault(team, set()).add(key)
+        while len(self._cache) > self.cache_size:
+            old_key, (old_teams, _) = self._cache.popitem(last=False)
+            for team in old_teams:
+                self._keys_by_team.get(team, set()).discard(old_key)
+
+    def has_endpoint(self, name):
+        return hasattr(self, f"_query_{name}")
+
+    def query(self, name, **params):
+        """Önbellekten veya hesaplayarak sorgu sonucunu döndürür"""
+        if not self.has_endpoint(name):
+            raise ValueError(f"Bilinmeyen sorgu: {name}")
+        handler = getattr(self, f"_query_{name}")
+        key = (name, tuple(sorted(params.items())))
+        with self._lock:
+            self._refresh()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key][1]
+            self.misses += 1
+            teams, result = handler(**params)
+            self._store(key, teams, result)
+            return result
+
+    def _query_teams(self):
+        return {_ALL_TEAMS}, {'teams': sorted(self.index.by_team)}
+
+    def _query_team(self, team, season=None, date_from=None, date_to=None, venue=None, limit=None):
+        date_from, date_to = date_range(season, date_from, date_to)
+        if venue and venue not in VENUES:
+            raise ValueError(f"Geçersiz saha filtresi: {venue}")
+        venue = VENUES[venue] if venue else None
+        rows = []
+        for match_row in self.index.team_matches(team, date_from, date_to):
+            view = team_view(match_row, team)
+            if venue and view['Ev Sahibi/Deplasman'] != venue:
+                continue
+            rows.append(view)
+        if limit:
+            rows = rows[-int(limit):]
+        return {team}, {'team': team, 'matches': rows}
+
+    def _query_h2h(self, team, opponent):
+        rows = [team_view(match_row, team) for match_row in self.index.team_matches(team)
+                if opponent in (match_row['Ev Sahibi'], match_row['Deplasman'])]
+        summary = {'Galip': 0, 'Berabere': 0, 'Mağlup': 0}
+        for row in rows:
+            if row['Sonuç'] in summary:
+                summary[row['Sonuç']] += 1
+        return {team, opponent}, {'team': team, 'opponent': opponent, 'summary': summary, 'matches': rows}
+
+    def _aggregate(self, team, date_from, date_to):
+        totals = {'O': 0, 'G': 0, 'B': 0, 'M': 0, 'AG': 0, 'YG': 0, 'P': 0}
+        sums, counts = {}, {}
+        for match_row in self.index.team_matches(team, date_from, date_to):
+            view = team_view(match_row, team)
+            scored, conceded = to_float(view['MS Gol']), to_float(view['MS Yenilen Gol'])
+            if scored != scored or conceded != conceded:
+                continue
+            totals['O'] += 1
+            totals['AG'] += int(scored)
+            totals['YG'] += int(conceded)
+            result = {'Galip': 'G', 'Berabere': 'B', 'Mağlup': 'M'}[view['Sonuç']]
+            totals[result] += 1
+            for stat in MATCH_STATS:
+                value = to_float(view[stat])
+                if value == value:
+                    sums[stat] = sums.get(stat, 0.0) + value
+                    counts[stat] = counts.get(stat, 0) + 1
+        totals['P'] = totals['G'] * 3 + totals['B']
+        totals['ortalama'] = {stat: round(sums[stat] / counts[stat], 3) for stat in sums}
+        return totals
+
+    def _query_season(self, season=None, team=None, date_from=None, date_to=None):
+        date_from, date_to = date_range(season, date_from, date_to)
+        teams = [team] if team else sorted(self.index.by_team)
+        aggregates = {name: self._aggregate(name, date_from, date_to) for name in teams}
+        aggregates = {name: values for name, values in aggregates.items() if values['O']}
+        return ({team} if team else {_ALL_TEAMS}), {'season': season, 'teams': aggregates}
+
+def start_read_api(port, logger, store_file=None, host='127.0.0.1'):
+    """Okuma servisini arka planda çalışan bir iş parçacığında başlatır"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    service = ReadService(store_file)
+
+    class ReadHandler(BaseHTTPRequestHandler):
+        def _send(self, code, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            if not parts:
+                self._send(200, {'cache': {'entries': len(service._cache), 'hits': service.hits,
+                                           'misses': service.misses},
+                                 'matches': len(service.index.matches)})
+                return
+            name = parts[0]
+            if name == 'team' and len(parts) == 2:
+                params['team'] = parts[1]
+            # Yalnızca yönlendirme hatası 404 döner; sorgu içindeki hatalar gizlenmez
+            if not service.has_endpoint(name):
+                self._send(404, {'error': f"Bilinmeyen uç nokta: {url.path}"})
+                return
+            try:
+                self._send(200, service.query(name, **params))
+            except (TypeError, ValueError) as e:
+                self._send(400, {'error': str(e)})
+            except Exception as e:
+                logger.error(f"Okuma isteği işlenirken hata ({self.path}): {str(e)}")
+                self._send(500, {'error': "Sunucu hatası"})
+
+        def log_message(self, format, *args):
+            logger.debug(f"Okuma isteği: {format % args}")
+
+    try:
+        server = ThreadingHTTPServer((host, port), ReadHandler)
+    except OSError as e:
+        logger.warning(f"Okuma servisi başlatılamadı ({host}:{port}): {str(e)}")
+        return None
+
+    thread = threading.Thread(target=server.serve_forever, name='read-api', daemon=True)
+    thread.start()
+    logger.info(f"Okuma servisi: http://{host}:{port}/")
+    return server
@@ -6,20 +6,31 @@ from selenium import webdriver
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import os
 import time
 import random
 from fake_useragent import UserAgent
-from config import get_url
+import config
+from config import get_url, get_scope, get_season, SHARDED_MODE, STATS_SOURCE, PAYLOAD_RECORD_DIR, STATUS_PORT, TRACE_PATH
+from config import SD_MODE, VOLATILE_DIR, FLUSH_INTERVAL, update_season_config
+import staging
 from logger import get_logger
-from csv_handler import save_match_stats
+from csv_handler import get_shard_dir
+from match_store import save_match, merge_shards
+from standings import load_table, save_table, save_if_due, rebuild_table
+from work_claim import WorkClaimer, match_unit, season_unit
+from opta_capture import collect_stats_from_network
+from status_server import get_status, start_status_server
+from tracing import span, begin, end, enable_tracing, disable_tracing
+from adaptive_wait import wait_until
 import sys
 import datetime
 import subprocess
+import shlex
 from datetime import datetime, timedelta
 import platform
+from collections import deque
 
 def get_random_delay():
     """İstekler arası rastgele bekleme süresi üretir"""
@@ -81,10 +92,18 @@ def setup_driver():
     ublock_path = os.path.join(current_dir, "ublock.xpi")
     logger.debug(f"uBlock Origin yolu: {ublock_path}")
     
+    # SD kart modunda Firefox profili (TMPDIR altında oluşturulur) ve sürücü logu tmpfs'te tutulur
+    log_dir = current_dir
+    if SD_MODE:
+        log_dir = VOLATILE_DIR
+        tmp_dir = os.path.join(VOLATILE_DIR, 'tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        os.environ['TMPDIR'] = tmp_dir
+    
     # Geckodriver servisini başlat
     service = Service(
         executable_path=os.path.join(current_dir, "geckodriver"),
-        log_path=os.path.join(current_dir, "geckodriver.log")
+        log_path=os.path.join(log_dir, "geckodriver.log")
     )
     
     max_retries = 5
@@ -93,17 +112,19 @@ def setup_driver():
     while retry_count < max_retries:
         try:
             logger.info(f"Firefox sürücüsü başlatılıyor... (Deneme {retry_count + 1}/{max_retries})")
-            driver = webdriver.Firefox(
-                service=service,
-                options=firefox_options
-            )
-            
-            # uBlock Origin'i yükle
-            logger.info("uBlock Origin eklentisi yükleniyor...")
-            driver.install_addon(ublock_path, temporary=True)
-            time.sleep(1)
-            logger.info("uBlock Origin başarıyla yüklendi")
+            with span('driver_start', attempt=retry_count + 1):
+                driver = webdriver.Firefox(
+                    service=service,
+                    options=firefox_options
+                )
+                
+                # uBlock Origin'i yükle
+                logger.info("uBlock Origin eklentisi yükleniyor...")
+                driver.install_addon(ublock_path, temporary=True)
+                time.sleep(1)
+                logger.info("uBlock Origin başarıyla yüklendi")
             
+            get_status().driver_started()
             return driver
             
         except Exception as e:
@@ -121,20 +142,21 @@ def collect_stats_from_tab(driver, tab_selector, logger):
     """Belirtilen tabdaki istatistikleri toplar"""
     try:
         # İstatistik sayfasının yüklenmesini bekle
-        WebDriverWait(driver, 5).until(
+        wait_until(driver, 'stats_widget', 5,
             EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1"))
         )
         
         # Tab'ı bulmayı dene
         try:
-            tab = WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.XPATH, tab_selector))
+            tab = wait_until(driver, 'stats_tab', 3,
+                EC.presence_of_element_located((By.XPATH, tab_selector)), optional=True
             )
             driver.execute_script("arguments[0].click();", tab)
             
             # Tablo içeriğini bul
-            table = WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1 > div > div > div > ul > li.Opta-On > div > table"))
+            table = wait_until(driver, 'stats_table', 3,
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1 > div > div > div > ul > li.Opta-On > div > table")),
+                optional=True
             )
             
             # İstatistikleri ve değerleri topla
@@ -161,22 +183,62 @@ def collect_stats_from_tab(driver, tab_selector, logger):
         logger.error(f"Tab istatistikleri toplanırken hata: {str(e)}")
         return {}
 
+TAB_SELECTORS = [
+    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[1]/a',
+    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[2]/a',
+    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[3]/a',
+    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[4]/a',
+    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[5]/a'
+]
+
+# Widget'taki tüm sekme bağlantıları (sekme sayısını tek sorguda bulmak için)
+TAB_LINKS_XPATH = '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li/a'
+
+def count_stat_tabs(driver, logger):
+    """Widget'ın gerçekte kaç sekmesi olduğunu tek sorguyla bulur"""
+    try:
+        tabs = wait_until(driver, 'stats_tabs', 5,
+            EC.presence_of_all_elements_located((By.XPATH, TAB_LINKS_XPATH))
+        )
+    except Exception:
+        logger.warning("İstatistik sekmeleri bulunamadı")
+        return 0
+    if len(tabs) < len(TAB_SELECTORS):
+        logger.info(f"Widget'ta {len(tabs)} sekme var, eksik sekmeler atlanıyor")
+    return min(len(tabs), len(TAB_SELECTORS))
+
+def collect_match_stats(driver, logger, record_name=None):
+    """Maçın tüm istatistiklerini toplar: önce widget veri yanıtı, olmazsa sekmeler"""
+    if STATS_SOURCE == 'network':
+        with span('collect_stats_from_network'):
+            stats = collect_stats_from_network(driver, logger, record_dir=PAYLOAD_RECORD_DIR, record_name=record_name)
+        if stats:
+            return stats
+        logger.info("Sekme tabanlı okumaya geçiliyor...")
+    
+    stats = {}
+    tab_count = count_stat_tabs(driver, logger)
+    for tab_number, tab_selector in enumerate(TAB_SELECTORS[:tab_count], start=1):
+        with span('collect_stats_from_tab', tab=tab_number):
+            stats.update(collect_stats_from_tab(driver, tab_selector, logger))
+    return stats
+
 def get_match_scores(driver, logger):
     """Maç skorlarını toplar"""
     try:
         # MS Gol bilgilerini al
-        home_ms_goal = WebDriverWait(driver, 5).until(
+        home_ms_goal = wait_until(driver, 'score_home', 5,
             EC.presence_of_element_located((By.XPATH, 
             '/html/body/div[4]/div[1]/div[1]/div/div[2]/div[2]/div[1]/span[1]'))
         ).text.strip()
         
-        away_ms_goal = WebDriverWait(driver, 5).until(
+        away_ms_goal = wait_until(driver, 'score_away', 5,
             EC.presence_of_element_located((By.XPATH, 
             '/html/body/div[4]/div[1]/div[1]/div/div[2]/div[2]/div[1]/span[2]'))
         ).text.strip()
         
         # İY Gol bilgisini al ve işle
-        iy_score = WebDriverWait(driver, 5).until(
+        iy_score = wait_until(driver, 'score_half_time', 5,
             EC.presence_of_element_located((By.XPATH, 
             '/html/body/div[4]/div[1]/div[1]/div/div[2]/div[2]/div[2]'))
         ).text.strip()
@@ -228,145 +290,13 @@ def get_match_result(home_ms_goal, away_ms_goal):
     else:
         return "Berabere", "Berabere"
 
-def process_matches(driver, elements, start_index, logger):
-    """Belirli bir indeksten başlayarak maçları işler"""
-    max_retries = 5
-    
-    for i in range(start_index, min(start_index + 10, len(elements))):
-        retry_count = 0
-        while retry_count < max_retries:
-            try:
-                # Her maç öncesi rastgele bekle
-                delay = get_random_delay()
-                logger.info(f"{delay:.1f} saniye bekleniyor...")
-                time.sleep(delay)
-                
-                # Çerezleri temizle
-                clear_cookies(driver, logger)
-                
-                # Ana pencere ID'sini kaydet
-                main_window = driver.current_window_handle
-                
-                # Maç elementine tıkla
-                logger.info(f"{i+1}. maça tıklanıyor... (Deneme {retry_count + 1}/{max_retries})")
-                element = elements[i]
-                driver.execute_script("arguments[0].click();", element)
-                
-                # Yeni sekmenin açılmasını bekle
-                WebDriverWait(driver, 5).until(lambda d: len(d.window_handles) > 1)
-                
-                # Yeni açılan sekmeye geç
-                new_window = [window for window in driver.window_handles if window != main_window][0]
-                driver.switch_to.window(new_window)
-                
-                # Takım isimlerini al
-                home_team = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 
-                    "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--home"))
-                ).text.strip()
-                
-                away_team = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 
-                    "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--away"))
-                ).text.strip()
-                
-                # Maç tarihini al
-                match_date = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 
-                    "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__info-container > p:nth-child(2) > span"))
-                ).text.strip()
-                
-                # Maç skorlarını al
-                home_scores, away_scores = get_match_scores(driver, logger)
-                
-                # Maç sonucunu belirle
-                home_result, away_result = get_match_result(home_scores['MS Gol'], away_scores['MS Gol'])
-                
-                # Sonuçları istatistiklere ekle
-                home_scores['Sonuç'] = home_result
-                away_scores['Sonuç'] = away_result
-                
-                logger.info(f"Maç: {home_team} vs {away_team} - Tarih: {match_date}")
-                
-                # İstatistik butonunu bekle ve tıkla
-                logger.info("İstatistik butonuna tıklanıyor...")
-                stats_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, 
-                    "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.widget-match-detail-submenu > div > a.widget-match-detail-submenu__icon.widget-match-detail-submenu__icon--stats"))
-                )
-                driver.execute_script("arguments[0].click();", stats_button)
-                
-                # İstatistik sayfasının yüklenmesini bekle
-                WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1"))
-                )
-                
-                # Tüm istatistikleri topla
-                home_stats = home_scores.copy()  # Skorları ekle
-                away_stats = away_scores.copy()  # Skorları ekle
-                
-                # Tab selectors
-                tab_selectors = [
-                    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[1]/a',
-                    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[2]/a',
-                    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[3]/a',
-                    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[4]/a',
-                    '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[5]/a'
-                ]
-                
-                # Her tab için istatistikleri topla
-                for tab_selector in tab_selectors:
-                    tab_stats = collect_stats_from_tab(driver, tab_selector, logger)
-                    # İstatistikleri ana sözlüklere ekle
-                    for stat_name, (home_value, away_value) in tab_stats.items():
-                        home_stats[stat_name] = home_value
-                        away_stats[stat_name] = away_value
-                
-                # İstatistikleri CSV'ye kaydet
-                save_match_stats(home_team, away_team, True, home_stats, match_date, logger)
-                save_match_stats(away_team, home_team, False, away_stats, match_date, logger)
-                
-                # Sekmeyi kapat ve ana pencereye geri dön
-                logger.info("Sekme kapatılıyor...")
-                driver.close()
-                driver.switch_to.window(main_window)
-                
-                break  # Başarılı işlem sonrası döngüden çık
-                
-            except Exception as e:
-                retry_count += 1
-                logger.error(f"{i+1}. maç işlenirken hata: {str(e)}")
-                
-                try:
-                    driver.quit()
-                except:
-                    pass
-                
-                logger.info("Tarayıcı yeniden başlatılıyor...")
-                driver = setup_driver()
-                
-                url = get_url()
-                logger.info(f"Ziyaret edilecek URL: {url}")
-                driver.get(url)
-                logger.info("Sayfa açıldı")
-                
-                time.sleep(random.uniform(5, 10))
-                
-                elements = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
-                )
-                
-                if retry_count >= max_retries:
-                    logger.error(f"{i+1}. maç için maksimum deneme sayısına ulaşıldı, sonraki maça geçiliyor")
-                    break
-
 def save_progress(current_index, match_date, logger):
     """İlerleme ve son maç tarihini kaydeder"""
     try:
         # İlerleme bilgisini kaydet
         progress_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'progress.txt')
-        with open(progress_file, 'w', encoding='utf-8') as f:
-            f.write(f"{current_index}\n{match_date}")
+        # Üçüncü satır ilerlemenin ait olduğu lig/sezondur; başka sezonda yok sayılır
+        staging.write_text(progress_file, f"{current_index}\n{match_date}\n{get_scope()}")
         logger.info(f"İlerleme kaydedildi: {current_index}. maç, Tarih: {match_date}")
         return True
     except Exception as e:
@@ -377,16 +307,19 @@ def load_progress(logger):
     """Kaydedilen ilerlemeyi ve son maç tarihini yükler"""
     try:
         progress_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'progress.txt')
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if len(lines) >= 2:
-                    current_index = int(lines[0].strip())
-                    last_match_date = lines[1].strip()
-                    logger.info(f"İlerleme yüklendi: {current_index}. maç, Son Tarih: {last_match_date}")
-                    return current_index, last_match_date
-                else:
-                    return 0, None
+        text = staging.read_text(progress_file)
+        if text is not None:
+            lines = text.splitlines()
+            if len(lines) >= 3 and lines[2].strip() != get_scope():
+                logger.info(f"İlerleme {lines[2].strip()} sezonuna ait, {get_scope()} baştan başlıyor")
+                return 0, None
+            if len(lines) >= 2:
+                current_index = int(lines[0].strip())
+                last_match_date = lines[1].strip()
+                logger.info(f"İlerleme yüklendi: {current_index}. maç, Son Tarih: {last_match_date}")
+                return current_index, last_match_date
+            else:
+                return 0, None
         return 0, None
     except Exception as e:
         logger.error(f"İlerleme yüklenirken hata: {str(e)}")
@@ -398,10 +331,9 @@ def schedule_next_run(target_date, logger):
         # Hedef tarihi ayarla (23:30)
         target_datetime = datetime.strptime(target_date, "%d.%m.%Y").replace(hour=23, minute=30)
         
-        # Cron job oluştur
-        current_file = os.path.abspath(__file__)
-        python_path = sys.executable
-        cron_command = f'30 23 {target_datetime.day} {target_datetime.month} * {python_path} {current_file}'
+        # Cron job oluştur; komut satırı seçenekleri (--league, --tabs, --sharded...) korunur
+        run_command = shlex.join([sys.executable] + restart_argv(sys.argv))
+        cron_command = f'30 23 {target_datetime.day} {target_datetime.month} * {run_command}'
         
         # Mevcut cron jobları al
         try:
@@ -436,7 +368,7 @@ def schedule_next_run(target_date, logger):
             # Alternatif olarak at komutu kullan
             try:
                 target_time = target_datetime.strftime("%Y%m%d2330")
-                at_command = f'echo "{python_path} {current_file}" | at {target_time}'
+                at_command = f'echo {shlex.quote(run_command)} | at {target_time}'
                 subprocess.run(at_command, shell=True, check=True)
                 
                 # Planlanan zamanı kaydet
@@ -488,32 +420,365 @@ def check_match_date(match_date, driver, logger):
         logger.error(f"Tarih kontrolü yapılırken hata: {str(e)}")
         return False
 
-def click_match_elements(driver, logger):
+def prepare_match(driver, logger):
+    """Açık maç sayfasından takımları, tarihi ve skorları okur, istatistik sayfasını açar
+
+    İstatistik widget'ının yüklenmesi beklenmez (finish_match bekler); BAY
+    maçlarında None döner.
+    """
+    # Takım isimlerini al
+    with span('match_header'):
+        home_team = wait_until(driver, 'home_team', 5,
+            EC.presence_of_element_located((By.CSS_SELECTOR, 
+            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--home"))
+        ).text.strip()
+    
+        away_team = wait_until(driver, 'away_team', 5,
+            EC.presence_of_element_located((By.CSS_SELECTOR, 
+            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--away"))
+        ).text.strip()
+    
+    if home_team == 'BAY' or away_team == 'BAY':
+        logger.info(f"BAY maçı atlanıyor: {home_team} vs {away_team}")
+        return None
+    
+    # Maç tarihini al
+    match_date = wait_until(driver, 'match_date', 5,
+        EC.presence_of_element_located((By.CSS_SELECTOR, 
+        "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__info-container > p:nth-child(2) > span"))
+    ).text.strip()
+    
+    # Tarih kontrolü yap
+    check_match_date(match_date, driver, logger)
+    
+    # Maç skorlarını al
+    with span('get_match_scores'):
+        home_scores, away_scores = get_match_scores(driver, logger)
+    
+    # Maç sonucunu belirle
+    home_result, away_result = get_match_result(home_scores['MS Gol'], away_scores['MS Gol'])
+    
+    # Sonuçları istatistiklere ekle
+    home_scores['Sonuç'] = home_result
+    away_scores['Sonuç'] = away_result
+    
+    logger.info(f"Maç: {home_team} vs {away_team} - Tarih: {match_date}")
+    
+    # İstatistik butonunu bekle ve tıkla
+    with span('open_stats'):
+        logger.info("İstatistik butonuna tıklanıyor...")
+        stats_button = wait_until(driver, 'stats_button', 5,
+            EC.element_to_be_clickable((By.CSS_SELECTOR, 
+            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.widget-match-detail-submenu > div > a.widget-match-detail-submenu__icon.widget-match-detail-submenu__icon--stats"))
+        )
+        driver.execute_script("arguments[0].click();", stats_button)
+    
+    return {
+        'home_team': home_team,
+        'away_team': away_team,
+        'match_date': match_date,
+        'home_scores': home_scores,
+        'away_scores': away_scores,
+    }
+
+def finish_match(driver, logger, match, stats_dir=None, table=None):
+    """prepare_match ile açılan istatistik sayfasını okuyup maçı kaydeder"""
+    home_team, away_team, match_date = match['home_team'], match['away_team'], match['match_date']
+    home_scores, away_scores = match['home_scores'], match['away_scores']
+    
+    # İstatistik sayfasının yüklenmesini bekle
+    with span('stats_widget'):
+        wait_until(driver, 'stats_widget', 5,
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1"))
+        )
+    
+    # Tüm istatistikleri topla
+    home_stats = home_scores.copy()  # Skorları ekle
+    away_stats = away_scores.copy()  # Skorları ekle
+    
+    with span('collect_match_stats'):
+        match_stats = collect_match_stats(driver, logger, f"{match_date}_{home_team}_{away_team}")
+    for stat_name, (home_value, away_value) in match_stats.items():
+        home_stats[stat_name] = home_value
+        away_stats[stat_name] = away_value
+    
+    # Maçı depoya tek satır olarak kaydet (takım görünümleri buradan türetilir)
+    with span('save_match'):
+        save_match(home_team, away_team, match_date, home_stats, away_stats, logger, stats_dir, config.LEAGUE)
+    
+    # Sonucu puan durumuna uygula (tablo birkaç maçta bir yazılır)
+    if table is not None and table.apply(home_team, away_team, match_date,
+                                         home_scores['MS Gol'], away_scores['MS Gol']):
+        save_if_due(table, logger)
+
+# Maç listesindeki bağlantılar (çoklu sekme modunda sekmeler doğrudan bu adreslerle açılır)
+_MATCH_LINKS_JS = """
+return Array.from(document.getElementsByClassName('p0c-competition-match-list__status')).map(element => {
+    const link = element.closest('a') || element.querySelector('a');
+    return link ? link.href : null;
+});
+"""
+
+def get_match_urls(driver, logger):
+    """Tüm maç bağlantılarını tek sorguda döndürür; eksik varsa None"""
+    try:
+        urls = driver.execute_script(_MATCH_LINKS_JS)
+    except Exception as e:
+        logger.warning(f"Maç bağlantıları okunamadı: {str(e)}")
+        return None
+    if not urls or not all(urls):
+        logger.warning("Bazı maçların bağlantısı bulunamadı, sekmeler tek tek açılacak")
+        return None
+    return urls
+
+def open_match_tab(driver, url, main_window):
+    """Maçı arka planda yeni sekmede açar ve sekmenin kimliğini döndürür"""
+    driver.switch_to.window(main_window)
+    before = set(driver.window_handles)
+    driver.execute_script("window.open(arguments[0], '_blank');", url)
+    wait_until(driver, 'new_window', 5, lambda d: len(d.window_handles) > len(before))
+    return next(handle for handle in driver.window_handles if handle not in before)
+
+def driver_alive(driver):
+    """Tarayıcı oturumu hâlâ yanıt veriyorsa True"""
+    try:
+        driver.window_handles
+        return True
+    except Exception:
+        return False
+
+def restart_driver(driver, logger):
+    """Tarayıcıyı kapatıp yeniden başlatır ve fikstür sayfasını açar"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    with span('recovery'):
+        logger.info("Tarayıcı yeniden başlatılıyor...")
+        driver = setup_driver()
+        url = get_url()
+        logger.info(f"Ziyaret edilecek URL: {url}")
+        driver.get(url)
+        logger.info("Sayfa açıldı")
+        time.sleep(random.uniform(5, 10))
+        wait_until(driver, 'match_list', 5,
+            EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
+        )
+    return driver
+
+def process_batch_in_tabs(driver, logger, batch, urls, tab_count, on_done, claimer=None, stats_dir=None, table=None):
+    """Bir maç grubunu tek tarayıcıda en fazla tab_count açık sekmeyle işler
+
+    Sekmeler sırayla açılır ve baştaki sekme işlenirken sonrakiler yüklenmeye
+    devam eder. Baştaki maçın istatistikleri okunmadan önce sıradaki sekmede
+    istatistik sayfası açılır; böylece widget yüklemesi de okumayla örtüşür.
+    on_done(indeks, tarih, tamamlandı) her maç bittiğinde (veya denemeler
+    tükendiğinde) çağrılır. Tarayıcı yanıt vermezse yeniden başlatılır ve
+    açık sekmelerdeki maçlar kuyruğa geri konur; grup hatayla yarıda kalırsa
+    tutulan kiralar bırakılır.
+    Dönüş: (sürücü, talep edilen maç sayısı); sürücü yeniden başlatılmış olabilir.
+    """
+    status = get_status()
+    main_window = driver.current_window_handle
+    pending = deque(batch)
+    open_tabs = deque()
+    retries = {}
+    held = set()
+    max_retries = 5
+    claimed = 0
+    # Gruptan sonra sezonda kalan maçlar; pending_matches tek sekmeli moddaki gibi sezonun kalanıdır
+    later = len(urls) - batch[-1] - 1 if len(batch) else 0
+    
+    def prepare(tab):
+        driver.switch_to.window(tab['handle'])
+        with span('prepare_match', index=tab['index']):
+            tab['match'] = prepare_match(driver, logger)
+        tab['prepared'] = True
+    
+    def close(tab):
+        try:
+            driver.switch_to.window(tab['handle'])
+            driver.close()
+        finally:
+            driver.switch_to.window(main_window)
+            status.set_queue('open_tabs', len(open_tabs))
+    
+    def done(i, match_date, completed):
+        held.discard(i)
+        on_done(i, match_date, completed)
+    
+    def failed(i, error):
+        """Denemeyi sayar; sınır aşılmadıysa maçı kuyruğun başına geri koyar"""
+        retries[i] = retries.get(i, 0) + 1
+        status.retry()
+        logger.error(f"{i+1}. maç işlenirken hata: {str(error)} (Deneme {retries[i]}/{max_retries})")
+        if retries[i] < max_retries:
+            pending.appendleft(i)
+        else:
+            logger.error(f"{i+1}. maç için maksimum deneme sayısına ulaşıldı, sonraki maça geçiliyor")
+            done(i, None, False)
+    
+    def recover():
+        """Tarayıcı çöktüyse yeniden başlatır; açık sekmelerdeki maçlar kuyruğa döner"""
+        nonlocal driver, main_window
+        pending.extendleft(reversed([tab['index'] for tab in open_tabs]))
+        open_tabs.clear()
+        status.set_queue('open_tabs', 0)
+        driver = restart_driver(driver, logger)
+        main_window = driver.current_window_handle
+    
+    try:
+        while pending or open_tabs:
+            # Sekme sayısını tamamla
+            while pending and len(open_tabs) < tab_count:
+                i = pending.popleft()
+                if claimer and i not in held:
+                    if not claimer.claim(match_unit(i)):
+                        continue
+                    held.add(i)
+                    claimed += 1
+                with span('delay'):
+                    time.sleep(get_random_delay())
+                clear_cookies(driver, logger)
+                try:
+                    with span('open_match', index=i):
+                        logger.info(f"{i+1}. maç yeni sekmede açılıyor...")
+                        handle = open_match_tab(driver, urls[i], main_window)
+                except Exception as e:
+                    failed(i, e)
+                    if not driver_alive(driver):
+                        recover()
+                    break
+                open_tabs.append({'index': i, 'handle': handle, 'match': None, 'prepared': False})
+                status.set_queue('open_tabs', len(open_tabs))
+            if not open_tabs:
+                continue
+            
+            head = open_tabs[0]
+            i = head['index']
+            status.match_started(i)
+            status.set_queue('pending_matches', len(pending) + len(open_tabs) + later)
+            try:
+                if not head['prepared']:
+                    prepare(head)
+                
+                # Sıradaki sekmenin istatistik sayfasını şimdiden aç
+                if len(open_tabs) > 1 and not open_tabs[1]['prepared']:
+                    try:
+                        prepare(open_tabs[1])
+                    except Exception as e:
+                        logger.warning(f"{open_tabs[1]['index']+1}. maç hazırlanamadı, sırası gelince denenecek: {str(e)}")
+                
+                driver.switch_to.window(head['handle'])
+                if head['match'] is not None:
+                    with span('finish_match', index=i):
+                        finish_match(driver, logger, head['match'], stats_dir, table)
+                
+            except Exception as e:
+                failed(i, e)
+            else:
+                if head['match'] is not None:
+                    status.match_completed()
+                done(i, head['match']['match_date'] if head['match'] else None, True)
+            
+            open_tabs.popleft()
+            try:
+                close(head)
+            except Exception as e:
+                logger.warning(f"{i+1}. maçın sekmesi kapatılamadı: {str(e)}")
+            if not driver_alive(driver):
+                recover()
+    finally:
+        # Grup yarıda kaldıysa işlenmeyen maçların kiraları başka düğümlere bırakılır
+        if claimer:
+            for i in held:
+                claimer.release(match_unit(i))
+    
+    return driver, claimed
+
+def click_match_elements(driver, logger, claimer=None, start_index=None, auto_advance=True):
     """Maç elementlerine tıklayıp istatistik sayfasına gider"""
+    table = None
     try:
         # Maç elementlerini bul
         logger.info("Maç elementleri aranıyor...")
-        elements = WebDriverWait(driver, 5).until(
+        elements = wait_until(driver, 'match_list', 5,
             EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
         )
         logger.info(f"Toplam {len(elements)} adet maç bulundu")
+        status = get_status()
+        status.set_season(config.LEAGUE, get_season(), len(elements))
+        
+        if claimer:
+            # Çoklu düğüm modunda ilerleme kira dosyalarında tutulur, her düğüm kendi klasörüne yazar
+            start_index, last_saved_date = 0, None
+            stats_dir = get_shard_dir(claimer.node_id)
+            logger.info(f"Çoklu düğüm modu: {claimer.node_id}")
+        else:
+            # Kaydedilen ilerlemeyi yükle (komut satırından verilen indeks önceliklidir)
+            saved_index, last_saved_date = load_progress(logger)
+            start_index = saved_index if start_index is None else start_index
+            stats_dir = None
+            logger.info(f"İşlem {start_index}. maçtan devam ediyor...")
+        # Puan durumu her sonuçla güncellenir (çoklu düğüm modunda birleştirme sonrası oluşturulur)
+        table = None if claimer else load_table(config.LEAGUE, get_season())
+        total_matches = len(elements)
         
-        # Kaydedilen ilerlemeyi yükle
-        start_index, last_saved_date = load_progress(logger)
-        logger.info(f"İşlem {start_index}. maçtan devam ediyor...")
+        # Çoklu sekme modu: maçlar bağlantılarıyla doğrudan sekmelerde açılır
+        urls = get_match_urls(driver, logger) if config.TAB_COUNT > 1 else None
+        if urls:
+            logger.info(f"Çoklu sekme modu: {config.TAB_COUNT} sekme")
+        finished = set()
+        next_index = start_index
+        
+        def match_done(i, match_date, completed):
+            """Çoklu sekme modunda biten maçı kaydeder; ilerleme ilk bitmemiş maça göre tutulur"""
+            nonlocal next_index, last_saved_date
+            if claimer:
+                if completed:
+                    claimer.complete(match_unit(i))
+                else:
+                    claimer.fail(match_unit(i), "Maksimum deneme sayısına ulaşıldı")
+                return
+            finished.add(i)
+            last_saved_date = match_date or last_saved_date
+            while next_index in finished:
+                next_index += 1
+            save_progress(next_index, last_saved_date, logger)
         
         # Her 10 maçta bir tarayıcıyı yenile ve uzun bekle
         while start_index < len(elements):
-            for i in range(start_index, min(start_index + 10, len(elements))):
+            # Çoklu düğüm modunda hiç maç alınmayan gruplar için tarayıcı yeniden başlatılmaz
+            batch_claimed = claimer is None
+            batch = range(start_index, min(start_index + 10, len(elements)))
+            if urls:
+                driver, tab_claimed = process_batch_in_tabs(driver, logger, batch, urls, config.TAB_COUNT,
+                                                            match_done, claimer, stats_dir, table)
+                if tab_claimed:
+                    batch_claimed = True
+                # Grup sekmelerde işlendi, tek sekmeli döngü atlanır
+                batch = ()
+            for i in batch:
                 retry_count = 0
                 max_retries = 5
                 
+                # Başka düğümün işlediği veya tamamlanmış maçları atla
+                if claimer:
+                    if not claimer.claim(match_unit(i)):
+                        continue
+                    batch_claimed = True
+                
+                status.match_started(i)
+                status.set_queue('pending_matches', len(elements) - i)
+                begin('match', index=i)
+                
                 while retry_count < max_retries:
                     try:
                         # Her maç öncesi rastgele bekle
-                        delay = get_random_delay()
-                        logger.info(f"{delay:.1f} saniye bekleniyor...")
-                        time.sleep(delay)
+                        with span('delay'):
+                            delay = get_random_delay()
+                            logger.info(f"{delay:.1f} saniye bekleniyor...")
+                            time.sleep(delay)
                         
                         # Çerezleri temizle
                         clear_cookies(driver, logger)
@@ -522,107 +787,53 @@ def click_match_elements(driver, logger):
                         main_window = driver.current_window_handle
                         
                         # Maç elementine tıkla
-                        logger.info(f"{i+1}. maça tıklanıyor... (Deneme {retry_count + 1}/{max_retries})")
-                        element = elements[i]
-                        driver.execute_script("arguments[0].click();", element)
-                        
-                        # Yeni sekmenin açılmasını bekle
-                        WebDriverWait(driver, 5).until(lambda d: len(d.window_handles) > 1)
+                        with span('open_match', index=i):
+                            logger.info(f"{i+1}. maça tıklanıyor... (Deneme {retry_count + 1}/{max_retries})")
+                            element = elements[i]
+                            driver.execute_script("arguments[0].click();", element)
                         
-                        # Yeni açılan sekmeye geç
-                        new_window = [window for window in driver.window_handles if window != main_window][0]
-                        driver.switch_to.window(new_window)
+                            # Yeni sekmenin açılmasını bekle
+                            wait_until(driver, 'new_window', 5, lambda d: len(d.window_handles) > 1)
                         
-                        # Takım isimlerini al
-                        home_team = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 
-                            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--home"))
-                        ).text.strip()
+                            # Yeni açılan sekmeye geç
+                            new_window = [window for window in driver.window_handles if window != main_window][0]
+                            driver.switch_to.window(new_window)
                         
-                        away_team = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 
-                            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__row > a.p0c-soccer-match-details-header__team-name.p0c-soccer-match-details-header__team-name--away"))
-                        ).text.strip()
+                        # Maç başlığını ve skorları oku, istatistik sayfasını aç
+                        match = prepare_match(driver, logger)
                         
                         # BAY kontrolü
-                        if home_team == 'BAY' or away_team == 'BAY':
-                            logger.info(f"BAY maçı atlanıyor: {home_team} vs {away_team}")
+                        if match is None:
                             driver.close()
                             driver.switch_to.window(main_window)
-                            save_progress(i + 1, last_saved_date, logger)
+                            if claimer:
+                                claimer.complete(match_unit(i))
+                            else:
+                                save_progress(i + 1, last_saved_date, logger)
                             break
+                        match_date = match['match_date']
                         
-                        # Maç tarihini al
-                        match_date = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 
-                            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.p0c-soccer-match-details-header > div > div.p0c-soccer-match-details-header__info-container > p:nth-child(2) > span"))
-                        ).text.strip()
-                        
-                        # Tarih kontrolü yap
-                        check_match_date(match_date, driver, logger)
-                        
-                        # Maç skorlarını al
-                        home_scores, away_scores = get_match_scores(driver, logger)
-                        
-                        # Maç sonucunu belirle
-                        home_result, away_result = get_match_result(home_scores['MS Gol'], away_scores['MS Gol'])
-                        
-                        # Sonuçları istatistiklere ekle
-                        home_scores['Sonuç'] = home_result
-                        away_scores['Sonuç'] = away_result
-                        
-                        logger.info(f"Maç: {home_team} vs {away_team} - Tarih: {match_date}")
-                        
-                        # İstatistik butonunu bekle ve tıkla
-                        logger.info("İstatistik butonuna tıklanıyor...")
-                        stats_button = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, 
-                            "body > div.page-container.page-container--legacy-link-banner-visible > div.above-content.clearfix > div.widget-match-detail-submenu > div > a.widget-match-detail-submenu__icon.widget-match-detail-submenu__icon--stats"))
-                        )
-                        driver.execute_script("arguments[0].click();", stats_button)
-                        
-                        # İstatistik sayfasının yüklenmesini bekle
-                        WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "#widget-match-live-stats-1"))
-                        )
-                        
-                        # Tüm istatistikleri topla
-                        home_stats = home_scores.copy()  # Skorları ekle
-                        away_stats = away_scores.copy()  # Skorları ekle
-                        
-                        # Tab selectors
-                        tab_selectors = [
-                            '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[1]/a',
-                            '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[2]/a',
-                            '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[3]/a',
-                            '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[4]/a',
-                            '//*[@id="widget-match-live-stats-1"]/div/div/div/div/ul/li[5]/a'
-                        ]
-                        
-                        # Her tab için istatistikleri topla
-                        for tab_selector in tab_selectors:
-                            tab_stats = collect_stats_from_tab(driver, tab_selector, logger)
-                            # İstatistikleri ana sözlüklere ekle
-                            for stat_name, (home_value, away_value) in tab_stats.items():
-                                home_stats[stat_name] = home_value
-                                away_stats[stat_name] = away_value
-                        
-                        # İstatistikleri CSV'ye kaydet
-                        save_match_stats(home_team, away_team, True, home_stats, match_date, logger)
-                        save_match_stats(away_team, home_team, False, away_stats, match_date, logger)
+                        # Tüm istatistikleri topla ve kaydet
+                        finish_match(driver, logger, match, stats_dir, table)
                         
                         # Sekmeyi kapat ve ana pencereye geri dön
                         logger.info("Sekme kapatılıyor...")
                         driver.close()
                         driver.switch_to.window(main_window)
                         
+                        status.match_completed()
+                        
                         # Her maçtan sonra ilerlemeyi ve tarihi kaydet
-                        save_progress(i + 1, match_date, logger)
+                        if claimer:
+                            claimer.complete(match_unit(i))
+                        else:
+                            save_progress(i + 1, match_date, logger)
                         
                         break  # Başarılı işlem sonrası döngüden çık
                         
                     except Exception as e:
                         retry_count += 1
+                        status.retry()
                         logger.error(f"{i+1}. maç işlenirken hata: {str(e)} (Deneme {retry_count}/{max_retries})")
                         
                         try:
@@ -631,61 +842,99 @@ def click_match_elements(driver, logger):
                             pass
                         
                         if retry_count < max_retries:
-                            logger.info("Tarayıcı yeniden başlatılıyor...")
-                            driver = setup_driver()
+                            with span('recovery', index=i):
+                                logger.info("Tarayıcı yeniden başlatılıyor...")
+                                driver = setup_driver()
                             
-                            url = get_url()
-                            logger.info(f"Ziyaret edilecek URL: {url}")
-                            driver.get(url)
-                            logger.info("Sayfa açıldı")
+                                url = get_url()
+                                logger.info(f"Ziyaret edilecek URL: {url}")
+                                driver.get(url)
+                                logger.info("Sayfa açıldı")
                             
-                            time.sleep(random.uniform(5, 10))
+                                time.sleep(random.uniform(5, 10))
                             
-                            elements = WebDriverWait(driver, 5).until(
-                                EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
-                            )
+                                elements = wait_until(driver, 'match_list', 5,
+                                    EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
+                                )
                         else:
                             logger.error(f"{i+1}. maç için maksimum deneme sayısına ulaşıldı, sonraki maça geçiliyor")
-                            save_progress(i + 1, match_date if 'match_date' in locals() else last_saved_date, logger)
+                            if claimer:
+                                claimer.fail(match_unit(i), str(e))
+                            else:
+                                save_progress(i + 1, match_date if 'match_date' in locals() else last_saved_date, logger)
+                
+                end('match', index=i)
             
-            if start_index + 10 < len(elements):
+            if start_index + 10 < len(elements) and batch_claimed:
                 logger.info("10 maç tamamlandı, uzun bekleme yapılıyor...")
                 # 10 maç sonrası 5-10 saniye arası bekle
                 wait_time = random.uniform(5, 10)
                 logger.info(f"{wait_time:.1f} saniye bekleniyor...")
                 time.sleep(wait_time)
                 
-                logger.info("Tarayıcı yeniden başlatılıyor...")
-                driver.quit()
+                with span('batch_restart'):
+                    logger.info("Tarayıcı yeniden başlatılıyor...")
+                    driver.quit()
                 
-                # Yeni oturum başlatmadan önce de bekle
-                time.sleep(random.uniform(5, 10))
+                    # Yeni oturum başlatmadan önce de bekle
+                    time.sleep(random.uniform(5, 10))
                 
-                driver = setup_driver()
-                logger.info("Firefox başarıyla yeniden başlatıldı")
+                    driver = setup_driver()
+                    logger.info("Firefox başarıyla yeniden başlatıldı")
                 
-                url = get_url()
-                logger.info(f"Ziyaret edilecek URL: {url}")
-                driver.get(url)
-                logger.info("Sayfa açıldı")
+                    url = get_url()
+                    logger.info(f"Ziyaret edilecek URL: {url}")
+                    driver.get(url)
+                    logger.info("Sayfa açıldı")
                 
-                time.sleep(get_random_delay())
+                    time.sleep(get_random_delay())
                 
-                elements = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
-                )
+                    elements = wait_until(driver, 'match_list', 5,
+                        EC.presence_of_all_elements_located((By.CLASS_NAME, "p0c-competition-match-list__status"))
+                    )
             
             start_index += 10
         
+        # Kalan puan durumu değişikliklerini yaz (yeniden başlatma atexit çalıştırmaz)
+        if table is not None and table.unsaved:
+            save_table(table, logger)
+        
+        if claimer:
+            # Tüm birimler tamamlandıysa çıktıları birleştir ve sezonu ilerlet
+            units = [match_unit(i) for i in range(total_matches)]
+            if not claimer.all_done(units):
+                logger.info("Kalan maçlar diğer düğümlerde işleniyor")
+                return
+            failed = claimer.failed_units(units)
+            if failed:
+                logger.warning(f"{len(failed)} maç başarısız olarak işaretlendi ve atlandı: {', '.join(failed)} "
+                               f"(yeniden denemek için {claimer.lease_dir} altındaki .failed dosyalarını silin)")
+            # Birleştirme ve puan durumu sezon kirasını alan tek düğümde yapılır
+            unit = season_unit(get_season())
+            if claimer.claim(unit):
+                if not merge_shards(logger):
+                    claimer.release(unit)
+                    return
+                rebuild_table(config.LEAGUE, get_season(), logger)
+                claimer.complete(unit)
+            elif not claimer.is_done(unit):
+                logger.info("Sezon çıktıları başka düğümde birleştiriliyor")
+                return
+            if auto_advance and update_season_config(logger, season=get_season()):
+                logger.info("Tarayıcı kapatılıyor...")
+                driver.quit()
+                restart_application(logger)
+            return
+        
         # Tüm maçlar tamamlandığında progress.txt dosyasını sil
         try:
             progress_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'progress.txt')
-            if os.path.exists(progress_file):
-                os.remove(progress_file)
+            if staging.exists(progress_file):
+                staging.remove(progress_file)
                 logger.info("İlerleme dosyası silindi")
                 
                 # Sezon bilgilerini güncelle
-                if update_season_config(logger):
+                if auto_advance and update_season_config(logger, season=get_season()):
                     # Tarayıcıyı kapat
                     logger.info("Tarayıcı kapatılıyor...")
                     driver.quit()
@@ -700,49 +949,9 @@ def click_match_elements(driver, logger):
     except Exception as e:
         logger.error(f"Maç elementleri işlenirken hata oluştu: {str(e)}")
         raise
-
-def update_season_config(logger):
-    """Sezon bilgilerini günceller"""
-    try:
-        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.py')
-        with open(config_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Mevcut sezon değerlerini al
-        current_start = None
-        current_end = None
-        
-        for line in lines:
-            if 'SEASON_START = ' in line:
-                current_start = line.split('"')[1]
-            elif 'SEASON_END = ' in line:
-                current_end = line.split('"')[1]
-        
-        # 2010-2011 sezonuna ulaşıldıysa programı sonlandır
-        if current_start == "2014" and current_end == "2015":
-            logger.info("2014-2015 sezonuna ulaşıldı. Program sonlandırılıyor...")
-            sys.exit(0)
-            
-        # Sezon değerlerini güncelle
-        for i, line in enumerate(lines):
-            if 'SEASON_START = ' in line:
-                current_year = line.split('"')[1]
-                new_year = str(int(current_year) - 1)
-                lines[i] = f'SEASON_START = "{new_year}"\n'
-            elif 'SEASON_END = ' in line:
-                current_year = line.split('"')[1]
-                new_year = str(int(current_year) - 1)
-                lines[i] = f'SEASON_END = "{new_year}"\n'
-        
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-            
-        logger.info(f"Sezon bilgileri güncellendi: {new_year}-{str(int(new_year) + 1)}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Sezon bilgileri güncellenirken hata: {str(e)}")
-        return False
+    finally:
+        if table is not None and table.unsaved:
+            save_table(table, logger)
 
 def save_last_match_date(match_date, logger):
     """Son maç tarihini kaydeder"""
@@ -767,27 +976,72 @@ def get_last_match_date(logger):
         logger.error(f"Son maç tarihi okunurken hata: {str(e)}")
     return None
 
+# Yalnızca ilk çalıştırmaya ait seçenekler (değer alan, almayan)
+_ONE_SHOT_OPTIONS = {'--start-index': True, '--reset-progress': False}
+
+def restart_argv(argv):
+    """Yeniden başlatma için argümanları döndürür; tek seferlik seçenekler çıkarılır"""
+    args = [os.path.abspath(argv[0])] if argv else [os.path.abspath(__file__)]
+    skip = False
+    for arg in argv[1:]:
+        if skip:
+            skip = False
+            continue
+        name = arg.split('=', 1)[0]
+        if name in _ONE_SHOT_OPTIONS:
+            skip = _ONE_SHOT_OPTIONS[name] and '=' not in arg
+            continue
+        args.append(arg)
+    return args
+
 def restart_application(logger):
     """Uygulamayı yeniden başlatır"""
     try:
         logger.info("Uygulama yeniden başlatılıyor...")
+        # exec atexit işleyicilerini çalıştırmaz; tampon boşaltılır ve trace dosyası kapatılır
+        staging.flush()
+        disable_tracing()
         python = sys.executable
-        script_path = os.path.abspath(__file__)
-        os.execl(python, python, script_path)
+        # Komut satırı seçenekleri (--league, --tabs, --sharded...) korunur
+        os.execv(python, [python] + restart_argv(sys.argv))
     except Exception as e:
         logger.error(f"Uygulama yeniden başlatılırken hata: {str(e)}")
 
-def main():
-    """Ana program fonksiyonu"""
-    logger = get_logger()
+def enable_sd_mode(logger):
+    """SD kart modu açıksa tmpfs tamponunu ve periyodik boşaltmayı başlatır"""
+    if SD_MODE:
+        staging.enable_staging(VOLATILE_DIR, FLUSH_INTERVAL, logger)
+
+def reset_progress(logger):
+    """Kaydedilen ilerlemeyi siler"""
+    enable_sd_mode(logger)
+    progress_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'progress.txt')
+    if staging.exists(progress_file):
+        staging.remove(progress_file)
+        logger.info("İlerleme dosyası sıfırlandı")
+
+def main(claimer=None, start_index=None, auto_advance=True):
+    """Ana program fonksiyonu
+
+    auto_advance: sezon bitince config.py güncellenip uygulama yeniden başlatılır
+    """
+    if claimer is None and SHARDED_MODE:
+        claimer = WorkClaimer(get_scope())
+    # Log dosyasını yalnızca toplama giriş noktası sıfırlar (çoklu düğümde düğüme özel dosya)
+    logger = get_logger(session=True, node_id=claimer.node_id if claimer else None)
+    if TRACE_PATH:
+        enable_tracing(TRACE_PATH)
+    enable_sd_mode(logger)
+    status_server = start_status_server(STATUS_PORT, logger) if STATUS_PORT else None
     try:
         driver = setup_driver()
         url = get_url()
         logger.info(f"Ziyaret edilecek URL: {url}")
-        driver.get(url)
+        with span('navigate', url=url):
+            driver.get(url)
         logger.info("Sayfa açıldı")
         
-        click_match_elements(driver, logger)
+        click_match_elements(driver, logger, claimer, start_index, auto_advance)
     except Exception as e:
         logger.error(f"Program çalışırken hata: {str(e)}")
     finally:
@@ -795,6 +1049,9 @@ def main():
             driver.quit()
         except:
             pass
+        if status_server:
+            status_server.shutdown()
+            status_server.server_close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
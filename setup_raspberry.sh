@@ -53,6 +53,7 @@ apt-get install -y python3-pip \
     git \
     python3-venv \
     wget \
+    curl \
     tar
 
 # Geckodriver kurulumu
@@ -172,6 +173,9 @@ Environment=DISPLAY=:99
 Environment=PYTHONUNBUFFERED=1
 Environment=PATH=/usr/local/bin:/usr/bin:/bin
 Environment=MOZ_HEADLESS=1
+Environment=SCRAPER_SD_MODE=1
+Environment=SCRAPER_VOLATILE_DIR=/dev/shm/football-scraper
+Environment=SCRAPER_FLUSH_INTERVAL=300
 WorkingDirectory=${WORK_DIR}
 ExecStart=${WORK_DIR}/venv/bin/python3 ${WORK_DIR}/scraper.py
 Restart=always
@@ -0,0 +1,289 @@
+"""
+staging.py - SD kart dostu yazma: tmpfs üzerinde tampon, karta toplu yazım
+
+enable_staging() çağrılmadıkça write_text/read_text doğrudan diske yazar ve
+okur. Etkinleştirildiğinde:
+
+    - Maç deposu satırları tmpfs üzerindeki bir günlük dosyasına (pending/)
+      eklenir, kalıcı dosyaya periyodik olarak tek seferde eklenir. Eklemeden
+      önce kalıcı dosyanın boyutu (applying/) kaydedilir; ekleme ile günlüğün
+      silinmesi arasında kesilen bir boşaltma tekrarlandığında satırlar iki
+      kez eklenmez
+    - İlerleme ve puan durumu gibi sık değişen dosyaların güncel hali tmpfs'te
+      (files/) tutulur, karta yalnızca boşaltma sırasında atomik olarak yazılır;
+      boşaltılan kopyalar silinir, sonraki okumalar kalıcı dosyadan yapılır
+      (SD kart modu dışında çalışan komutların yazdıkları gölgelenmez)
+    - Boşaltma her FLUSH_INTERVAL saniyede, çıkışta ve SIGTERM alındığında yapılır
+
+Tampon tmpfs'te durduğundan süreç çökse bile kaybolmaz; bir sonraki
+başlangıçta kalan kayıtlar karta yazılır.
+"""
+
+import os
+import csv
+import atexit
+import signal
+import threading
+from urllib.parse import quote, unquote
+
+from status_server import get_status
+
+_writer = None
+
+def _key(path):
+    """Kalıcı dosya yolunu tmpfs'teki dosya adına (geri çevrilebilir) dönüştürür"""
+    return quote(os.path.abspath(path), safe='')
+
+def _write_durable(path, data, sync=True):
+    """Veriyi geçici dosyaya yazıp (sync ise diske aktarıp) tek adımda hedefin yerine koyar"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+class StagedWriter:
+    """tmpfs'te biriken yazmaları kalıcı dosyalara toplu olarak aktarır"""
+
+    def __init__(self, volatile_dir, logger):
+        self.volatile_dir = volatile_dir
+        self.logger = logger
+        self.pending_dir = os.path.join(volatile_dir, 'pending')
+        self.files_dir = os.path.join(volatile_dir, 'files')
+        self.applying_dir = os.path.join(volatile_dir, 'applying')
+        for directory in (self.pending_dir, self.files_dir, self.applying_dir):
+            os.makedirs(directory, exist_ok=True)
+        # Günlüğü silinmiş (boşaltması tamamlanmış) eklemelerin kayıtları temizlenir
+        for name in os.listdir(self.applying_dir):
+            if not os.path.exists(os.path.join(self.pending_dir, name)):
+                os.remove(os.path.join(self.applying_dir, name))
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        # Önceki oturumdan kalan tüm kayıtlar boşaltılmamış kabul edilir
+        self._pending_rows = {name: self._count_rows(name) for name in os.listdir(self.pending_dir)}
+        self._dirty = set()
+        for name in os.listdir(self.files_dir):
+            if not name.endswith('.tmp') and self._is_newer(name):
+                self._dirty.add(name)
+            else:
+                # Kalıcı dosya daha yeni (ör. SD kart modu dışında değiştirildi)
+                os.remove(os.path.join(self.files_dir, name))
+        self._update_status()
+
+    def _is_newer(self, name):
+        """tmpfs'teki kopya kalıcı dosyadan yeniyse True"""
+        path = unquote(name)
+        return not os.path.exists(path) or \
+            os.path.getmtime(os.path.join(self.files_dir, name)) > os.path.getmtime(path)
+
+    def _count_rows(self, name):
+        with open(os.path.join(self.pending_dir, name), 'r', encoding='utf-8', newline='') as f:
+            return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+    def pending_writes(self):
+        """Karta yazılmayı bekleyen satır ve dosya sayısı"""
+        with self._lock:
+            return sum(self._pending_rows.values()) + len(self._dirty)
+
+    def _update_status(self):
+        get_status().set_queue('pending_writes', self.pending_writes())
+
+    def append_rows(self, path, fieldnames, rows):
+        """CSV satırlarını kalıcı dosyaya eklenmek üzere tmpfs günlüğüne yazar"""
+        name = _key(path)
+        journal = os.path.join(self.pending_dir, name)
+        with self._lock:
+            new_journal = not os.path.exists(journal)
+            with open(journal, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if new_journal:
+                    # Kalıcı dosya henüz yoksa başlık buradan alınır
+                    writer.writerow(fieldnames)
+                writer.writerows(rows)
+            self._pending_rows[name] = self._pending_rows.get(name, 0) + len(rows)
+            self._update_status()
+
+    def write_text(self, path, text):
+        with self._lock:
+            name = _key(path)
+            target = os.path.join(self.files_dir, name)
+            with open(f"{target}.tmp", 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(f"{target}.tmp", target)
+            self._dirty.add(name)
+            self._update_status()
+
+    def read_text(self, path):
+        with self._lock:
+            name = _key(path)
+            # Yalnızca henüz karta yazılmamış kopya kalıcı dosyadan önceliklidir
+            staged = os.path.join(self.files_dir, name)
+            if name in self._dirty:
+                with open(staged, 'r', encoding='utf-8') as f:
+                    return f.read()
+        return _read_durable(path)
+
+    def remove(self, path):
+        with self._lock:
+            name = _key(path)
+            staged = os.path.join(self.files_dir, name)
+            if os.path.exists(staged):
+                os.remove(staged)
+            self._dirty.discard(name)
+            if os.path.exists(path):
+                os.remove(path)
+            self._update_status()
+
+    def exists(self, path):
+        """Dosya kalıcı olarak veya tamponda varsa True"""
+        name = _key(path)
+        return os.path.exists(path) or name in self._pending_rows or name in self._dirty
+
+    def _start_offset(self, name, path):
+        """Günlüğün eklenmeye başlandığı kalıcı dosya boyutunu döndürür (-1: dosya yoktu)
+
+        Önceki bir boşaltmadan kayıt varsa o kullanılır; yoksa güncel boyut
+        eklemeden önce kaydedilir.
+        """
+        marker = os.path.join(self.applying_dir, name)
+        try:
+            with open(marker, 'r', encoding='utf-8') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            pass
+        offset = os.path.getsize(path) if os.path.exists(path) else -1
+        with open(marker, 'w', encoding='utf-8') as f:
+            f.write(str(offset))
+        return offset
+
+    def _apply_journal(self, name):
+        """Günlüğü kalıcı dosyaya ekler; daha önce (kısmen) eklendiyse yalnızca eksik kısmı yazar"""
+        journal = os.path.join(self.pending_dir, name)
+        path = unquote(name)
+        with open(journal, 'rb') as f:
+            header = f.readline()
+            body = f.read()
+        offset = self._start_offset(name, path)
+        if offset < 0 or not os.path.exists(path):
+            # Dosya bu günlükle oluşturuldu; tamamı atomik olarak yeniden yazılır
+            _write_durable(path, header + body)
+        else:
+            with open(path, 'r+b') as f:
+                f.seek(offset)
+                tail = f.read(len(body))
+                if tail != body:
+                    # Kesilmiş eklemenin devamı yazılır, dosya başka türlü değiştiyse sona eklenir
+                    missing = body[len(tail):] if body.startswith(tail) else body
+                    f.seek(0, os.SEEK_END)
+                    # Tek seferde, tek yazma çağrısıyla eklenir
+                    f.write(missing)
+                    f.flush()
+                    os.fsync(f.fileno())
+        os.remove(journal)
+        os.remove(os.path.join(self.applying_dir, name))
+
+    def flush(self):
+        """Biriken tüm yazmaları karta aktarır"""
+        with self._lock:
+            rows = 0
+            for name in sorted(self._pending_rows):
+                self._apply_journal(name)
+                rows += self._pending_rows[name]
+            self._pending_rows.clear()
+
+            for name in sorted(self._dirty):
+                staged = os.path.join(self.files_dir, name)
+                with open(staged, 'rb') as f:
+                    _write_durable(unquote(name), f.read())
+                os.remove(staged)
+            files = len(self._dirty)
+            self._dirty.clear()
+            self._update_status()
+
+        if rows or files:
+            self.logger.info(f"Tampon karta yazıldı: {rows} satır, {files} dosya")
+        return rows + files
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Tampon boşaltılırken hata: {str(e)}")
+
+    def start(self, interval):
+        """Periyodik boşaltmayı arka planda başlatır"""
+        self._thread = threading.Thread(target=self._run, args=(interval,), name='staging-flush', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Periyodik boşaltmayı durdurur ve kalan yazmaları aktarır"""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception as e:
+            self.logger.error(f"Tampon boşaltılırken hata: {str(e)}")
+
+def _read_durable(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _handle_sigterm(signum, frame):
+    # SystemExit atexit işleyicilerini (ve dolayısıyla close) çalıştırır
+    raise SystemExit(128 + signum)
+
+def enable_staging(volatile_dir, interval, logger):
+    """SD kart modunu başlatır; önceki oturumdan kalan tampon hemen boşaltılır"""
+    global _writer
+    if _writer is None:
+        _writer = StagedWriter(volatile_dir, logger)
+        _writer.flush()
+        _writer.start(interval)
+        atexit.register(_writer.close)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, _handle_sigterm)
+        logger.info(f"SD kart modu: geçici dosyalar {volatile_dir}, boşaltma aralığı {interval} sn")
+    return _writer
+
+def is_enabled():
+    return _writer is not None
+
+def flush():
+    """Tamponu hemen boşaltır (ör. uygulama yeniden başlatılmadan önce)"""
+    if _writer is not None:
+        _writer.flush()
+
+def append_rows(path, fieldnames, rows):
+    """SD kart modunda satırları tampona ekler (mod kapalıysa kullanılmaz)"""
+    _writer.append_rows(path, fieldnames, rows)
+
+def write_text(path, text):
+    """Metni dosyaya atomik olarak yazar; SD kart modunda tmpfs'e yazılıp sonra aktarılır"""
+    if _writer is not None:
+        _writer.write_text(path, text)
+        return
+    _write_durable(path, text.encode('utf-8'), sync=False)
+
+def read_text(path):
+    """Dosyanın güncel içeriğini döndürür (tampondaki hali öncelikli), yoksa None"""
+    if _writer is not None:
+        return _writer.read_text(path)
+    return _read_durable(path)
+
+def remove(path):
+    """Dosyayı (ve tampondaki halini) siler"""
+    if _writer is not None:
+        _writer.remove(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+def exists(path):
+    if _writer is not None:
+        return _writer.exists(path)
+    return os.path.exists(path)
@@ -0,0 +1,262 @@
+"""
+standings.py - Toplanan sonuçlardan artımlı puan durumu
+
+Her (lig, sezon) için puan tablosu bellekte tutulur ve her yeni maç sonucu
+yalnızca iki takımın satırını güncelleyerek (O(1)) uygulanır. Her takım için
+tarih sıralı kümülatif satırlar saklandığından "X tarihindeki puan durumu"
+geçmiş yeniden okunmadan ikili arama ile bulunur. Tablolar
+standings/<lig>_<sezon>.json dosyasına her maçta değil SAVE_EVERY maçta bir
+ve sezon/çalışma sonunda yazılır.
+"""
+
+import os
+import json
+from bisect import bisect_left, bisect_right
+
+import staging
+from config import SHARED_DIR
+from stats_reader import date_key, season_range
+
+# Kümülatif satır alanları
+COLUMNS = ['O', 'G', 'B', 'M', 'AG', 'YG', 'P']
+PLAYED, WON, DRAWN, LOST, GOALS_FOR, GOALS_AGAINST, POINTS = range(len(COLUMNS))
+
+# İkili (head-to-head) kayıt alanları: puan, atılan, yenilen
+H2H_POINTS, H2H_FOR, H2H_AGAINST = range(3)
+
+# Eşitlik bozma sırası: 'puan', 'averaj', 'atilan', 'ikili'
+# ('ikili': yalnızca eşit takımlar arasındaki maçlardan puan, averaj, atılan gol)
+TIE_BREAKERS = {
+    'premier-lig': ('puan', 'averaj', 'atilan', 'ikili'),
+    'super-lig': ('puan', 'ikili', 'averaj', 'atilan'),
+}
+DEFAULT_TIE_BREAKERS = ('puan', 'averaj', 'atilan', 'ikili')
+
+# Tablo bu kadar yeni sonuçta bir diske yazılır (kalanlar save_table ile)
+SAVE_EVERY = 10
+
+def get_standings_dir():
+    """Puan durumu klasörünü oluşturur"""
+    standings_dir = os.path.join(SHARED_DIR, 'standings')
+    os.makedirs(standings_dir, exist_ok=True)
+    return standings_dir
+
+def get_table_file(league, season):
+    return os.path.join(get_standings_dir(), f"{league}_{season}.json")
+
+def _add(target, delta):
+    for index, value in enumerate(delta):
+        target[index] += value
+
+class _Timeline:
+    """Tarih sıralı kümülatif satırlar; son satır güncel toplamdır"""
+
+    __slots__ = ('dates', 'rows')
+
+    def __init__(self, dates=None, rows=None):
+        self.dates = dates or []
+        self.rows = rows or []
+
+    def add(self, day, delta):
+        """Değişimi verilen tarihe ve sonraki tüm satırlara ekler
+
+        Maçlar tarih sırasıyla geldiğinde yalnızca son satır güncellenir veya
+        yeni satır eklenir (O(1)); daha eski bir tarih gelirse sonraki satırlar
+        da düzeltilir.
+        """
+        if not self.dates or day > self.dates[-1]:
+            base = self.rows[-1] if self.rows else [0] * len(delta)
+            self.dates.append(day)
+            self.rows.append([a + b for a, b in zip(base, delta)])
+            return
+        position = bisect_left(self.dates, day)
+        if self.dates[position] != day:
+            base = self.rows[position - 1] if position else [0] * len(delta)
+            self.dates.insert(position, day)
+            self.rows.insert(position, list(base))
+        for row in self.rows[position:]:
+            _add(row, delta)
+
+    def as_of(self, day=None):
+        """Verilen tarihteki (dahil) kümülatif satırı döndürür"""
+        if day is None:
+            return self.rows[-1] if self.rows else None
+        position = bisect_right(self.dates, day)
+        return self.rows[position - 1] if position else None
+
+class LeagueTable:
+    """Bir lig ve sezon için artımlı puan tablosu"""
+
+    def __init__(self, league, season, tie_breakers=None):
+        self.league = league
+        self.season = season
+        self.tie_breakers = tuple(tie_breakers or TIE_BREAKERS.get(league, DEFAULT_TIE_BREAKERS))
+        self.teams = {}
+        self.h2h = {}
+        self.applied = set()
+        self.unsaved = 0
+
+    def apply(self, home_team, away_team, match_date, home_goals, away_goals):
+        """Maç sonucunu tabloya uygular; aynı maç ikinci kez sayılmaz"""
+        key = (match_date, home_team, away_team)
+        if key in self.applied:
+            return False
+        home_goals, away_goals = int(home_goals), int(away_goals)
+        day = date_key(match_date)
+
+        for team, opponent, scored, conceded in ((home_team, away_team, home_goals, away_goals),
+                                                 (away_team, home_team, away_goals, home_goals)):
+            won, drawn, lost = scored > conceded, scored == conceded, scored < conceded
+            points = 3 if won else (1 if drawn else 0)
+            self.teams.setdefault(team, _Timeline()).add(
+                day, [1, int(won), int(drawn), int(lost), scored, conceded, points])
+            self.h2h.setdefault((team, opponent), _Timeline()).add(day, [points, scored, conceded])
+
+        self.applied.add(key)
+        self.unsaved += 1
+        return True
+
+    def _totals(self, day):
+        totals = {}
+        for team, timeline in self.teams.items():
+            row = timeline.as_of(day)
+            totals[team] = list(row) if row else [0] * len(COLUMNS)
+        return totals
+
+    def _mini_league(self, group, day):
+        """Eşit takımlar arasındaki maçlardan (puan, averaj, atılan) değerleri"""
+        values = {}
+        for team in group:
+            total = [0, 0, 0]
+            for opponent in group:
+                timeline = self.h2h.get((team, opponent))
+                row = timeline.as_of(day) if timeline else None
+                if row:
+                    _add(total, row)
+            values[team] = (total[H2H_POINTS], total[H2H_FOR] - total[H2H_AGAINST], total[H2H_FOR])
+        return values
+
+    def _rank(self, group, totals, criteria, day):
+        """Takımları ölçütlere göre sıralar; eşit kalan gruplar sonraki ölçüte geçer"""
+        if len(group) < 2 or not criteria:
+            return sorted(group)
+        criterion, rest = criteria[0], criteria[1:]
+        if criterion == 'ikili':
+            values = self._mini_league(group, day)
+        elif criterion == 'averaj':
+            values = {team: totals[team][GOALS_FOR] - totals[team][GOALS_AGAINST] for team in group}
+        elif criterion == 'atilan':
+            values = {team: totals[team][GOALS_FOR] for team in group}
+        elif criterion == 'puan':
+            values = {team: totals[team][POINTS] for team in group}
+        else:
+            raise ValueError(f"Bilinmeyen eşitlik ölçütü: {criterion}")
+
+        ordered = []
+        buckets = {}
+        for team in group:
+            buckets.setdefault(values[team], []).append(team)
+        for value in sorted(buckets, reverse=True):
+            ordered += self._rank(buckets[value], totals, rest, day)
+        return ordered
+
+    def standings(self, as_of=None):
+        """Sıralı puan durumunu döndürür; as_of 'gg.aa.yyyy' verilirse o tarihteki tablo"""
+        day = date_key(as_of) if as_of else None
+        totals = self._totals(day)
+        ordered = self._rank(list(totals), totals, self.tie_breakers, day)
+        table = []
+        for position, team in enumerate(ordered, 1):
+            row = totals[team]
+            entry = {'Sıra': position, 'Takım': team}
+            entry.update(zip(COLUMNS, row))
+            entry['AV'] = row[GOALS_FOR] - row[GOALS_AGAINST]
+            table.append(entry)
+        return table
+
+    def to_dict(self):
+        return {
+            'league': self.league,
+            'season': self.season,
+            'tie_breakers': list(self.tie_breakers),
+            'teams': {team: [t.dates, t.rows] for team, t in self.teams.items()},
+            'h2h': [[team, opponent, t.dates, t.rows] for (team, opponent), t in self.h2h.items()],
+            'applied': sorted(self.applied),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        table = cls(data['league'], data['season'], data.get('tie_breakers'))
+        table.teams = {team: _Timeline(dates, rows) for team, (dates, rows) in data['teams'].items()}
+        table.h2h = {(team, opponent): _Timeline(dates, rows) for team, opponent, dates, rows in data['h2h']}
+        table.applied = {tuple(key) for key in data['applied']}
+        return table
+
+def load_table(league, season):
+    """Kayıtlı tabloyu yükler, yoksa boş tablo döndürür"""
+    text = staging.read_text(get_table_file(league, season))
+    if text is None:
+        return LeagueTable(league, season)
+    return LeagueTable.from_dict(json.loads(text))
+
+def save_table(table, logger):
+    """Tabloyu atomik olarak kaydeder (SD kart modunda tampon üzerinden)"""
+    try:
+        staging.write_text(get_table_file(table.league, table.season),
+                           json.dumps(table.to_dict(), ensure_ascii=False))
+        table.unsaved = 0
+        return True
+
+    except Exception as e:
+        logger.error(f"Puan durumu kaydedilirken hata: {str(e)}")
+        return False
+
+def save_if_due(table, logger):
+    """Kaydedilmemiş sonuç sayısı SAVE_EVERY'ye ulaştıysa tabloyu yazar"""
+    if table.unsaved >= SAVE_EVERY:
+        return save_table(table, logger)
+    return True
+
+def rebuild_table(league, season, logger, store_file=None):
+    """Tabloyu maç deposundaki sezon maçlarından yeniden oluşturur
+
+    Yalnızca bu ligin maçları kullanılır. Lig sütunu boş olan (eski
+    sürümlerden aktarılan) maçlar için kayıtlı tablo varsa onun takımları
+    ölçüt alınır, yoksa sezon aralığındaki bu maçların tümü kullanılır.
+    """
+    from match_store import iter_store, HOME_PREFIX, AWAY_PREFIX, LEAGUE_COLUMN
+
+    try:
+        teams = set(load_table(league, season).teams)
+        season_from, season_to = season_range(season)
+        table = LeagueTable(league, season)
+        for row in iter_store(store_file):
+            if not season_from <= date_key(row['Tarih']) <= season_to:
+                continue
+            if row.get(LEAGUE_COLUMN):
+                if row[LEAGUE_COLUMN] != league:
+                    continue
+            elif teams and (row['Ev Sahibi'] not in teams or row['Deplasman'] not in teams):
+                continue
+            try:
+                table.apply(row['Ev Sahibi'], row['Deplasman'], row['Tarih'],
+                            row[HOME_PREFIX + 'MS Gol'], row[AWAY_PREFIX + 'MS Gol'])
+            except ValueError:
+                logger.warning(f"Skoru okunamayan maç atlandı: {row['Tarih']} {row['Ev Sahibi']} - {row['Deplasman']}")
+
+        save_table(table, logger)
+        logger.info(f"{league} {season} puan durumu {len(table.applied)} maçtan oluşturuldu")
+        return table
+
+    except Exception as e:
+        logger.error(f"Puan durumu oluşturulurken hata: {str(e)}")
+        return None
+
+def format_table(rows):
+    """Puan durumunu metin tablosu olarak biçimlendirir"""
+    width = max([len(row['Takım']) for row in rows] + [5])
+    lines = [f"{'#':>2}  {'Takım':<{width}}  {'O':>2} {'G':>2} {'B':>2} {'M':>2} {'AG':>3} {'YG':>3} {'AV':>4} {'P':>3}"]
+    for row in rows:
+        lines.append(f"{row['Sıra']:>2}  {row['Takım']:<{width}}  {row['O']:>2} {row['G']:>2} {row['B']:>2} "
+                     f"{row['M']:>2} {row['AG']:>3} {row['YG']:>3} {row['AV']:>+4} {row['P']:>3}")
+    return '\n'.join(lines)
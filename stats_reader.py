@@ -0,0 +1,245 @@
+"""
+stats_reader.py - İstatistik dosyaları için akış tabanlı, filtrelenebilir okuyucu
+
+Satırlar tek tek üretilir (generator); bellek kullanımı geçmişin büyüklüğünden
+bağımsızdır. Takım filtresi dosya seçimine, tarih/sezon/rakip/saha filtreleri
+ise satır sözlüğe dönüştürülmeden önce ham CSV satırına uygulanır. Maç
+deposundan okurken takım bakış açısı yalnızca istenen sütunlar için türetilir.
+"""
+
+import os
+import csv
+import glob
+
+from csv_handler import ALL_STATS_HEADERS, create_stats_folder
+from match_store import MATCH_STATS, HOME_PREFIX, AWAY_PREFIX, STORE_FILE, get_result
+
+TEAM_COLUMN = 'Takım'
+
+VENUES = {
+    'home': 'Ev Sahibi',
+    'away': 'Deplasman',
+    'Ev Sahibi': 'Ev Sahibi',
+    'Deplasman': 'Deplasman',
+}
+
+def date_key(match_date):
+    """'gg.aa.yyyy' tarihini karşılaştırılabilir 'yyyyaagg' anahtarına çevirir"""
+    return match_date[6:10] + match_date[3:5] + match_date[0:2]
+
+def season_range(season):
+    """'2023-2024' sezonunu (başlangıç, bitiş) tarih anahtarlarına çevirir"""
+    start_year, end_year = season.split('-')
+    return f"{start_year}0701", f"{end_year}0630"
+
+def date_range(season=None, date_from=None, date_to=None):
+    """Tarih ve sezon filtrelerini (başlangıç, bitiş) tarih anahtarlarına çevirir; sezon aralığı daraltır"""
+    date_from = date_key(date_from) if date_from else None
+    date_to = date_key(date_to) if date_to else None
+    if season:
+        season_from, season_to = season_range(season)
+        date_from = max(date_from or season_from, season_from)
+        date_to = min(date_to or season_to, season_to)
+    return date_from, date_to
+
+def to_float(value):
+    """CSV değerini sayıya çevirir ('55%' -> 55.0), çevrilemezse NaN"""
+    try:
+        return float(str(value).replace('%', '').replace(',', '.'))
+    except ValueError:
+        return float('nan')
+
+def _header_index(header):
+    """Başlık adından sütun indeksine eşleme (tekrarlanan başlıkta sonuncusu geçerli)"""
+    return {name: index for index, name in enumerate(header)}
+
+class _ReadPlan:
+    """Projeksiyon ve filtrelerin bir dosya başlığına göre derlenmiş hali"""
+
+    def __init__(self, teams, columns, date_from, date_to, season, opponent, venue):
+        self.teams = set(teams) if teams else None
+        self.columns = list(columns) if columns else None
+        self.date_from, self.date_to = date_range(season, date_from, date_to)
+        self.opponents = {opponent} if isinstance(opponent, str) else set(opponent or ())
+        if venue and venue not in VENUES:
+            raise ValueError(f"Geçersiz saha filtresi: {venue}")
+        self.venue = VENUES.get(venue) if venue else None
+
+    def accepts_date(self, match_date):
+        """Tarih filtresini ham tarih değerine uygular"""
+        if self.date_from or self.date_to:
+            key = date_key(match_date)
+            if self.date_from and key < self.date_from:
+                return False
+            if self.date_to and key > self.date_to:
+                return False
+        return True
+
+    def accepts_side(self, team_name, opponent, venue):
+        """Takım, rakip ve saha filtrelerini uygular"""
+        if self.teams and team_name not in self.teams:
+            return False
+        if self.opponents and opponent not in self.opponents:
+            return False
+        if self.venue and venue != self.venue:
+            return False
+        return True
+
+    def _check_columns(self, names, available):
+        """Bilinmeyen sütun istenmişse hata verir"""
+        unknown = [name for name in names if name not in available and name != TEAM_COLUMN]
+        if unknown:
+            raise KeyError(f"Bilinmeyen sütun(lar): {', '.join(unknown)}")
+        return names
+
+    def bind_team_file(self, header):
+        """Takım dosyası başlığına göre projeksiyonu indekslere çözümler"""
+        index = _header_index(header)
+        names = self.columns or [name for name in index if name != TEAM_COLUMN] + [TEAM_COLUMN]
+        self._check_columns(names, index)
+        projection = [(name, index.get(name)) for name in names]
+        return projection, index['Tarih'], index['Rakip'], index['Ev Sahibi/Deplasman']
+
+    def bind_store(self, header):
+        """Maç deposu başlığına göre her iki taraf için projeksiyon üretir
+
+        Projeksiyon öğeleri (sütun, tür, değer) biçimindedir; tür 'idx' ise
+        değer ham satırdaki indeks, 'const' ise sabit, 'result' ise
+        (atılan gol indeksi, yenilen gol indeksi) çiftidir.
+        """
+        index = _header_index(header)
+        names = self.columns or list(dict.fromkeys(ALL_STATS_HEADERS)) + [TEAM_COLUMN]
+        self._check_columns(names, set(ALL_STATS_HEADERS))
+        sides = []
+        for own, other, team_col, opponent_col, venue in (
+                (HOME_PREFIX, AWAY_PREFIX, 'Ev Sahibi', 'Deplasman', 'Ev Sahibi'),
+                (AWAY_PREFIX, HOME_PREFIX, 'Deplasman', 'Ev Sahibi', 'Deplasman')):
+            sources = {
+                TEAM_COLUMN: ('idx', index[team_col]),
+                'Tarih': ('idx', index['Tarih']),
+                'Rakip': ('idx', index[opponent_col]),
+                'Ev Sahibi/Deplasman': ('const', venue),
+                'MS Yenilen Gol': ('idx', index[other + 'MS Gol']),
+                'İY Yenilen Gol': ('idx', index[other + 'İY Gol']),
+                'Sonuç': ('result', (index[own + 'MS Gol'], index[other + 'MS Gol'])),
+            }
+            for stat in MATCH_STATS:
+                sources[stat] = ('idx', index[own + stat])
+            projection = [(name,) + sources[name] for name in names]
+            sides.append((index[team_col], index[opponent_col], venue, projection))
+        return index['Tarih'], sides
+
+def _project_store_row(row, projection):
+    """Ham maç satırından bir takımın bakış açısıyla yalnızca istenen sütunları üretir"""
+    result = {}
+    for name, kind, value in projection:
+        if kind == 'idx':
+            result[name] = row[value]
+        elif kind == 'const':
+            result[name] = value
+        else:
+            result[name] = get_result(row[value[0]], row[value[1]])
+    return result
+
+def _iter_team_files(plan, stats_dir):
+    """Takım bazlı CSV dosyalarından satır üretir"""
+    stats_dir = stats_dir or create_stats_folder()
+    if plan.teams:
+        files = [(team_name, os.path.join(stats_dir, f"{team_name}.csv")) for team_name in sorted(plan.teams)]
+    else:
+        files = [(os.path.splitext(os.path.basename(csv_file))[0], csv_file)
+                 for csv_file in sorted(glob.glob(os.path.join(stats_dir, '*.csv')))]
+
+    for team_name, csv_file in files:
+        if not os.path.exists(csv_file):
+            continue
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                continue
+            projection, date_idx, opponent_idx, venue_idx = plan.bind_team_file(header)
+            for row in reader:
+                if not row or not plan.accepts_date(row[date_idx]):
+                    continue
+                if not plan.accepts_side(team_name, row[opponent_idx], row[venue_idx]):
+                    continue
+                yield {name: (team_name if idx is None else row[idx]) for name, idx in projection}
+
+def _iter_store_files(plan, store_files):
+    """Maç deposu dosyalarından takım bakış açısıyla satır üretir"""
+    # Birden fazla shard aynı maçı içerebilir; maç anahtarına göre tekilleştir
+    seen = set() if len(store_files) > 1 else None
+    for store_file in store_files:
+        with open(store_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                continue
+            date_idx, sides = plan.bind_store(header)
+            for row in reader:
+                if not row or not plan.accepts_date(row[date_idx]):
+                    continue
+                if seen is not None:
+                    key = (row[date_idx], row[sides[0][0]], row[sides[1][0]])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                for team_idx, opponent_idx, venue, projection in sides:
+                    if plan.accepts_side(row[team_idx], row[opponent_idx], venue):
+                        yield _project_store_row(row, projection)
+
+def _team_backend(plan, stats_dir):
+    return _iter_team_files(plan, stats_dir)
+
+def _matches_backend(plan, stats_dir):
+    store_file = os.path.join(stats_dir or create_stats_folder(), 'matches', STORE_FILE)
+    return _iter_store_files(plan, [store_file] if os.path.exists(store_file) else [])
+
+def _shards_backend(plan, stats_dir):
+    shard_root = os.path.join(stats_dir or create_stats_folder(), 'shards')
+    return _iter_store_files(plan, sorted(glob.glob(os.path.join(shard_root, '*', STORE_FILE))))
+
+def _auto_backend(plan, stats_dir):
+    """Maç deposu varsa onu, yoksa eski takım dosyalarını kullanır"""
+    store_file = os.path.join(stats_dir or create_stats_folder(), 'matches', STORE_FILE)
+    if os.path.exists(store_file):
+        return _matches_backend(plan, stats_dir)
+    return _team_backend(plan, stats_dir)
+
+BACKENDS = {
+    'auto': _auto_backend,
+    'matches': _matches_backend,
+    'teams': _team_backend,
+    'shards': _shards_backend,
+}
+
+def iter_matches(teams=None, columns=None, date_from=None, date_to=None, season=None,
+                 opponent=None, venue=None, backend='auto', stats_dir=None):
+    """Filtrelenmiş maç satırlarını takım bakış açısıyla sözlük olarak tek tek üretir
+
+    teams: takım adı listesi (None: tüm takımlar)
+    columns: döndürülecek sütunlar (None: tümü + 'Takım')
+    date_from/date_to: 'gg.aa.yyyy' (dahil), season: '2023-2024'
+    opponent: rakip adı veya listesi, venue: 'home'/'away'
+    backend: 'auto', 'matches', 'teams' veya 'shards'
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen depolama türü: {backend}")
+    if isinstance(teams, str):
+        teams = [teams]
+    plan = _ReadPlan(teams, columns, date_from, date_to, season, opponent, venue)
+    yield from BACKENDS[backend](plan, stats_dir)
+
+def iter_chunks(chunk_size=1000, as_frame=False, **filters):
+    """iter_matches çıktısını sabit boyutlu parçalar (liste veya DataFrame) halinde üretir"""
+    if as_frame:
+        import pandas as pd
+    chunk = []
+    for row in iter_matches(**filters):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield pd.DataFrame(chunk) if as_frame else chunk
+            chunk = []
+    if chunk:
+        yield pd.DataFrame(chunk) if as_frame else chunk
@@ -0,0 +1,133 @@
+"""
+status_server.py - Çalışan scraper için yerel HTTP durum uç noktası
+
+Scraper ilerlemesini (lig/sezon, maç sırası, kayan pencerelerde maç/dakika,
+sürücü yaşı, yeniden deneme/başlatma sayıları, kuyruk derinlikleri) bellekte
+tutar ve http://127.0.0.1:<port>/status adresinden JSON olarak sunar.
+
+queues.pending_matches, tek ve çoklu sekme modunda aynı anlamdadır: sezonda
+işlenmekte olan maç dahil henüz bitmemiş maç sayısı.
+"""
+
+import json
+import time
+import threading
+from collections import deque
+
+# Maç/dakika hesaplanan kayan pencereler (dakika)
+RATE_WINDOWS = (1, 5, 15)
+
+class ScraperStatus:
+    """Scraper durumunu iş parçacığı güvenli şekilde tutar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.league = None
+        self.season = None
+        self.match_index = 0
+        self.total_matches = 0
+        self.completed = 0
+        self.driver_started_at = None
+        self.driver_starts = 0
+        self.retries = 0
+        self.queues = {}
+        self._completions = deque()
+
+    def set_season(self, league, season, total_matches):
+        with self._lock:
+            self.league = league
+            self.season = season
+            self.total_matches = total_matches
+
+    def match_started(self, index):
+        with self._lock:
+            self.match_index = index
+
+    def match_completed(self):
+        now = time.time()
+        with self._lock:
+            self.completed += 1
+            self._completions.append(now)
+            self._prune(now)
+
+    def driver_started(self):
+        with self._lock:
+            self.driver_started_at = time.time()
+            self.driver_starts += 1
+
+    def retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def set_queue(self, name, depth):
+        with self._lock:
+            self.queues[name] = depth
+
+    def _prune(self, now):
+        """En büyük pencereden eski tamamlanma zamanlarını atar"""
+        oldest = now - max(RATE_WINDOWS) * 60
+        while self._completions and self._completions[0] < oldest:
+            self._completions.popleft()
+
+    def snapshot(self):
+        """Durumu JSON'a uygun sözlük olarak döndürür"""
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            rates = {}
+            for minutes in RATE_WINDOWS:
+                since = now - minutes * 60
+                count = sum(1 for completed_at in self._completions if completed_at >= since)
+                rates[f"{minutes}m"] = round(count / minutes, 2)
+            return {
+                'league': self.league,
+                'season': self.season,
+                'match_index': self.match_index,
+                'total_matches': self.total_matches,
+                'completed': self.completed,
+                'matches_per_minute': rates,
+                'uptime_seconds': round(now - self.started_at),
+                'driver_age_seconds': round(now - self.driver_started_at) if self.driver_started_at else None,
+                'driver_restarts': max(self.driver_starts - 1, 0),
+                'retries': self.retries,
+                'queues': dict(self.queues),
+            }
+
+_status = ScraperStatus()
+
+def get_status():
+    """Süreç genelinde paylaşılan durum nesnesini döndürür"""
+    return _status
+
+def start_status_server(port, logger, status=None, host='127.0.0.1'):
+    """Durum uç noktasını arka planda çalışan bir iş parçacığında başlatır"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    status = status or _status
+
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') not in ('', '/status'):
+                self.send_error(404)
+                return
+            body = json.dumps(status.snapshot(), ensure_ascii=False, indent=2).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"Durum isteği: {format % args}")
+
+    try:
+        server = ThreadingHTTPServer((host, port), StatusHandler)
+    except OSError as e:
+        logger.warning(f"Durum sunucusu başlatılamadı ({host}:{port}): {str(e)}")
+        return None
+
+    thread = threading.Thread(target=server.serve_forever, name='status-server', daemon=True)
+    thread.start()
+    logger.info(f"Durum sunucusu: http://{host}:{port}/status")
+    return server
@@ -0,0 +1,49 @@
+import os
+import re
+import shutil
+import logging
+import runpy
+
+import pytest
+
+import config
+
+CONFIG_FILE = os.path.abspath(config.__file__)
+logger = logging.getLogger('test')
+
+def _copy_config(tmp_path, start=None):
+    target = tmp_path / 'config.py'
+    shutil.copy(CONFIG_FILE, target)
+    if start is not None:
+        text = target.read_text(encoding='utf-8')
+        text = re.sub(r'(?m)^SEASON_START = "\d{4}"', f'SEASON_START = "{start}"', text)
+        text = re.sub(r'(?m)^SEASON_END = "\d{4}"', f'SEASON_END = "{start + 1}"', text)
+        target.write_text(text, encoding='utf-8')
+    return target
+
+def test_update_season_config_moves_to_previous_season(tmp_path):
+    target = _copy_config(tmp_path)
+    before = runpy.run_path(str(target))
+
+    assert config.update_season_config(logger, str(target))
+
+    after = runpy.run_path(str(target))
+    assert int(after['SEASON_START']) == int(before['SEASON_START']) - 1
+    assert int(after['SEASON_END']) == int(before['SEASON_END']) - 1
+    # set_season içindeki atama satırı değişmeden kalır
+    assert '    SEASON_START, SEASON_END = start, end\n' in target.read_text(encoding='utf-8')
+
+def test_update_season_config_stops_at_last_season(tmp_path):
+    target = _copy_config(tmp_path, start=2014)
+
+    with pytest.raises(SystemExit):
+        config.update_season_config(logger, str(target))
+    assert runpy.run_path(str(target))['SEASON_START'] == "2014"
+
+def test_update_season_config_advances_finished_season_once(tmp_path):
+    target = _copy_config(tmp_path, start=2020)
+
+    assert config.update_season_config(logger, str(target), season='2020-2021')
+    # Aynı dosyayı paylaşan ikinci işlem sezonu tekrar geriletmez
+    assert config.update_season_config(logger, str(target), season='2020-2021')
+    assert runpy.run_path(str(target))['SEASON_START'] == "2019"
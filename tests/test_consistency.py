@@ -0,0 +1,95 @@
+import csv
+import logging
+
+import pandas as pd
+
+from consistency import run_checks
+from csv_handler import ALL_STATS_HEADERS
+from match_store import build_match_row, get_result, _write_atomic, MATCH_HEADERS
+
+logger = logging.getLogger('test')
+
+DETAILS = {'Topla Oynama': '50%', 'Toplam Şut': '10', 'İsabetli Şut': '4', 'Toplam Pas': '400',
+           'İsabetli Pas': '300', 'Korner': '5'}
+
+def _team_row(match_date, opponent, venue, scored, conceded, details=True):
+    row = {header: '0' for header in ALL_STATS_HEADERS}
+    row.update(DETAILS if details else {})
+    row.update({'Tarih': match_date, 'Rakip': opponent, 'Ev Sahibi/Deplasman': venue,
+                'MS Gol': str(scored), 'MS Yenilen Gol': str(conceded),
+                'Sonuç': get_result(scored, conceded)})
+    return [row[header] for header in ALL_STATS_HEADERS]
+
+def _write_team(stats_dir, team_name, rows):
+    with open(stats_dir / f"{team_name}.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(ALL_STATS_HEADERS)
+        writer.writerows(rows)
+
+def _store_row(match_date, home, away, home_goals, away_goals, details=True):
+    extra = DETAILS if details else {}
+    row = build_match_row(home, away, match_date, dict(extra, **{'MS Gol': str(home_goals)}),
+                          dict(extra, **{'MS Gol': str(away_goals)}))
+    return [row[header] for header in MATCH_HEADERS]
+
+def test_planted_problems_are_reported(tmp_path):
+    stats_dir = tmp_path / 'stats'
+    stats_dir.mkdir()
+    _write_team(stats_dir, 'Arsenal', [
+        _team_row('01.09.2023', 'Chelsea', 'Ev Sahibi', 2, 1),
+        # Everton dosyasında karşılığı yok
+        _team_row('15.09.2023', 'Everton', 'Ev Sahibi', 3, 0),
+    ])
+    _write_team(stats_dir, 'Chelsea', [
+        _team_row('01.09.2023', 'Arsenal', 'Deplasman', 1, 2),
+        # Aynı maç iki kez yazılmış
+        _team_row('01.09.2023', 'Arsenal', 'Deplasman', 1, 2),
+        _team_row('22.09.2023', 'Liverpool', 'Ev Sahibi', 0, 0, details=False),
+    ])
+    _write_team(stats_dir, 'Liverpool', [
+        _team_row('08.09.2023', 'Everton', 'Ev Sahibi', 1, 0),
+        _team_row('22.09.2023', 'Chelsea', 'Deplasman', 0, 0, details=False),
+    ])
+    _write_team(stats_dir, 'Everton', [
+        # Liverpool dosyasındaki skorla (1-0) uyuşmuyor
+        _team_row('08.09.2023', 'Liverpool', 'Deplasman', 0, 2),
+    ])
+
+    store_file = str(tmp_path / 'matches.csv')
+    _write_atomic(store_file, MATCH_HEADERS, [
+        _store_row('01.09.2023', 'Arsenal', 'Chelsea', 2, 1),
+        _store_row('01.09.2023', 'Arsenal', 'Chelsea', 2, 1),
+        _store_row('22.09.2023', 'Chelsea', 'Liverpool', 0, 0, details=False),
+    ])
+    output = str(tmp_path / 'rescrape.csv')
+
+    issues = run_checks(logger, output=output, stats_dir=str(stats_dir), store_file=store_file)
+
+    assert set(issues.itertuples(index=False, name=None)) == {
+        ('01.09.2023', 'Arsenal', 'Chelsea', 'teams', 'tekrar'),
+        ('08.09.2023', 'Liverpool', 'Everton', 'teams', 'ayna_skor'),
+        ('15.09.2023', 'Arsenal', 'Everton', 'teams', 'ayna_eksik'),
+        ('22.09.2023', 'Chelsea', 'Liverpool', 'teams', 'supheli_0_0'),
+        ('01.09.2023', 'Arsenal', 'Chelsea', 'matches', 'tekrar'),
+        ('22.09.2023', 'Chelsea', 'Liverpool', 'matches', 'supheli_0_0'),
+    }
+
+    rescrape = pd.read_csv(output, dtype=str)
+    assert rescrape.values.tolist() == [
+        ['01.09.2023', 'Arsenal', 'Chelsea', 'tekrar'],
+        ['08.09.2023', 'Liverpool', 'Everton', 'ayna_skor'],
+        ['15.09.2023', 'Arsenal', 'Everton', 'ayna_eksik'],
+        ['22.09.2023', 'Chelsea', 'Liverpool', 'supheli_0_0'],
+    ]
+
+def test_clean_data_has_no_issues(tmp_path):
+    stats_dir = tmp_path / 'stats'
+    stats_dir.mkdir()
+    _write_team(stats_dir, 'Arsenal', [_team_row('01.09.2023', 'Chelsea', 'Ev Sahibi', 2, 1)])
+    _write_team(stats_dir, 'Chelsea', [_team_row('01.09.2023', 'Arsenal', 'Deplasman', 1, 2)])
+    output = str(tmp_path / 'rescrape.csv')
+
+    issues = run_checks(logger, source='teams', output=output, stats_dir=str(stats_dir))
+
+    assert issues.empty
+    assert list(pd.read_csv(output).columns) == ['Tarih', 'Ev Sahibi', 'Deplasman', 'Sorunlar']
@@ -0,0 +1,82 @@
+import os
+import logging
+
+import numpy as np
+
+import csv_handler
+import features
+from features import update_features, load_features, _append_npy, _files_consistent
+from match_store import build_match_row, _write_atomic, MATCH_HEADERS
+
+logger = logging.getLogger('test')
+
+TEAMS = ['Arsenal', 'Chelsea', 'Liverpool', 'Everton']
+
+def _matches(count):
+    """Tarih sırasıyla, istatistikleri maçtan maça değişen örnek maçlar"""
+    rows = []
+    for n in range(count):
+        home, away = TEAMS[n % 4], TEAMS[(n + 1 + n // 4) % 4]
+        if home == away:
+            away = TEAMS[(n + 2) % 4]
+        row = build_match_row(home, away, f"{n + 1:02d}.09.2023",
+                              {'MS Gol': str(n % 3), 'Topla Oynama': f"{50 + n}%", 'Toplam Şut': str(10 + n)},
+                              {'MS Gol': str(n % 2), 'Topla Oynama': f"{50 - n}%", 'Toplam Şut': str(8 - n % 5)})
+        rows.append([row[header] for header in MATCH_HEADERS])
+    return rows
+
+def _use_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(features, 'SHARED_DIR', str(tmp_path))
+    monkeypatch.setattr(csv_handler, 'SHARED_DIR', str(tmp_path))
+    store_file = tmp_path / 'stats' / 'matches' / 'matches.csv'
+    store_file.parent.mkdir(parents=True)
+    return str(store_file)
+
+def _snapshot():
+    X, y, index = load_features()
+    return np.array(X), np.array(y), index
+
+def test_incremental_update_matches_full_rebuild(tmp_path, monkeypatch):
+    store_file = _use_dir(tmp_path, monkeypatch)
+    rows = _matches(12)
+
+    for count in (5, 9, 12):
+        _write_atomic(store_file, MATCH_HEADERS, rows[:count])
+        assert update_features(logger)
+    X, y, index = _snapshot()
+
+    assert update_features(logger, rebuild=True)
+    X_full, y_full, index_full = _snapshot()
+
+    assert X.shape == (12, len(features.feature_names()))
+    np.testing.assert_array_equal(X, X_full)
+    np.testing.assert_array_equal(y, y_full)
+    assert index == index_full
+
+def test_appended_npy_stays_memory_mappable(tmp_path):
+    path = str(tmp_path / 'X.npy')
+    batches = [np.arange(6, dtype=np.float32).reshape(2, 3) + 10 * n for n in range(4)]
+    for batch in batches:
+        _append_npy(path, batch, np.float32)
+        mapped = np.load(path, mmap_mode='r')
+        assert isinstance(mapped, np.memmap)
+
+    np.testing.assert_array_equal(np.load(path, mmap_mode='r'), np.concatenate(batches))
+
+def test_half_written_index_triggers_rebuild(tmp_path, monkeypatch):
+    store_file = _use_dir(tmp_path, monkeypatch)
+    _write_atomic(store_file, MATCH_HEADERS, _matches(6))
+    assert update_features(logger)
+    features_dir = features.get_features_dir()
+
+    # Güncelleme indeksin son satırını yazamadan kesilmiş gibi
+    index_file = os.path.join(features_dir, 'index.csv')
+    with open(index_file, encoding='utf-8') as f:
+        lines = f.readlines()
+    with open(index_file, 'w', encoding='utf-8') as f:
+        f.writelines(lines[:-1])
+    assert not _files_consistent(features_dir, 6)
+
+    assert update_features(logger)
+    assert _files_consistent(features_dir, 6)
+    assert len(load_features()[2]) == 6
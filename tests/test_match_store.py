@@ -0,0 +1,20 @@
+import csv
+import logging
+
+from match_store import MATCH_HEADERS, LEAGUE_COLUMN, upgrade_store_header, iter_store
+
+logger = logging.getLogger('test')
+
+def test_legacy_store_gets_league_column(tmp_path):
+    store_file = str(tmp_path / 'matches.csv')
+    legacy = [header for header in MATCH_HEADERS if header != LEAGUE_COLUMN]
+    with open(store_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(legacy)
+        writer.writerow(['01.09.2023', 'A', 'B'] + ['1'] * (len(legacy) - 3))
+
+    upgrade_store_header(store_file, logger)
+
+    rows = list(iter_store(store_file))
+    assert list(rows[0]) == MATCH_HEADERS
+    assert rows[0][LEAGUE_COLUMN] == '' and rows[0]['Ev Sahibi'] == 'A'
@@ -0,0 +1,109 @@
+import os
+import shutil
+import logging
+import threading
+from urllib.request import urlopen
+
+import pytest
+
+import opta_capture
+from opta_capture import OPTA_FEED_PATTERNS, parse_payload, payload_server, collect_stats_from_network, fetch_payload
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'opta_matchstats.jsonp')
+
+logger = logging.getLogger('test')
+
+class StubDriver:
+    """Resource Timing kayıtları yerel sunucuyu gösteren sahte tarayıcı"""
+
+    def __init__(self, entries, session_fetch=True):
+        self.entries = entries
+        self.session_fetch = session_fetch
+        self.fetched = []
+
+    def execute_script(self, script, *args):
+        if script == opta_capture._FIND_FEEDS_JS:
+            return [name for name in self.entries if any(pattern in name for pattern in args[0])]
+        return 'stub-agent'
+
+    def execute_async_script(self, script, url):
+        self.fetched.append(url)
+        if not self.session_fetch:
+            return None
+        with urlopen(url) as response:
+            return response.read().decode('utf-8')
+
+@pytest.fixture
+def feed_server(tmp_path, monkeypatch):
+    """Kayıtlı yanıtı matchstats yolunda sunar; yerel adres besleme desenlerine eklenir"""
+    feed_dir = tmp_path / 'soccerdata' / 'matchstats' / 'outlet'
+    feed_dir.mkdir(parents=True)
+    shutil.copy(FIXTURE, feed_dir / 'ex4mpl3m4tch1d')
+    (feed_dir / 'broken').write_text('<html>bakım</html>', encoding='utf-8')
+
+    server = payload_server(str(tmp_path), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(opta_capture, 'OPTA_FEED_PATTERNS',
+                        OPTA_FEED_PATTERNS + [f"127.0.0.1:{server.server_address[1]}/soccerdata/matchstats/"])
+    yield base + '/soccerdata/matchstats/outlet'
+    server.shutdown()
+    server.server_close()
+
+def _feed(url):
+    # _FIND_FEEDS_JS ile aynı eşleşme kuralı
+    return any(pattern in url for pattern in OPTA_FEED_PATTERNS)
+
+def test_parse_payload_maps_stats_to_csv_headers():
+    with open(FIXTURE, encoding='utf-8') as f:
+        stats = parse_payload(f.read())
+
+    # Yüzdeler DOM okumasıyla aynı biçimde yazılır
+    assert stats['Topla Oynama'] == ('58%', '42%')
+    assert stats['Toplam Şut'] == ('17', '9')
+    assert stats['İsabetli Şut'] == ('6', '3')
+    assert stats['Gol Beklentisi (xG)'] == ('1.84', '0.67')
+    assert stats['Faul'] == ('11', '14')
+    # Yanıtta olmayan istatistik sıfır kabul edilir
+    assert stats['Direkten Dönen Şut'] == ('1', '0')
+    assert stats['İkinci Sarıdan Kırmızı Kart'] == ('0', '1')
+    assert stats['Pas İsabeti %'] == ('87%', '80%')
+
+def test_parse_payload_rejects_other_feeds():
+    with pytest.raises(ValueError):
+        parse_payload('callback({"matchInfo": {}});')
+
+def test_feed_patterns_match_only_matchstats():
+    assert _feed('https://api.performfeeds.com/soccerdata/matchstats/1vmmaetzoxkgg1qf6pkpfmku0k/ex4mpl3m4tch1d'
+                 '?_rt=c&_fmt=jsonp&_clbk=W6b3e5fd1a4c&detailed=yes')
+    assert not _feed('https://secure.widget.cloud.opta.net/v3/v3.opta-widgets.js')
+    assert not _feed('https://api.performfeeds.com/soccerdata/match/1vmmaetzoxkgg1qf6pkpfmku0k/ex4mpl3m4tch1d')
+
+def test_collect_stats_from_recorded_feed(feed_server, tmp_path):
+    feed = feed_server + '/ex4mpl3m4tch1d?_rt=c&_fmt=jsonp&_clbk=W6b3e5fd1a4c&detailed=yes'
+    driver = StubDriver([
+        'https://secure.widget.cloud.opta.net/v3/v3.opta-widgets.js',
+        feed,
+        # En son yüklenen istek çözümlenemezse bir öncekine geçilir
+        feed_server + '/broken',
+    ])
+    record_dir = str(tmp_path / 'recorded')
+
+    stats = collect_stats_from_network(driver, logger, timeout=1, record_dir=record_dir, record_name='mac 1')
+
+    assert driver.fetched == [feed_server + '/broken', feed]
+    assert stats['Topla Oynama'] == ('58%', '42%')
+    assert stats['Toplam Şut'] == ('17', '9')
+    assert os.listdir(record_dir) == ['mac_1.json']
+
+def test_fetch_payload_falls_back_to_http(feed_server):
+    driver = StubDriver([], session_fetch=False)
+    text = fetch_payload(feed_server + '/ex4mpl3m4tch1d', driver)
+
+    with open(FIXTURE, encoding='utf-8') as f:
+        assert text == f.read()
+
+def test_collect_stats_without_feed_returns_empty():
+    driver = StubDriver(['https://secure.widget.cloud.opta.net/v3/v3.opta-widgets.js'])
+    assert collect_stats_from_network(driver, logger, timeout=0.3) == {}
@@ -0,0 +1,41 @@
+import json
+import logging
+import urllib.error
+import urllib.request
+
+import read_api
+from match_store import build_match_row, _write_atomic, MATCH_HEADERS
+from read_api import start_read_api
+from stats_reader import date_range, to_float
+
+logger = logging.getLogger('test')
+
+def _get(server, path):
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_shared_helpers():
+    assert to_float('55%') == 55.0
+    assert to_float('-') != to_float('-')
+    assert date_range('2023-2024', '01.01.2023', None) == ('20230701', '20240630')
+
+def test_only_routing_miss_is_404(tmp_path, monkeypatch):
+    store_file = str(tmp_path / 'matches.csv')
+    row = build_match_row('Arsenal', 'Chelsea', '12.08.2023', {'MS Gol': '2'}, {'MS Gol': '1'})
+    _write_atomic(store_file, MATCH_HEADERS, [[row[header] for header in MATCH_HEADERS]])
+    server = start_read_api(0, logger, store_file)
+    try:
+        assert _get(server, '/season?season=2023-2024')[0] == 200
+        assert _get(server, '/unknown')[0] == 404
+
+        def broken(self, **params):
+            raise KeyError('Tarih')
+        monkeypatch.setattr(read_api.ReadService, '_query_season', broken)
+        assert _get(server, '/season?season=2022-2023')[0] == 500
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,77 @@
+import os
+import logging
+
+import staging
+from staging import StagedWriter
+
+logger = logging.getLogger('test')
+
+def test_read_text_prefers_durable_file_after_flush(tmp_path):
+    writer = StagedWriter(str(tmp_path / 'volatile'), logger)
+    progress = str(tmp_path / 'progress.txt')
+
+    writer.write_text(progress, '5')
+    assert writer.read_text(progress) == '5'
+    writer.flush()
+
+    # SD kart modu dışında çalışan bir komut dosyayı değiştirir
+    staging._write_durable(progress, b'0', sync=False)
+    assert writer.read_text(progress) == '0'
+    writer.flush()
+    with open(progress, encoding='utf-8') as f:
+        assert f.read() == '0'
+
+def test_newer_durable_file_discards_stale_copy_on_start(tmp_path):
+    volatile = str(tmp_path / 'volatile')
+    progress = str(tmp_path / 'progress.txt')
+    StagedWriter(volatile, logger).write_text(progress, '5')
+    staging._write_durable(progress, b'0', sync=False)
+    # Kalıcı dosya tampondaki kopyadan yeni olsun
+    os.utime(progress, (os.path.getmtime(progress) + 10,) * 2)
+
+    writer = StagedWriter(volatile, logger)
+    assert writer.read_text(progress) == '0'
+    assert writer.pending_writes() == 0
+
+def _rows(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def test_interrupted_flush_does_not_duplicate_rows(tmp_path, monkeypatch):
+    volatile = str(tmp_path / 'volatile')
+    store = str(tmp_path / 'matches.csv')
+    with open(store, 'w', encoding='utf-8') as f:
+        f.write('Tarih,Ev Sahibi\n01.09.2023,A\n')
+
+    writer = StagedWriter(volatile, logger)
+    writer.append_rows(store, ['Tarih', 'Ev Sahibi'], [['08.09.2023', 'B'], ['15.09.2023', 'C']])
+
+    # Satırlar eklendikten sonra, günlük silinmeden önce kesinti
+    def crash(path):
+        raise SystemExit('kesinti')
+    monkeypatch.setattr(os, 'remove', crash)
+    try:
+        writer.flush()
+    except SystemExit:
+        pass
+    monkeypatch.undo()
+
+    StagedWriter(volatile, logger).flush()
+    assert _rows(store) == ['Tarih,Ev Sahibi', '01.09.2023,A', '08.09.2023,B', '15.09.2023,C']
+
+def test_partially_applied_journal_is_completed(tmp_path):
+    volatile = str(tmp_path / 'volatile')
+    store = str(tmp_path / 'matches.csv')
+    with open(store, 'w', encoding='utf-8') as f:
+        f.write('Tarih,Ev Sahibi\n01.09.2023,A\n')
+
+    writer = StagedWriter(volatile, logger)
+    writer.append_rows(store, ['Tarih', 'Ev Sahibi'], [['08.09.2023', 'B']])
+    # Önceki boşaltma başlangıç boyutunu kaydedip satırın yalnızca bir kısmını yazmış olsun
+    name = staging._key(store)
+    writer._start_offset(name, store)
+    with open(store, 'a', encoding='utf-8') as f:
+        f.write('08.09')
+
+    StagedWriter(volatile, logger).flush()
+    assert _rows(store) == ['Tarih,Ev Sahibi', '01.09.2023,A', '08.09.2023,B']
@@ -0,0 +1,39 @@
+import logging
+
+import standings
+from match_store import build_match_row, _write_atomic, MATCH_HEADERS
+from standings import LeagueTable, SAVE_EVERY, rebuild_table, save_if_due
+
+logger = logging.getLogger('test')
+
+def _match(match_date, home, away, home_goals, away_goals, league):
+    row = build_match_row(home, away, match_date, {'MS Gol': str(home_goals)}, {'MS Gol': str(away_goals)},
+                          league=league)
+    return [row[header] for header in MATCH_HEADERS]
+
+def test_rebuild_uses_only_the_league_matches(tmp_path, monkeypatch):
+    monkeypatch.setattr(standings, 'SHARED_DIR', str(tmp_path))
+    store_file = str(tmp_path / 'matches.csv')
+    _write_atomic(store_file, MATCH_HEADERS, [
+        _match('12.08.2023', 'Arsenal', 'Chelsea', 2, 1, 'premier-lig'),
+        _match('13.08.2023', 'Galatasaray', 'Fenerbahçe', 0, 0, 'super-lig'),
+    ])
+
+    table = rebuild_table('premier-lig', '2023-2024', logger, store_file)
+
+    assert set(table.teams) == {'Arsenal', 'Chelsea'}
+    assert table.standings()[0]['Takım'] == 'Arsenal'
+
+def test_table_is_saved_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(standings, 'SHARED_DIR', str(tmp_path))
+    table = LeagueTable('premier-lig', '2023-2024')
+    table_file = tmp_path / 'standings' / 'premier-lig_2023-2024.json'
+
+    for day in range(1, SAVE_EVERY):
+        table.apply('Arsenal', f"Rakip {day}", f"{day:02d}.09.2023", 1, 0)
+        save_if_due(table, logger)
+    assert not table_file.exists()
+
+    table.apply('Arsenal', 'Chelsea', '30.09.2023', 1, 0)
+    save_if_due(table, logger)
+    assert table_file.exists() and table.unsaved == 0
@@ -0,0 +1,97 @@
+import os
+import logging
+
+import pytest
+
+from match_store import build_match_row, materialize_team_views, _write_atomic, MATCH_HEADERS, STORE_FILE
+from stats_reader import iter_matches
+
+logger = logging.getLogger('test')
+
+MATCHES = [
+    ('20.05.2023', 'Arsenal', 'Chelsea', 1, 1),
+    ('12.08.2023', 'Arsenal', 'Chelsea', 2, 1),
+    ('19.08.2023', 'Chelsea', 'Liverpool', 0, 3),
+    ('26.08.2023', 'Liverpool', 'Arsenal', 2, 2),
+]
+
+def _rows(matches):
+    rows = []
+    for match_date, home, away, home_goals, away_goals in matches:
+        row = build_match_row(home, away, match_date,
+                              {'MS Gol': str(home_goals), 'Topla Oynama': '55%', 'Toplam Şut': '12'},
+                              {'MS Gol': str(away_goals), 'Topla Oynama': '45%', 'Toplam Şut': '7'})
+        rows.append([row[header] for header in MATCH_HEADERS])
+    return rows
+
+def _write_store(path, matches):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_atomic(path, MATCH_HEADERS, _rows(matches))
+
+@pytest.fixture
+def stats_dir(tmp_path):
+    """Maç deposu ve ondan türetilen takım dosyaları"""
+    store_file = str(tmp_path / 'matches' / STORE_FILE)
+    _write_store(store_file, MATCHES)
+    assert materialize_team_views(logger, stats_dir=str(tmp_path), store_file=store_file)
+    return str(tmp_path)
+
+def _key(row):
+    return tuple(sorted(row.items()))
+
+def test_backends_return_the_same_rows(stats_dir):
+    for filters in ({}, {'season': '2023-2024'}, {'teams': ['Arsenal'], 'venue': 'away'}):
+        from_store = sorted(map(_key, iter_matches(backend='matches', stats_dir=stats_dir, **filters)))
+        from_teams = sorted(map(_key, iter_matches(backend='teams', stats_dir=stats_dir, **filters)))
+        assert from_store and from_store == from_teams
+
+def test_column_projection(stats_dir):
+    rows = list(iter_matches(teams='Chelsea', columns=['Tarih', 'Sonuç', 'Takım'], backend='matches',
+                             stats_dir=stats_dir))
+
+    assert rows == [
+        {'Tarih': '20.05.2023', 'Sonuç': 'Berabere', 'Takım': 'Chelsea'},
+        {'Tarih': '12.08.2023', 'Sonuç': 'Mağlup', 'Takım': 'Chelsea'},
+        {'Tarih': '19.08.2023', 'Sonuç': 'Mağlup', 'Takım': 'Chelsea'},
+    ]
+
+@pytest.mark.parametrize('backend', ['matches', 'teams'])
+def test_unknown_column_raises(stats_dir, backend):
+    with pytest.raises(KeyError):
+        list(iter_matches(columns=['Tarih', 'Yok'], backend=backend, stats_dir=stats_dir))
+
+def test_invalid_venue_raises(stats_dir):
+    with pytest.raises(ValueError):
+        list(iter_matches(venue='neutral', stats_dir=stats_dir))
+
+@pytest.mark.parametrize('backend', ['matches', 'teams'])
+def test_filters(stats_dir, backend):
+    def dates(**filters):
+        return sorted((row['Tarih'], row['Takım'])
+                      for row in iter_matches(columns=['Tarih', 'Takım'], backend=backend,
+                                              stats_dir=stats_dir, **filters))
+
+    # Sezon aralığı 01.07-30.06 arasıdır
+    assert dates(teams='Arsenal', season='2022-2023') == [('20.05.2023', 'Arsenal')]
+    assert dates(teams='Arsenal', season='2023-2024') == [('12.08.2023', 'Arsenal'), ('26.08.2023', 'Arsenal')]
+    # Sınırlar dahildir; sezon tarih aralığını daraltır
+    assert dates(date_from='19.08.2023', date_to='26.08.2023', season='2023-2024') == [
+        ('19.08.2023', 'Chelsea'), ('19.08.2023', 'Liverpool'),
+        ('26.08.2023', 'Arsenal'), ('26.08.2023', 'Liverpool'),
+    ]
+    assert dates(opponent='Liverpool') == [('19.08.2023', 'Chelsea'), ('26.08.2023', 'Arsenal')]
+    assert dates(opponent=['Liverpool', 'Arsenal'], venue='home') == [
+        ('19.08.2023', 'Chelsea'), ('26.08.2023', 'Liverpool'),
+    ]
+
+def test_shards_are_deduplicated(tmp_path):
+    shard_root = tmp_path / 'shards'
+    _write_store(str(shard_root / 'pi-1' / STORE_FILE), MATCHES[:3])
+    _write_store(str(shard_root / 'pi-2' / STORE_FILE), MATCHES[1:])
+
+    rows = list(iter_matches(venue='home', columns=['Tarih', 'Takım', 'Rakip'], backend='shards',
+                             stats_dir=str(tmp_path)))
+
+    assert len(rows) == len(MATCHES)
+    assert {(row['Tarih'], row['Takım'], row['Rakip']) for row in rows} == \
+        {(match_date, home, away) for match_date, home, away, _, _ in MATCHES}
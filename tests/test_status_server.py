@@ -0,0 +1,72 @@
+import json
+import logging
+import urllib.error
+import urllib.request
+
+import pytest
+
+import status_server
+from status_server import ScraperStatus, start_status_server
+
+logger = logging.getLogger('test')
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(10000.0)
+    monkeypatch.setattr(status_server.time, 'time', clock)
+    return clock
+
+def test_rates_use_sliding_windows(clock):
+    status = ScraperStatus()
+    for seconds_ago in (1000, 400, 200, 50, 30):
+        clock.now = 12000.0 - seconds_ago
+        status.match_completed()
+    clock.now = 12000.0
+
+    snapshot = status.snapshot()
+
+    assert snapshot['completed'] == 5
+    # 15 dakikadan eski tamamlanma hiçbir pencereye girmez
+    assert snapshot['matches_per_minute'] == {'1m': 2.0, '5m': 0.6, '15m': 0.27}
+    assert len(status._completions) == 4
+
+def test_driver_restarts_and_age(clock):
+    status = ScraperStatus()
+    snapshot = status.snapshot()
+    assert snapshot['driver_restarts'] == 0 and snapshot['driver_age_seconds'] is None
+
+    for _ in range(3):
+        status.driver_started()
+        clock.now += 60
+    status.retry()
+
+    snapshot = status.snapshot()
+    assert snapshot['driver_restarts'] == 2
+    assert snapshot['driver_age_seconds'] == 60
+    assert snapshot['retries'] == 1
+    assert snapshot['uptime_seconds'] == 180
+
+def test_status_endpoint():
+    status = ScraperStatus()
+    status.set_season('premier-lig', '2023-2024', 380)
+    status.set_queue('pending_matches', 12)
+    server = start_status_server(0, logger, status)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(base + '/status') as response:
+            snapshot = json.loads(response.read())
+        assert snapshot['season'] == '2023-2024' and snapshot['total_matches'] == 380
+        assert snapshot['queues'] == {'pending_matches': 12}
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(base + '/other')
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
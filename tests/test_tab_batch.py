@@ -0,0 +1,164 @@
+import os
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('selenium')
+pytest.importorskip('fake_useragent')
+
+import scraper
+from work_claim import WorkClaimer, match_unit
+
+logger = logging.getLogger('test')
+
+URLS = [f"https://example.test/mac/{n}" for n in range(6)]
+
+class FakeDriver:
+    """Sekmeleri bellekte tutan sahte tarayıcı; alive=False iken her çağrı hata verir"""
+
+    def __init__(self):
+        self.alive = True
+        self.current_window_handle = 'main'
+        self.tabs = {'main': None}
+        self.switch_to = SimpleNamespace(window=self._switch)
+
+    def _check(self):
+        if not self.alive:
+            raise RuntimeError("Tarayıcı oturumu kapandı")
+
+    def _switch(self, handle):
+        self._check()
+        self.current_window_handle = handle
+
+    @property
+    def window_handles(self):
+        self._check()
+        return list(self.tabs)
+
+    def open(self, url):
+        handle = f"tab-{len(self.tabs)}-{url}"
+        self.tabs[handle] = url
+        return handle
+
+    def close(self):
+        self._check()
+        del self.tabs[self.current_window_handle]
+
+    def delete_all_cookies(self):
+        self._check()
+
+    def quit(self):
+        self.alive = False
+
+class FakeSite:
+    """Maç sayfalarını taklit eder; failures[url] kez finish_match hata verir"""
+
+    def __init__(self, failures=None, crash=None, restart_error=None):
+        self.failures = dict(failures or {})
+        self.crash = crash
+        self.restart_error = restart_error
+        self.finished = []
+        self.drivers = []
+
+    def open_match_tab(self, driver, url, main_window):
+        driver._switch(main_window)
+        return driver.open(url)
+
+    def prepare_match(self, driver, logger):
+        driver._check()
+        return {'url': driver.tabs[driver.current_window_handle], 'match_date': '01.09.2023'}
+
+    def finish_match(self, driver, logger, match, stats_dir=None, table=None):
+        url = match['url']
+        if url == self.crash:
+            # Tarayıcı bu maçta bir kez çöker
+            self.crash = None
+            driver.alive = False
+            raise RuntimeError("Tarayıcı yanıt vermiyor")
+        if self.failures.get(url, 0) > 0:
+            self.failures[url] -= 1
+            raise RuntimeError("İstatistik tablosu yüklenmedi")
+        self.finished.append(url)
+
+    def restart_driver(self, driver, logger):
+        if self.restart_error:
+            raise self.restart_error
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+@pytest.fixture
+def site(monkeypatch):
+    site = FakeSite()
+    monkeypatch.setattr(scraper, 'get_random_delay', lambda: 0)
+    for name in ('open_match_tab', 'prepare_match', 'finish_match', 'restart_driver'):
+        monkeypatch.setattr(scraper, name, lambda *args, _name=name, **kwargs: getattr(site, _name)(*args, **kwargs))
+    return site
+
+def _run(site, claimer, batch=range(6), tab_count=3):
+    results = []
+
+    def on_done(i, match_date, completed):
+        # click_match_elements'taki match_done gibi
+        results.append((i, completed))
+        if completed:
+            claimer.complete(match_unit(i))
+        else:
+            claimer.fail(match_unit(i), "Maksimum deneme sayısına ulaşıldı")
+
+    driver, claimed = scraper.process_batch_in_tabs(FakeDriver(), logger, batch, URLS, tab_count, on_done, claimer)
+    return driver, claimed, results
+
+def _leases(claimer):
+    return [name for name in os.listdir(claimer.lease_dir) if name.endswith('.lease')]
+
+def test_failed_tab_is_requeued(site, tmp_path):
+    site.failures = {URLS[1]: 2}
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+
+    _, claimed, results = _run(site, claimer)
+
+    assert claimed == 6
+    assert sorted(results) == [(i, True) for i in range(6)]
+    # Başarısız maç kuyruğa geri konur, iki hatadan sonra bir kez tamamlanır
+    assert site.failures[URLS[1]] == 0
+    assert site.finished.count(URLS[1]) == 1
+    assert claimer.all_done([match_unit(i) for i in range(6)])
+    assert _leases(claimer) == []
+
+def test_exhausted_tab_is_marked_failed_and_released(site, tmp_path):
+    site.failures = {URLS[2]: 99}
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+
+    _, _, results = _run(site, claimer)
+
+    assert (2, False) in results and results.count((2, False)) == 1
+    assert claimer.is_failed(match_unit(2))
+    assert claimer.failed_units([match_unit(i) for i in range(6)]) == [match_unit(2)]
+    assert _leases(claimer) == []
+
+def test_crashed_browser_is_restarted_and_tabs_requeued(site, tmp_path):
+    site.crash = URLS[1]
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+
+    driver, _, results = _run(site, claimer)
+
+    assert driver is site.drivers[-1] and len(site.drivers) == 1
+    assert sorted(results) == [(i, True) for i in range(6)]
+    assert sorted(site.finished) == sorted(URLS)
+    assert _leases(claimer) == []
+
+def test_leases_are_released_when_batch_aborts(site, tmp_path):
+    site.crash = URLS[1]
+    site.restart_error = RuntimeError("Firefox başlatılamadı")
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        _run(site, claimer)
+
+    # İşlenmeyen maçlar başka düğüm tarafından hemen alınabilir
+    other = WorkClaimer('premier-lig/2023-2024', node_id='b', base_dir=str(tmp_path))
+    assert _leases(claimer) == []
+    assert claimer.is_done(match_unit(0))
+    assert all(other.claim(match_unit(i)) for i in (1, 2))
@@ -0,0 +1,21 @@
+import json
+import os
+
+import tracing
+
+def test_restart_with_same_pid_keeps_previous_trace(tmp_path):
+    path = str(tmp_path / 'oturum-{pid}.json')
+    first = tracing.enable_tracing(path)
+    with tracing.span('match', index=0):
+        pass
+    tracing.disable_tracing()
+
+    # execv sonrası aynı PID ile yeni oturum
+    second = tracing.enable_tracing(path)
+    tracing.disable_tracing()
+
+    assert first.path != second.path
+    assert second.path == str(tmp_path / f"oturum-{os.getpid()}.1.json")
+    with open(first.path, encoding='utf-8') as f:
+        events = json.load(f)
+    assert any(event['name'] == 'match' for event in events)
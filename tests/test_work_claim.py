@@ -0,0 +1,79 @@
+import os
+import time
+import multiprocessing
+
+from work_claim import WorkClaimer, match_unit
+
+def test_failed_unit_is_terminal(tmp_path):
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+    other = WorkClaimer('premier-lig/2023-2024', node_id='b', base_dir=str(tmp_path))
+    units = [match_unit(0), match_unit(1)]
+
+    assert claimer.claim(units[0])
+    claimer.complete(units[0])
+    assert claimer.claim(units[1])
+    claimer.fail(units[1], 'zaman aşımı')
+
+    # Başarısız birim sezonu bitirir ama başka düğüm tarafından yeniden alınmaz
+    assert other.all_done(units)
+    assert not other.claim(units[1])
+    assert other.failed_units(units) == [units[1]]
+
+def test_unfinished_unit_blocks_all_done(tmp_path):
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', base_dir=str(tmp_path))
+    units = [match_unit(0), match_unit(1)]
+
+    assert claimer.claim(units[0])
+    claimer.release(units[0])
+    assert not claimer.all_done(units)
+    assert claimer.claim(units[0])
+
+def test_expired_lease_is_taken_over(tmp_path):
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='a', ttl=60, base_dir=str(tmp_path))
+    other = WorkClaimer('premier-lig/2023-2024', node_id='b', ttl=60, base_dir=str(tmp_path))
+    unit = match_unit(0)
+
+    assert claimer.claim(unit)
+    assert not other.claim(unit)
+
+    # Kira yenilenmeden süresi dolmuş gibi eskitilir
+    lease = os.path.join(claimer.lease_dir, f"{unit}.lease")
+    old = time.time() - 120
+    os.utime(lease, (old, old))
+
+    assert other.claim(unit)
+    assert not claimer.renew(unit)
+    claimer.release(unit)
+    assert os.path.exists(lease)
+    assert not claimer.claim(unit)
+
+def _race_worker(base_dir, node_id, units, start):
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id=node_id, base_dir=base_dir)
+    start.wait()
+    for unit in units:
+        if claimer.claim(unit):
+            # Her işleme, birim başına ortak kayıt dosyasına bir satır ekler
+            with open(os.path.join(base_dir, f"{unit}.log"), 'a', encoding='utf-8') as f:
+                f.write(f"{node_id}\n")
+            claimer.complete(unit)
+
+def test_processes_claim_each_unit_once(tmp_path):
+    context = multiprocessing.get_context('fork')
+    base_dir = str(tmp_path)
+    units = [match_unit(i) for i in range(40)]
+    start = context.Event()
+    workers = [context.Process(target=_race_worker, args=(base_dir, f"node-{n}", units, start))
+               for n in range(6)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    claimer = WorkClaimer('premier-lig/2023-2024', node_id='check', base_dir=base_dir)
+    assert claimer.all_done(units)
+    for unit in units:
+        with open(os.path.join(base_dir, f"{unit}.log"), encoding='utf-8') as f:
+            assert len(f.read().splitlines()) == 1
+        assert not os.path.exists(os.path.join(claimer.lease_dir, f"{unit}.lease"))
@@ -0,0 +1,144 @@
+"""
+tracing.py - Chrome trace-event biçiminde zaman çizelgesi kaydı
+
+İsteğe bağlıdır: enable_tracing() çağrılmadıkça span() sabit bir boş bağlam
+yöneticisi döndürür, ek maliyet tek bir global kontrolden ibarettir.
+Olaylar dosyaya akış halinde yazılır (JSON Array biçimi); oturum yarıda
+kesilse bile dosya Perfetto veya about:tracing ile açılabilir.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+
+_tracer = None
+
+class _NullSpan:
+    """İzleme kapalıyken kullanılan boş bağlam yöneticisi"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """Tamamlandığında tek bir 'X' (complete) olayı yazan zaman aralığı"""
+
+    __slots__ = ('tracer', 'name', 'args', 'started')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ended = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.emit({
+            'name': self.name,
+            'ph': 'X',
+            'ts': self.tracer.to_us(self.started),
+            'dur': round((ended - self.started) * 1e6, 1),
+            'args': self.args,
+        })
+        return False
+
+class Tracer:
+    """Olayları iş parçacığı güvenli şekilde trace dosyasına yazar"""
+
+    def __init__(self, path, process_name=None):
+        self.path = path
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._named_threads = set()
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('[\n')
+        self._write({'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                     'args': {'name': process_name or f"scraper-{self.pid}"}})
+
+    def to_us(self, perf_time):
+        """perf_counter değerini oturum başlangıcına göre mikrosaniyeye çevirir"""
+        return round((perf_time - self._origin) * 1e6, 1)
+
+    def _write(self, event):
+        self._file.write(json.dumps(event, ensure_ascii=False) + ',\n')
+
+    def emit(self, event):
+        """Olayı çağıran iş parçacığının kimliğiyle yazar"""
+        thread = threading.current_thread()
+        event['pid'] = self.pid
+        event['tid'] = thread.ident
+        with self._lock:
+            if thread.ident not in self._named_threads:
+                self._named_threads.add(thread.ident)
+                self._write({'name': 'thread_name', 'ph': 'M', 'pid': self.pid,
+                             'tid': thread.ident, 'args': {'name': thread.name}})
+            self._write(event)
+
+    def close(self):
+        """Diziyi kapatıp dosyayı diske yazar"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(json.dumps({'name': 'trace_end', 'ph': 'i', 's': 'g', 'pid': self.pid, 'tid': 0,
+                                         'ts': self.to_us(time.perf_counter())}) + '\n]\n')
+            self._file.close()
+
+def _unused_path(path):
+    """Var olan dosyanın üzerine yazmamak için ilk boş sıra numaralı yolu döndürür"""
+    base, extension = os.path.splitext(path)
+    sequence = 0
+    while os.path.exists(path):
+        sequence += 1
+        path = f"{base}.{sequence}{extension}"
+    return path
+
+def enable_tracing(path, process_name=None):
+    """İzlemeyi başlatır; dosya program sonunda kapatılır
+
+    Yoldaki '{pid}' işlem kimliğiyle değiştirilir (aynı makinedeki çoklu işlemler için).
+    Dosya zaten varsa (ör. aynı PID ile yeniden başlatılan uygulama) üzerine
+    yazılmaz, adına sıra numarası eklenir: oturum-123.json -> oturum-123.1.json
+    """
+    global _tracer
+    if _tracer is None:
+        path = _unused_path(path.replace('{pid}', str(os.getpid())))
+        _tracer = Tracer(path, process_name)
+        atexit.register(_tracer.close)
+    return _tracer
+
+def disable_tracing():
+    """İzlemeyi durdurur ve dosyayı kapatır"""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
+
+def span(name, **args):
+    """Bir aşamanın başlangıç/bitişini kaydeden bağlam yöneticisi"""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+def begin(name, **args):
+    """Girintiye bağlı olmayan uzun aşamalar için başlangıç ('B') olayı yazar"""
+    if _tracer is None:
+        return
+    _tracer.emit({'name': name, 'ph': 'B', 'ts': _tracer.to_us(time.perf_counter()), 'args': args})
+
+def end(name, **args):
+    """begin() ile açılan aşamayı kapatır ('E')"""
+    if _tracer is None:
+        return
+    _tracer.emit({'name': name, 'ph': 'E', 'ts': _tracer.to_us(time.perf_counter()), 'args': args})
@@ -0,0 +1,166 @@
+"""
+work_claim.py - Çoklu düğüm için kira (lease) dosyası tabanlı iş paylaşımı
+
+Koordinatör gerektirmez: aynı makinedeki ya da ortak bir dizini paylaşan
+birden fazla düğümdeki işlemler, iş birimlerini (maç veya sezon) atomik
+olarak oluşturulan kira dosyalarıyla talep eder. Süresi dolan kiralar başka
+bir düğüm tarafından devralınabilir. Nadir yarış durumlarında aynı birim iki
+kez işlenebilir; birleştirme adımı tekrar eden satırları ayıkladığı için bu
+zararsızdır (en az bir kez işleme garantisi).
+"""
+
+import os
+import json
+import time
+import socket
+
+from config import SHARED_DIR, LEASE_TTL
+
+def get_node_id():
+    """Bu işlem için benzersiz düğüm kimliğini döndürür"""
+    node_id = os.environ.get('SCRAPER_NODE_ID')
+    if node_id:
+        return node_id
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+def match_unit(index):
+    """Maç indeksinden iş birimi adı üretir"""
+    return f"match_{index:04d}"
+
+def season_unit(season):
+    """Sezon adından ('2023-2024') iş birimi adı üretir"""
+    return f"season_{season}"
+
+class WorkClaimer:
+    """İş birimlerini kira dosyalarıyla talep eder, yeniler ve tamamlar"""
+
+    def __init__(self, scope, node_id=None, ttl=LEASE_TTL, base_dir=None):
+        self.node_id = node_id or get_node_id()
+        self.ttl = ttl
+        self.lease_dir = os.path.join(base_dir or SHARED_DIR, 'leases', scope)
+        os.makedirs(self.lease_dir, exist_ok=True)
+
+    def _lease_path(self, unit):
+        return os.path.join(self.lease_dir, f"{unit}.lease")
+
+    def _done_path(self, unit):
+        return os.path.join(self.lease_dir, f"{unit}.done")
+
+    def _failed_path(self, unit):
+        return os.path.join(self.lease_dir, f"{unit}.failed")
+
+    def _is_expired(self, path):
+        """Kira dosyasının süresinin dolup dolmadığını kontrol eder"""
+        try:
+            return time.time() - os.stat(path).st_mtime > self.ttl
+        except FileNotFoundError:
+            return True
+
+    def _owner(self, path):
+        """Kira dosyasının sahibi olan düğümü okur"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('node')
+        except (OSError, ValueError):
+            return None
+
+    def _create_lease(self, unit):
+        """Kira dosyasını atomik olarak oluşturur (O_EXCL), başarılıysa True döner"""
+        try:
+            fd = os.open(self._lease_path(unit), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'node': self.node_id, 'claimed_at': time.time()}, f)
+        # Kira alınırken birim başka düğüm tarafından tamamlanmış olabilir
+        if self.is_finished(unit):
+            os.remove(self._lease_path(unit))
+            return False
+        return True
+
+    def is_done(self, unit):
+        """Birimin tamamlanıp tamamlanmadığını döndürür"""
+        return os.path.exists(self._done_path(unit))
+
+    def is_failed(self, unit):
+        """Birimin deneme sınırına ulaşıp başarısız işaretlenip işaretlenmediğini döndürür"""
+        return os.path.exists(self._failed_path(unit))
+
+    def is_finished(self, unit):
+        """Birim tamamlandı veya başarısız işaretlendiyse True (yeniden talep edilmez)"""
+        return self.is_done(unit) or self.is_failed(unit)
+
+    def claim(self, unit):
+        """Birimi talep eder; bu düğüm işleyecekse True döner"""
+        if self.is_finished(unit):
+            return False
+        if self._create_lease(unit):
+            return True
+
+        lease = self._lease_path(unit)
+        if self._owner(lease) == self.node_id:
+            self.renew(unit)
+            return True
+        if not self._is_expired(lease):
+            return False
+
+        # Süresi dolmuş kirayı devral: yalnızca bir düğüm yeniden adlandırmayı başarır
+        stale = f"{lease}.{self.node_id}.stale"
+        try:
+            os.rename(lease, stale)
+        except FileNotFoundError:
+            return False
+        if not self._is_expired(stale):
+            # Arada başka düğüm taze bir kira almış; geri koy
+            try:
+                os.link(stale, lease)
+            except FileExistsError:
+                pass
+            os.remove(stale)
+            return False
+        os.remove(stale)
+        return self._create_lease(unit)
+
+    def renew(self, unit):
+        """Uzun süren işlerde kiranın süresini uzatır"""
+        lease = self._lease_path(unit)
+        if self._owner(lease) != self.node_id:
+            return False
+        try:
+            os.utime(lease, None)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def release(self, unit):
+        """Birimi tamamlamadan bırakır; başka düğüm hemen talep edebilir"""
+        lease = self._lease_path(unit)
+        if self._owner(lease) == self.node_id:
+            try:
+                os.remove(lease)
+            except FileNotFoundError:
+                pass
+
+    def complete(self, unit):
+        """Birimi tamamlandı olarak işaretler ve kirayı bırakır"""
+        with open(self._done_path(unit), 'w', encoding='utf-8') as f:
+            json.dump({'node': self.node_id, 'done_at': time.time()}, f)
+        self.release(unit)
+
+    def fail(self, unit, reason=None):
+        """Birimi başarısız olarak işaretler ve kirayı bırakır
+
+        Deneme sınırına ulaşan birim sezonun bitmesini engellemez; işaret
+        dosyası silinerek birim yeniden denenebilir.
+        """
+        with open(self._failed_path(unit), 'w', encoding='utf-8') as f:
+            json.dump({'node': self.node_id, 'failed_at': time.time(), 'reason': reason}, f)
+        self.release(unit)
+
+    def failed_units(self, units):
+        """Verilen birimlerden başarısız işaretlenenleri döndürür"""
+        return [unit for unit in units if self.is_failed(unit)]
+
+    def all_done(self, units):
+        """Verilen tüm birimler tamamlandıysa veya başarısız işaretlendiyse True döner"""
+        return all(self.is_finished(unit) for unit in units)